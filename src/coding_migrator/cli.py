@@ -10,19 +10,34 @@ import click
 import logging
 import psutil
 import signal
+import queue
+import atexit
 from pathlib import Path
 from typing import Optional, List
 
 from .config import ConfigManager
 from .migrator import MavenMigrator
-from .memory_pipeline_migrator import MemoryPipelineMigrator
+
+
+# 文件日志后台写入监听器
+_log_listener = None
+
+
+def _stop_log_listener():
+    """停止文件日志监听器，写完队列中剩余的日志"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 def setup_logging(verbose: bool = False, log_file: str = None, max_size_mb: int = 10, backup_count: int = 5):
     """设置日志配置"""
+    global _log_listener
     level = logging.DEBUG if verbose else logging.INFO
 
     # 清除现有的处理器
+    _stop_log_listener()
     logger = logging.getLogger()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
@@ -44,7 +59,7 @@ def setup_logging(verbose: bool = False, log_file: str = None, max_size_mb: int
 
     # 文件处理器（带轮转）
     if log_file:
-        from logging.handlers import RotatingFileHandler
+        from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
         # 确保日志目录存在
         log_path = Path(log_file)
@@ -58,7 +73,13 @@ def setup_logging(verbose: bool = False, log_file: str = None, max_size_mb: int
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # 文件写入交给后台监听线程，避免下载/上传线程阻塞在日志文件锁上
+        log_queue = queue.Queue(-1)
+        _log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_stop_log_listener)
+        logger.addHandler(QueueHandler(log_queue))
 
         logger.info(f"日志文件: {log_path} (最大 {max_size_mb}MB, 保留 {backup_count} 个备份)")
 
@@ -208,6 +229,7 @@ def migrate(ctx, projects, components, standard_mode, cleanup, dry_run, keep_rec
 
         if standard_mode:
             click.echo("[INFO] 使用标准模式（下载到本地）")
+            config.prefer_disk_staging = True
             migrator = MavenMigrator(config)
 
             if projects:
@@ -229,6 +251,7 @@ def migrate(ctx, projects, components, standard_mode, cleanup, dry_run, keep_rec
                 _display_result(result)
         else:
             click.echo("[INFO] 使用内存流水线模式（零磁盘占用）")
+            from .memory_pipeline_migrator import MemoryPipelineMigrator
             migrator = MemoryPipelineMigrator(config)
 
             # 确定要迁移的项目列表
@@ -299,13 +322,17 @@ def migrate(ctx, projects, components, standard_mode, cleanup, dry_run, keep_rec
 
 
 @cli.command()
+@click.option('--standard-mode', is_flag=True,
+              help='使用标准模式（下载到本地再上传），默认使用内存流水线模式')
 @click.option('--cleanup', is_flag=True, help='迁移完成后清理下载文件')
 @click.pass_context
-def migrate_all(ctx, cleanup):
+def migrate_all(ctx, standard_mode, cleanup):
     """迁移所有配置的项目"""
     try:
         config_manager = ConfigManager(ctx.obj['config_file'])
         config = config_manager.load_config_with_env()
+        if standard_mode:
+            config.prefer_disk_staging = True
 
         migrator = MavenMigrator(config)
         result = migrator.migrate_all(cleanup=cleanup)
@@ -326,6 +353,7 @@ def migrate_memory_pipeline(ctx, project_name, cleanup):
         config_manager = ConfigManager(ctx.obj['config_file'])
         config = config_manager.load_config_with_env()
 
+        from .memory_pipeline_migrator import MemoryPipelineMigrator
         migrator = MemoryPipelineMigrator(config)
         result = migrator.migrate_project(project_name, project_name)
         _display_result(result)
@@ -7,20 +7,140 @@ import logging
 import time
 import random
 import os
+import shutil
+import socket
 import threading
+import itertools
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin
+from typing import List, Optional, Dict, Any, Tuple, Set, Iterator
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+try:
+    import httpx
+except ImportError:  # httpx 为可选依赖，仅在启用 HTTP/2 下载时需要
+    httpx = None
 from .models import CodingProject, DescribeProjectsResponse, ApiResponse, MavenArtifact, MavenFilterConfig, PaginationConfig
 
 
 logger = logging.getLogger(__name__)
 
+# 可重试的 API 错误码
+_TRANSIENT_CODES = frozenset({'RequestLimitExceeded', 'InternalError'})
+
+# CODING 仓库类型标识到类型名称的映射
+_REPO_TYPE_NAMES = {3: 'maven', 'maven': 'maven'}
+
+# 文件扩展名到打包类型的映射
+_PACKAGING_BY_EXT = {'jar': 'jar', 'pom': 'pom'}
+
+# 下载写盘缓冲区大小（1 MiB）
+_DOWNLOAD_BUFFER_SIZE = 1 << 20
+# 不超过该大小（字节）的响应一次性读取写入
+_SMALL_FILE_THRESHOLD = 64 * 1024
+# 超过该大小（字节）的文件在写入前预分配磁盘空间
+_PREALLOCATE_THRESHOLD = 1 << 20
+# 不少于该大小（字节）的文件在写完后可以丢弃页缓存
+_DROP_CACHE_THRESHOLD = 64 << 20
+
+# 下载过程中视为失败（而非程序错误）的异常类型
+_DOWNLOAD_ERRORS = (requests.exceptions.RequestException, Urllib3HTTPError) + ((httpx.HTTPError,) if httpx else ())
+
+# 下载会话的最长复用时间（秒），超过后重建，避免复用被 NAT/负载均衡静默断开的空闲连接
+_CONNECTION_TTL = 240
+# 每个下载线程会话的连接池大小
+_THREAD_POOL_SIZE = 4
+
+# TCP keepalive 选项：空闲 60 秒后每 30 秒探测一次（平台不支持的选项自动跳过）
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 30))
+    if hasattr(socket, name)
+]
+
+
+def _preallocate(f, size: int) -> bool:
+    """
+    按 Content-Length 为大文件预分配磁盘空间，减少边写边扩展带来的碎片
+
+    仅对超过 _PREALLOCATE_THRESHOLD 的文件在支持 posix_fallocate 的平台上生效，
+    文件系统不支持时静默忽略。
+
+    Args:
+        f: 刚打开的二进制文件对象
+        size: 预期文件大小（字节）
+
+    Returns:
+        是否完成了预分配
+    """
+    if size <= _PREALLOCATE_THRESHOLD or not hasattr(os, 'posix_fallocate'):
+        return False
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+        return True
+    except OSError:
+        return False
+
+
+def _drop_page_cache(f) -> None:
+    """
+    提示内核丢弃大文件已写入的页缓存，避免一次下载大量大文件时挤出其他缓存
+
+    内核只会丢弃干净页，因此先 fdatasync 把数据落盘再发出提示。只应用于写入后
+    不会马上再读取的文件：先下载到磁盘再上传时文件随即会被重新读取，丢弃缓存反而
+    会多一次磁盘读取。仅对不小于 _DROP_CACHE_THRESHOLD 的文件、在支持
+    posix_fadvise 的平台上生效，失败时静默忽略。
+
+    Args:
+        f: 已写入数据的二进制文件对象
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        f.flush()
+        if os.fstat(f.fileno()).st_size < _DROP_CACHE_THRESHOLD:
+            return
+        os.fdatasync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """为连接开启 TCP keepalive 的 HTTP 适配器"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + _KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _split_maven_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    从 Maven 仓库下载 URL 中提取项目名称和仓库名称
+
+    URL 格式: https://domain.pkg.coding.net/repository/project-name/repo-name/...
+
+    Args:
+        url: 下载 URL
+
+    Returns:
+        (项目名称, 仓库名称) 或 None
+    """
+    parts = urlsplit(url).path.split('/', 4)
+    if len(parts) == 5 and parts[1] == 'repository' and parts[2] and parts[3]:
+        return parts[2], parts[3]
+    return None
+
 
 class CodingClient:
     """CODING API 客户端"""
 
-    def __init__(self, token: str, team_id: int, maven_repositories: Optional[Dict[str, Any]] = None, pagination_config: Optional[PaginationConfig] = None, max_workers: int = 8, requests_per_second: int = 20):
+    def __init__(self, token: str, team_id: int, maven_repositories: Optional[Dict[str, Any]] = None, pagination_config: Optional[PaginationConfig] = None, max_workers: int = 8, requests_per_second: int = 20, http2: bool = False,
+                 pool_maxsize: int = 20, pool_block: bool = False):
         """
         初始化 CODING 客户端
 
@@ -31,6 +151,9 @@ class CodingClient:
             pagination_config: 分页配置
             max_workers: 最大并发线程数
             requests_per_second: 每秒请求数限制
+            http2: 是否使用 HTTP/2 下载制品（需要安装 httpx[http2]）
+            pool_maxsize: API 会话连接池大小（不小于 max_workers）
+            pool_block: 连接池耗尽时是否阻塞等待空闲连接
         """
         self.token = token
         self.team_id = team_id
@@ -39,6 +162,17 @@ class CodingClient:
         self.max_workers = max_workers
         self.base_url = "https://e.coding.net/open-api/"
 
+        # Maven 仓库下载认证缓存: (url_project, url_repo, project_id, repository_name) -> auth
+        self._auth_cache: Dict[Tuple[Optional[str], Optional[str], Any, str], Optional[Tuple[str, str]]] = {}
+
+        # 项目缓存: 项目 ID -> 项目名称，项目名称 -> 项目
+        self._project_name_cache: Dict[int, str] = {}
+        self._projects_by_name: Dict[str, CodingProject] = {}
+
+        # 下载时已创建的输出目录
+        self._created_dirs: Set[str] = set()
+        self._created_dirs_lock = threading.Lock()
+
         # 速率限制配置 (默认20 req/s，比CODING限制的30 req/s更保守)
         self.requests_per_second = requests_per_second
         self.rate_limiter = threading.Semaphore(requests_per_second)
@@ -51,15 +185,16 @@ class CodingClient:
 
         logger.info(f"CodingClient initialized with rate limit: {requests_per_second} req/s")
 
-        # 创建会话，配置连接池
+        # 创建会话，配置连接池（按并发线程数确定大小，保证下载线程都能复用长连接）
         self.session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=20,
-            pool_maxsize=20,
-            max_retries=3
-        )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
+        pool_size = max(max_workers, pool_maxsize)
+        self._pool_size = 0
+        self._pool_block = pool_block
+        self._pool_lock = threading.Lock()
+        self.ensure_pool_size(pool_size)
+
+        # 每个下载线程独立的会话
+        self._thread_local = threading.local()
 
         self.session.headers.update({
             'Authorization': f'Bearer {token}',
@@ -68,6 +203,78 @@ class CodingClient:
             'Connection': 'keep-alive'
         })
 
+        # 可选的 HTTP/2 下载客户端，同一连接上多路复用大量并发下载
+        self._http2_client = None
+        if http2:
+            if httpx is None:
+                logger.warning("HTTP/2 requested but httpx is not installed, falling back to HTTP/1.1")
+            else:
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                    timeout=30
+                )
+                logger.info("HTTP/2 download client enabled")
+
+    def ensure_pool_size(self, pool_size: int) -> None:
+        """
+        确保会话连接池至少能容纳指定数量的并发连接
+
+        并发 API 请求共用同一个会话，连接池不足时重新挂载更大的适配器，
+        避免超出连接池的线程每次都重新建立 TCP/TLS 连接。
+
+        Args:
+            pool_size: 需要的连接池大小
+        """
+        with self._pool_lock:
+            if pool_size <= self._pool_size:
+                return
+
+            adapter = _KeepAliveAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                pool_block=self._pool_block,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self._pool_size = pool_size
+
+    def _download_session(self) -> requests.Session:
+        """
+        获取当前线程专用的下载会话
+
+        每个下载线程持有独立的会话和连接池，避免多线程争用同一连接池的锁；
+        会话存活超过 _CONNECTION_TTL 后重建，避免复用被 NAT/负载均衡静默断开的空闲连接。
+
+        Returns:
+            当前线程的下载会话
+        """
+        local = self._thread_local
+        session = getattr(local, 'session', None)
+        now = time.monotonic()
+
+        if session is not None and now - local.created_at < _CONNECTION_TTL:
+            return session
+
+        if session is not None:
+            session.close()
+            logger.debug("Recycled download session older than %ss", _CONNECTION_TTL)
+
+        session = requests.Session()
+        adapter = _KeepAliveAdapter(
+            pool_connections=_THREAD_POOL_SIZE,
+            pool_maxsize=_THREAD_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self.session.headers)
+
+        local.session = session
+        local.created_at = now
+        return session
+
     def _rate_limit(self):
         """智能速率限制控制"""
         # 获取信号量
@@ -102,6 +309,43 @@ class CodingClient:
 
         threading.Thread(target=release_semaphore, daemon=True).start()
 
+    def _post_action(self, url: str, params: Optional[Dict[str, Any]], data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        发送一次 API 请求并解析 JSON 响应
+
+        Args:
+            url: 请求 URL
+            params: URL 参数
+            data: 请求体数据
+
+        Returns:
+            解析后的响应数据
+        """
+        response = self.session.post(url, params=params, json=data, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _dispatch_response(result: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        检查响应中的错误信息
+
+        Args:
+            result: 解析后的响应数据
+
+        Returns:
+            (是否成功, 错误信息)
+        """
+        error = result.get('Response', {}).get('Error')
+        if not error:
+            return True, None
+        return False, error
+
+    def _set_rate(self, requests_per_second: int) -> None:
+        """调整速率限制"""
+        self.requests_per_second = requests_per_second
+        self.rate_limiter = threading.Semaphore(requests_per_second)
+
     def _make_request(self, action: str, params: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         发起 API 请求
@@ -123,77 +367,71 @@ class CodingClient:
         url = urljoin(self.base_url, f"?Action={action}")
 
         try:
-            response = self.session.post(url, params=params, json=data, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-
-            # 检查响应中是否有错误
-            if 'Response' in result and 'Error' in result['Response']:
-                error = result['Response']['Error']
-                if error.get('Code') == 'RequestLimitExceeded':
-                    # 如果遇到请求限制，进行智能重试
-                    self.rate_limit_hits += 1
-                    max_retries = 3
-                    for retry in range(max_retries):
-                        # 指数退避 + 随机抖动
-                        base_wait = 2 ** retry  # 1, 2, 4 秒
-                        jitter = random.uniform(0.5, 1.5)  # 随机抖动
-                        wait_time = base_wait * jitter
-
-                        logger.warning(f"Rate limit hit (attempt {retry + 1}/{max_retries}), waiting {wait_time:.1f}s before retry...")
-                        time.sleep(wait_time)
-
-                        # 降低速率限制
-                        original_rate = self.requests_per_second
-                        self.requests_per_second = max(5, original_rate // 2)  # 最低5 req/s
-                        self.rate_limiter = threading.Semaphore(self.requests_per_second)
-                        logger.info(f"Temporarily reduced rate limit to {self.requests_per_second} req/s")
-
-                        # 重试请求
-                        try:
-                            response = self.session.post(url, params=params, json=data, timeout=30)
-                            response.raise_for_status()
-                            result = response.json()
-
-                            # 检查重试后是否还有错误
-                            if 'Response' in result and 'Error' in result['Response']:
-                                retry_error = result['Response']['Error']
-                                if retry_error.get('Code') == 'RequestLimitExceeded':
-                                    if retry < max_retries - 1:
-                                        continue  # 继续重试
-                                    else:
-                                        raise requests.RequestException(f"API Error: {retry_error.get('Code')} - {retry_error.get('Message', 'Unknown error')} (max retries exceeded)")
-
-                            # 重试成功，恢复原始速率限制
-                            self.requests_per_second = original_rate
-                            self.rate_limiter = threading.Semaphore(self.requests_per_second)
-                            logger.info(f"Restored rate limit to {self.requests_per_second} req/s after successful retry")
-                            break
-
-                        except requests.RequestException as retry_exception:
-                            if retry < max_retries - 1:
-                                logger.warning(f"Retry {retry + 1} failed: {retry_exception}")
-                                continue
-                            else:
-                                raise requests.RequestException(f"API Error: {retry_exception} (max retries exceeded)")
-                        finally:
-                            # 无论重试是否成功，都确保在一段时间后恢复速率限制
-                            def restore_rate():
-                                time.sleep(30)  # 30秒后恢复
-                                self.requests_per_second = original_rate
-                                self.rate_limiter = threading.Semaphore(self.requests_per_second)
-                                logger.info(f"Rate limit restored to {self.requests_per_second} req/s")
-
-                            threading.Thread(target=restore_rate, daemon=True).start()
-                else:
-                    raise requests.RequestException(f"API Error: {error.get('Code', 'Unknown')} - {error.get('Message', 'Unknown error')}")
-
-            return result
-
+            result = self._post_action(url, params, data)
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
             raise
 
+        ok, error = self._dispatch_response(result)
+        if ok:
+            return result
+
+        code = error.get('Code', 'Unknown')
+        if code not in _TRANSIENT_CODES:
+            raise requests.RequestException(f"API Error: {code} - {error.get('Message', 'Unknown error')}")
+
+        # 遇到请求限制或临时错误，进行智能重试
+        original_rate = self.requests_per_second
+        max_retries = 3
+        for retry in range(max_retries):
+            if code == 'RequestLimitExceeded':
+                self.rate_limit_hits += 1
+                # 降低速率限制
+                self._set_rate(max(5, original_rate // 2))  # 最低5 req/s
+                logger.info(f"Temporarily reduced rate limit to {self.requests_per_second} req/s")
+
+            # 指数退避 + 随机抖动
+            wait_time = (2 ** retry) * random.uniform(0.5, 1.5)  # 1, 2, 4 秒
+            logger.warning(f"{code} (attempt {retry + 1}/{max_retries}), waiting {wait_time:.1f}s before retry...")
+            time.sleep(wait_time)
+
+            try:
+                result = self._post_action(url, params, data)
+            except requests.exceptions.RequestException as e:
+                if retry < max_retries - 1:
+                    logger.warning(f"Retry {retry + 1} failed: {e}")
+                    continue
+                logger.error(f"API request failed after {max_retries} retries: {e}")
+                self._schedule_rate_restore(original_rate)
+                raise
+
+            ok, error = self._dispatch_response(result)
+            if ok:
+                # 重试成功，恢复原始速率限制
+                if self.requests_per_second != original_rate:
+                    self._set_rate(original_rate)
+                    logger.info(f"Restored rate limit to {self.requests_per_second} req/s after successful retry")
+                return result
+
+            code = error.get('Code', 'Unknown')
+            if code not in _TRANSIENT_CODES:
+                break
+
+        self._schedule_rate_restore(original_rate)
+        raise requests.RequestException(f"API Error: {code} - {error.get('Message', 'Unknown error')} (max retries exceeded)")
+
+    def _schedule_rate_restore(self, original_rate: int) -> None:
+        """在一段时间后恢复原始速率限制"""
+        if self.requests_per_second == original_rate:
+            return
+
+        def restore_rate():
+            time.sleep(30)  # 30秒后恢复
+            self._set_rate(original_rate)
+            logger.info(f"Rate limit restored to {self.requests_per_second} req/s")
+
+        threading.Thread(target=restore_rate, daemon=True).start()
+
     def get_projects(self, page_number: int = 1, page_size: int = 100) -> List[CodingProject]:
         """
         获取项目列表
@@ -205,52 +443,55 @@ class CodingClient:
         Returns:
             项目列表
         """
+        return self._get_projects_page(page_number, page_size)[0]
+
+    def _get_projects_page(self, page_number: int, page_size: int) -> Tuple[List[CodingProject], int]:
+        """
+        获取一页项目及项目总数
+
+        Args:
+            page_number: 页码
+            page_size: 每页数量
+
+        Returns:
+            (项目列表, 项目总数)，解析失败时总数为 0
+        """
+        return self._describe_projects(page_number, page_size)
+
+    def _describe_projects(self, page_number: int, page_size: int,
+                           project_name: Optional[str] = None) -> Tuple[List[CodingProject], int]:
+        """
+        调用 DescribeCodingProjects 获取一页项目
+
+        Args:
+            page_number: 页码
+            page_size: 每页数量
+            project_name: 按项目名称过滤（可选）
+
+        Returns:
+            (项目列表, 项目总数)，解析失败时总数为 0
+        """
         logger.info(f"Fetching projects page {page_number} with size {page_size}")
 
         data = {
             "PageNumber": str(page_number),
             "PageSize": str(page_size)
         }
+        if project_name:
+            data["ProjectName"] = project_name
 
         response = self._make_request("DescribeCodingProjects", data=data)
 
         try:
-            # 直接解析响应数据，避免复杂的模型验证
-            response_data = response.get('Response', {})
-            data_section = response_data.get('Data', {})
-            project_list = data_section.get('ProjectList', [])
-
-            projects = []
-            for project_data in project_list:
-                # 手动创建项目对象，使用正确的大写字段名格式
-                project = CodingProject(
-                    id=project_data.get('Id', 0),
-                    created_at=project_data.get('CreatedAt', 0),
-                    updated_at=project_data.get('UpdatedAt', 0),
-                    status=project_data.get('Status', 0),
-                    type=project_data.get('Type', 0),
-                    max_member=project_data.get('MaxMember', 0),
-                    name=project_data.get('Name', ''),
-                    display_name=project_data.get('DisplayName', ''),
-                    description=project_data.get('Description', ''),
-                    icon=project_data.get('Icon', ''),
-                    team_owner_id=project_data.get('TeamOwnerId', 0),
-                    user_owner_id=project_data.get('UserOwnerId', 0),
-                    start_date=project_data.get('StartDate', 0),
-                    end_date=project_data.get('EndDate', 0),
-                    team_id=project_data.get('TeamId', 0),
-                    is_demo=project_data.get('IsDemo', False),
-                    archived=project_data.get('Archived', False),
-                    program_ids=project_data.get('ProgramIds', [])
-                )
-                projects.append(project)
-
-            return projects
+            # 整页数据交给 pydantic-core 一次校验，字段按 API 的大写别名映射
+            data_section = response.get('Response', {}).get('Data') or {}
+            page = DescribeProjectsResponse.model_validate(data_section)
+            return page.project_list, page.total_count
 
         except Exception as e:
             logger.error(f"Failed to parse projects response: {e}")
             logger.debug(f"Response data: {response}")
-            return []
+            return [], 0
 
     def get_all_projects(self) -> List[CodingProject]:
         """
@@ -259,18 +500,30 @@ class CodingClient:
         Returns:
             所有项目列表
         """
-        all_projects = []
-        page_number = 1
         page_size = 100
 
-        while True:
-            projects = self.get_projects(page_number, page_size)
-            all_projects.extend(projects)
+        # 首页返回项目总数，其余各页相互独立，可并发获取
+        all_projects, total_count = self._get_projects_page(1, page_size)
 
-            if len(projects) < page_size:
-                break
+        has_more = len(all_projects) >= page_size
 
-            page_number += 1
+        if has_more and total_count > 0:
+            pages = -(-total_count // page_size)
+            if pages > 1:
+                # 速率限制由 _make_request 统一控制，这里按页顺序拼接结果
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, pages - 1)) as executor:
+                    for projects in executor.map(self.get_projects, range(2, pages + 1), itertools.repeat(page_size)):
+                        all_projects.extend(projects)
+        elif has_more:
+            # 响应未提供总数，退回逐页获取
+            page_number = 1
+            while True:
+                page_number += 1
+                projects = self.get_projects(page_number, page_size)
+                all_projects.extend(projects)
+
+                if len(projects) < page_size:
+                    break
 
         logger.info(f"Retrieved {len(all_projects)} projects")
         return all_projects
@@ -285,13 +538,45 @@ class CodingClient:
         Returns:
             项目信息或 None
         """
-        projects = self.get_all_projects()
+        return self.describe_project_by_name(project_name)
 
-        for project in projects:
-            if project.name == project_name:
-                return project
+    def describe_project_by_name(self, project_name: str) -> Optional[CodingProject]:
+        """
+        按名称查询单个项目，结果会被缓存
 
-        return None
+        通过 DescribeCodingProjects 的 ProjectName 过滤只取匹配的项目，
+        不需要分页拉取团队的全部项目；过滤结果中没有同名项目时再退回全量查找。
+
+        Args:
+            project_name: 项目名称
+
+        Returns:
+            项目信息或 None
+        """
+        project = self._projects_by_name.get(project_name)
+        if project is not None:
+            return project
+
+        projects, _ = self._describe_projects(1, 100, project_name)
+        project = next((p for p in projects if p.name == project_name), None)
+        if project is None:
+            logger.debug(f"Project {project_name} not found by name filter, searching all projects")
+            project = next((p for p in self.get_all_projects() if p.name == project_name), None)
+
+        if project is not None:
+            self._projects_by_name[project_name] = project
+            self.set_project_name(project.id, project_name)
+        return project
+
+    def set_project_name(self, project_id: int, project_name: str) -> None:
+        """
+        记录项目 ID 对应的名称，之后按 ID 查询名称时不再拉取全部项目
+
+        Args:
+            project_id: 项目 ID
+            project_name: 项目名称
+        """
+        self._project_name_cache[project_id] = project_name
 
     def get_project_name_by_id(self, project_id: int) -> str:
         """
@@ -303,10 +588,6 @@ class CodingClient:
         Returns:
             项目名称
         """
-        # 缓存项目名称映射
-        if not hasattr(self, '_project_name_cache'):
-            self._project_name_cache = {}
-
         # 先检查缓存
         if project_id in self._project_name_cache:
             return self._project_name_cache[project_id]
@@ -354,6 +635,8 @@ class CodingClient:
 
             logger.info(f"Found {len(all_repos)} repositories for project {project_id}")
             for repo in all_repos:
+                # 统一仓库类型标识（数字或字符串），调用方只需比较 _normalized_type
+                repo['_normalized_type'] = _REPO_TYPE_NAMES.get(repo.get('Type'))
                 logger.info(f"Repository: {repo.get('Name')} (ID: {repo.get('Id')}, Type: {repo.get('Type')})")
 
             return all_repos
@@ -424,6 +707,33 @@ class CodingClient:
             logger.warning(f"Failed to get Maven artifacts from repository {repository_name}: {e}")
             return []
 
+    def iter_maven_artifacts(self, project_id: int, repository_name: str, filter_config: Optional[MavenFilterConfig] = None) -> Iterator[List[MavenArtifact]]:
+        """
+        按批次逐步获取 Maven 制品列表，每完成一批版本的文件查询就返回该批制品
+
+        调用方可以在后续批次仍在查询时就开始处理已返回的制品。
+
+        Args:
+            project_id: 项目 ID
+            repository_name: 仓库名称
+            filter_config: Maven 过滤配置
+
+        Returns:
+            每批制品列表的迭代器
+        """
+        logger.info(f"Fetching Maven artifacts for project {project_id}, repository {repository_name}")
+
+        try:
+            versions = self.get_maven_versions(project_id, repository_name, filter_config)
+            logger.info(f"Found {len(versions)} Maven package versions")
+
+            project_name = self.get_project_name_by_id(project_id)
+
+            yield from self._iter_artifact_batches(project_id, project_name, repository_name, versions)
+
+        except Exception as e:
+            logger.warning(f"Failed to get Maven artifacts from repository {repository_name}: {e}")
+
     def _get_artifacts_concurrent(self, project_id: int, project_name: str, repository_name: str, versions: List[Dict[str, Any]]) -> List[MavenArtifact]:
         """
         并发获取所有版本的制品文件列表
@@ -437,8 +747,24 @@ class CodingClient:
         Returns:
             所有制品列表
         """
-        all_artifacts = []
+        # 按批次收集结果，最后一次性合并，避免列表反复扩容
+        return list(itertools.chain.from_iterable(
+            self._iter_artifact_batches(project_id, project_name, repository_name, versions)
+        ))
 
+    def _iter_artifact_batches(self, project_id: int, project_name: str, repository_name: str, versions: List[Dict[str, Any]]) -> Iterator[List[MavenArtifact]]:
+        """
+        分批并发获取版本的制品文件列表，每完成一批返回一批
+
+        Args:
+            project_id: 项目 ID
+            project_name: 项目名称
+            repository_name: 仓库名称
+            versions: 版本信息列表
+
+        Returns:
+            每批制品列表的迭代器
+        """
         # 分批处理，避免同时发送过多请求
         # 根据当前速率限制动态调整批量大小
         batch_size = min(20, max(5, self.requests_per_second // 2))  # 5-20之间，取决于速率限制
@@ -468,11 +794,9 @@ class CodingClient:
 
             # 并发执行任务
             batch_artifacts = self._execute_batch_tasks(project_id, project_name, repository_name, tasks)
-            all_artifacts.extend(batch_artifacts)
 
             logger.info(f"Batch {batch_num + 1} completed, found {len(batch_artifacts)} artifacts")
-
-        return all_artifacts
+            yield batch_artifacts
 
     def _execute_batch_tasks(self, project_id: int, project_name: str, repository_name: str, tasks: List[Dict[str, str]]) -> List[MavenArtifact]:
         """
@@ -487,7 +811,7 @@ class CodingClient:
         Returns:
             制品列表
         """
-        artifacts = []
+        task_chunks = []
 
         # 根据速率限制动态调整并发数，避免过多并发请求
         max_concurrent = min(self.max_workers, len(tasks), max(2, self.requests_per_second // 3))
@@ -509,7 +833,7 @@ class CodingClient:
             for future in as_completed(future_to_task):
                 try:
                     task_artifacts = future.result(timeout=60)  # 60秒超时
-                    artifacts.extend(task_artifacts)
+                    task_chunks.append(task_artifacts)
                     completed += 1
 
                     if completed % 10 == 0 or completed == len(tasks):
@@ -519,7 +843,7 @@ class CodingClient:
                     task = future_to_task[future]
                     logger.error(f"Failed to get artifacts for {task['package_name']}:{task['package_version']}: {e}")
 
-        return artifacts
+        return list(itertools.chain.from_iterable(task_chunks))
 
     def get_maven_packages(self, project_id: int, repository_name: str, filter_config: Optional[MavenFilterConfig] = None, page_number: int = 1, page_size: int = 100) -> List[Dict[str, Any]]:
         """
@@ -877,6 +1201,12 @@ class CodingClient:
         Returns:
             Maven 文件路径
         """
+        return self._maven_file_path(package_name, package_version)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _maven_file_path(package_name: str, package_version: str) -> str:
+        """按 (包名, 版本号) 缓存的 Maven 文件路径构建"""
         # 解析 groupId 和 artifactId
         if ':' in package_name:
             group_id, artifact_id = package_name.split(':', 1)
@@ -890,7 +1220,6 @@ class CodingClient:
         # 构建标准 Maven 文件路径
         return f"{group_path}/{artifact_id}/{package_version}/{artifact_id}-{package_version}.jar"
 
-    
     def _parse_maven_path(self, file_path: str) -> Optional[MavenArtifact]:
         """
         解析 Maven 文件路径获取坐标信息
@@ -910,30 +1239,20 @@ class CodingClient:
         version = parts[-2]
         filename = parts[-1]
 
-        # 解析文件名
-        if filename.endswith('.jar'):
-            artifact_id_version = filename[:-4]  # 去掉 .jar
-        elif filename.endswith('.pom'):
-            artifact_id_version = filename[:-4]  # 去掉 .pom
-        elif filename.endswith('-sources.jar'):
-            artifact_id_version = filename[:-11]  # 去掉 -sources.jar
-        else:
-            artifact_id_version = filename
+        # 解析文件名: 一次 rpartition 拆出扩展名，去掉 -sources 后缀
+        stem, dot, ext = filename.rpartition('.')
+        if not dot:
+            stem = filename
+        packaging = _PACKAGING_BY_EXT.get(ext, 'jar')
+        if ext == 'jar' and stem.endswith('-sources'):
+            stem = stem[:-len('-sources')]
 
         # 分离 artifact_id 和 version
-        if f"-{version}" in artifact_id_version:
-            artifact_id = artifact_id_version[:artifact_id_version.rfind(f"-{version}")]
-        else:
-            artifact_id = artifact_id_version
+        version_index = stem.rfind('-' + version)
+        artifact_id = stem[:version_index] if version_index != -1 else stem
 
         group_id = '/'.join(parts[:-3])
 
-        packaging = "jar"
-        if filename.endswith('.pom'):
-            packaging = "pom"
-        elif filename.endswith('-sources.jar'):
-            packaging = "jar"
-
         return MavenArtifact(
             group_id=group_id,
             artifact_id=artifact_id,
@@ -943,7 +1262,56 @@ class CodingClient:
             repository=None  # 这个方法无法确定仓库，设为None
         )
 
-    def download_artifact(self, project_id: int, repository_name: str, file_path: str, output_path: str, download_url: str) -> bool:
+    def _resolve_maven_auth(self, url_project_name: Optional[str], url_repo_name: Optional[str],
+                            project_id: int, repository_name: str) -> Optional[Tuple[str, str]]:
+        """
+        解析 Maven 仓库下载认证信息（按参数缓存，同一仓库只解析一次）
+
+        Args:
+            url_project_name: URL 路径中的项目名称
+            url_repo_name: URL 路径中的仓库名称
+            project_id: 项目 ID（回退时用于获取项目名称）
+            repository_name: 仓库名称（用于回退）
+
+        Returns:
+            (username, password) 或 None
+        """
+        key = (url_project_name, url_repo_name, project_id, repository_name)
+        if key in self._auth_cache:
+            return self._auth_cache[key]
+
+        auth = None
+        if url_project_name and url_project_name in self.maven_repositories:
+            # 优先使用URL中的项目名称来匹配认证信息
+            project_repos = self.maven_repositories[url_project_name]
+            # 处理嵌套配置对象
+            if hasattr(project_repos, url_repo_name):
+                repo_config = getattr(project_repos, url_repo_name)
+                auth = (repo_config.username, repo_config.password)
+                logger.debug(f"Using auth for URL project: {url_project_name}, repo: {url_repo_name}")
+            else:
+                logger.warning(f"No auth found for repository: {url_repo_name} in URL project: {url_project_name}")
+        else:
+            if url_project_name:
+                logger.warning(f"No auth configuration found for URL project: {url_project_name}")
+            # 回退到使用 project_id 对应的项目名称（仅在需要时解析）
+            project_name = self.get_project_name_by_id(project_id)
+            if project_name and project_name in self.maven_repositories:
+                project_repos = self.maven_repositories[project_name]
+                if hasattr(project_repos, repository_name):
+                    repo_config = getattr(project_repos, repository_name)
+                    auth = (repo_config.username, repo_config.password)
+                    logger.debug(f"Using fallback auth for project: {project_name}, repo: {repository_name}")
+                else:
+                    logger.warning(f"No auth found for repository: {repository_name} in fallback project: {project_name}")
+            else:
+                logger.warning(f"No auth configuration found for fallback project: {project_name}")
+
+        self._auth_cache[key] = auth
+        return auth
+
+    def download_artifact(self, project_id: int, repository_name: str, file_path: str, output_path: str,
+                          download_url: str, drop_page_cache: bool = False) -> bool:
         """
         下载制品文件
 
@@ -953,14 +1321,13 @@ class CodingClient:
             file_path: 文件路径
             output_path: 输出路径
             download_url: 下载 URL（必须由 API 提供）
+            drop_page_cache: 写完大文件后丢弃其页缓存（仅用于之后不会马上读取的文件，
+                下载后随即上传时不要开启）
 
         Returns:
             下载是否成功
         """
-        logger.info(f"Downloading artifact: {file_path}")
-
-        # 使用 project_id 来获取项目名称（用于回退）
-        project_name = self.get_project_name_by_id(project_id)
+        logger.info("Downloading artifact: %s", file_path)
 
         # 只使用 API 提供的下载 URL
         if not download_url:
@@ -968,81 +1335,152 @@ class CodingClient:
             return False
 
         target_url = download_url
+        # 输出文件是否已被本次下载打开（覆盖），失败时需要删除
+        output_opened = False
 
         try:
-            logger.debug(f"Downloading from: {target_url}")
+            logger.debug("Downloading from: %s", target_url)
+
+            auth = self._download_auth(target_url, project_id, repository_name)
+            if self._http2_client is not None:
+                with self._http2_client.stream('GET', target_url, auth=auth) as response:
+                    response.raise_for_status()
+                    self._ensure_output_dir(output_path)
+                    with open(output_path, 'wb', buffering=_DOWNLOAD_BUFFER_SIZE) as f:
+                        output_opened = True
+                        for chunk in response.iter_bytes(_DOWNLOAD_BUFFER_SIZE):
+                            f.write(chunk)
+                        if drop_page_cache:
+                            _drop_page_cache(f)
+            else:
+                # 使用上下文管理器，失败时也能及时把连接归还连接池
+                with self._download_session().get(target_url, stream=True, auth=auth) as response:
+                    response.raise_for_status()
+                    self._ensure_output_dir(output_path)
+
+                    content_length = int(response.headers.get('Content-Length') or 0)
+                    with open(output_path, 'wb', buffering=_DOWNLOAD_BUFFER_SIZE) as f:
+                        output_opened = True
+                        if 0 < content_length <= _SMALL_FILE_THRESHOLD:
+                            # 小文件（POM、元数据等）一次性读取写入，省去分块复制开销
+                            f.write(response.content)
+                        else:
+                            # 直接从底层连接读取，使用 1 MiB 缓冲区减少读写系统调用次数
+                            preallocated = _preallocate(f, content_length)
+                            response.raw.decode_content = True
+                            shutil.copyfileobj(response.raw, f, _DOWNLOAD_BUFFER_SIZE)
+                            if preallocated:
+                                # 实际写入长度可能与 Content-Length 不同（如压缩传输），截掉多余部分
+                                f.truncate()
+                            if drop_page_cache:
+                                _drop_page_cache(f)
+
+            logger.info("Successfully downloaded %s to %s", file_path, output_path)
+            return True
 
-            # 为 Maven 仓库下载添加基本认证
-            auth = None
-            project_name = self.get_project_name_by_id(project_id)
+        except _DOWNLOAD_ERRORS as e:
+            logger.error("Failed to download %s: %s", file_path, e)
+            # 预分配后中断的文件尾部是补零的空洞，删除残缺文件，避免后续按目录上传时被当作完整制品
+            if output_opened:
+                try:
+                    os.remove(output_path)
+                except OSError:
+                    pass
+            return False
 
-            # 检查是否为 Maven 仓库 URL（包含 .pkg.coding.net）
-            if ".pkg.coding.net" in target_url:
-                # 从 URL 路径中提取项目名称
-                # URL 格式: https://domain.pkg.coding.net/repository/project-name/repo-name/...
-                import re
-                url_pattern = r'https://[^/]+/repository/([^/]+)/([^/]+)/'
-                match = re.search(url_pattern, target_url)
-
-                if match:
-                    url_project_name = match.group(1)  # URL路径中的项目名称
-                    url_repo_name = match.group(2)     # URL路径中的仓库名称
-                    # 优先使用URL中的项目名称来匹配认证信息
-                    if url_project_name and url_project_name in self.maven_repositories:
-                        project_repos = self.maven_repositories[url_project_name]
-                        # 处理嵌套配置对象
-                        if hasattr(project_repos, url_repo_name):
-                            repo_config = getattr(project_repos, url_repo_name)
-                            auth = (repo_config.username, repo_config.password)
-                            logger.debug(f"Using auth for URL project: {url_project_name}, repo: {url_repo_name}")
-                        else:
-                            logger.warning(f"No auth found for repository: {url_repo_name} in URL project: {url_project_name}")
-                    else:
-                        logger.warning(f"No auth configuration found for URL project: {url_project_name}")
-                        # 回退到使用 project_id 对应的项目名称
-                        if project_name and project_name in self.maven_repositories:
-                            project_repos = self.maven_repositories[project_name]
-                            if hasattr(project_repos, repository_name):
-                                repo_config = getattr(project_repos, repository_name)
-                                auth = (repo_config.username, repo_config.password)
-                                logger.debug(f"Using fallback auth for project: {project_name}, repo: {repository_name}")
-                            else:
-                                logger.warning(f"No auth found for repository: {repository_name} in fallback project: {project_name}")
-                        else:
-                            logger.warning(f"No auth configuration found for fallback project: {project_name}")
-                else:
-                    # 如果无法从URL提取，使用原有逻辑
-                    logger.warning(f"Could not extract project/repo from URL: {target_url}")
-                    if project_name and project_name in self.maven_repositories:
-                        project_repos = self.maven_repositories[project_name]
-                        if hasattr(project_repos, repository_name):
-                            repo_config = getattr(project_repos, repository_name)
-                            auth = (repo_config.username, repo_config.password)
-                            logger.debug(f"Using basic auth for project: {project_name}, repo: {repository_name}")
-                            logger.debug(f"Auth username: {repo_config.username}")
-                        else:
-                            logger.warning(f"No auth found for repository: {repository_name} in project: {project_name}")
-                    else:
-                        logger.warning(f"No auth configuration found for project: {project_name}")
-            else:
-                logger.debug(f"Not a Maven repository URL, skipping auth: {target_url}")
+    def download_artifact_stream(self, project_id: int, repository_name: str, file_path: str, writer, download_url: str) -> bool:
+        """
+        下载制品内容并写入可写文件对象（如 io.BytesIO），不经过磁盘
 
-            logger.debug(f"Final auth: {'None' if auth is None else f'username={auth[0]}'}")
-            response = self.session.get(target_url, stream=True, auth=auth)
-            response.raise_for_status()
+        Args:
+            project_id: 项目 ID
+            repository_name: 仓库名称
+            file_path: 文件路径
+            writer: 可写的二进制文件对象
+            download_url: 下载 URL（必须由 API 提供）
 
-            # 确保输出目录存在
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
+        Returns:
+            下载是否成功
+        """
+        logger.debug("Downloading artifact to stream: %s", file_path)
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        if not download_url:
+            logger.error("No download URL provided by API")
+            return False
 
-            logger.info(f"Successfully downloaded {file_path} to {output_path}")
+        try:
+            auth = self._download_auth(download_url, project_id, repository_name)
+            if self._http2_client is not None:
+                with self._http2_client.stream('GET', download_url, auth=auth) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(_DOWNLOAD_BUFFER_SIZE):
+                        writer.write(chunk)
+            else:
+                with self._download_session().get(download_url, stream=True, auth=auth) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, writer, _DOWNLOAD_BUFFER_SIZE)
             return True
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to download {file_path}: {e}")
-            return False
\ No newline at end of file
+        except _DOWNLOAD_ERRORS as e:
+            logger.error("Failed to download %s: %s", file_path, e)
+            return False
+
+    def _download_auth(self, target_url: str, project_id: int, repository_name: str) -> Optional[Tuple[str, str]]:
+        """
+        确定下载 URL 所需的基本认证信息
+
+        Args:
+            target_url: 下载 URL
+            project_id: 项目 ID
+            repository_name: 仓库名称
+
+        Returns:
+            (用户名, 密码) 或 None
+        """
+        auth = None
+
+        # 检查是否为 Maven 仓库 URL（包含 .pkg.coding.net），非 Maven URL 跳过所有认证解析
+        if ".pkg.coding.net" in target_url:
+            # 从 URL 路径中提取项目名称和仓库名称
+            url_parts = _split_maven_url(target_url)
+            if not url_parts:
+                logger.warning("Could not extract project/repo from URL: %s", target_url)
+                url_parts = (None, None)
+
+            auth = self._resolve_maven_auth(url_parts[0], url_parts[1], project_id, repository_name)
+        else:
+            logger.debug("Not a Maven repository URL, skipping auth: %s", target_url)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final auth: %s", 'None' if auth is None else f'username={auth[0]}')
+        return auth
+
+    def _ensure_output_dir(self, output_path: str) -> None:
+        """
+        确保输出目录存在（已创建过的目录不再重复调用 makedirs）
+
+        Args:
+            output_path: 输出文件路径
+        """
+        output_dir = os.path.dirname(output_path)
+        if output_dir and output_dir not in self._created_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            with self._created_dirs_lock:
+                self._created_dirs.add(output_dir)
+
+    def download_artifacts_batch(self, jobs: List[Tuple[int, str, str, str, str]]) -> List[bool]:
+        """
+        并发下载一批制品文件
+
+        Args:
+            jobs: 下载任务列表，每个元素为 (project_id, repository_name, file_path, output_path, download_url)
+
+        Returns:
+            与任务顺序一致的下载结果列表
+        """
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            return list(executor.map(lambda job: self.download_artifact(*job), jobs))
@@ -4,12 +4,22 @@
 
 import os
 import yaml
+import queue
+import atexit
+import operator
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from .models import MigrationConfig, MavenFilterConfig, MavenRepositoryConfig, PaginationConfig, PerformanceConfig
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml 不可用时回退到纯 Python 实现
+    from yaml import SafeLoader, SafeDumper
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +34,27 @@ class ConfigManager:
             config_file: 配置文件路径，默认为 config.yaml
         """
         self.config_file = Path(config_file) if config_file else Path("config.yaml")
+        # 已解析的配置缓存: (文件修改时间, 配置字典)
+        self._raw_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # 文件日志后台写入监听器
+        self._log_listener: Optional[QueueListener] = None
+
+    def _read_config_data(self) -> Dict[str, Any]:
+        """
+        读取并解析配置文件，文件未修改时直接返回缓存结果
+
+        Returns:
+            配置字典
+        """
+        mtime_ns = self.config_file.stat().st_mtime_ns
+        if self._raw_cache is not None and self._raw_cache[0] == mtime_ns:
+            return self._raw_cache[1]
+
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
+
+        self._raw_cache = (mtime_ns, config_data)
+        return config_data
 
     def load_config(self) -> MigrationConfig:
         """
@@ -41,14 +72,17 @@ class ConfigManager:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            config_data = self._read_config_data()
 
             # 验证必要配置项
             self._validate_config(config_data)
 
+            coding_data = config_data['coding']
+            nexus_data = config_data['nexus']
+            migration_data = config_data['migration']
+
             # 构建 Maven 过滤配置
-            maven_filter_data = config_data['coding'].get('maven_filter', {})
+            maven_filter_data = coding_data.get('maven_filter', {})
             # 兼容旧格式，支持 package_patterns 字段
             patterns = maven_filter_data.get('patterns') or maven_filter_data.get('package_patterns', [])
             maven_filter = MavenFilterConfig(
@@ -57,61 +91,64 @@ class ConfigManager:
             )
 
             # 构建分页配置
-            pagination_data = config_data['coding'].get('pagination', {})
+            pagination_data = coding_data.get('pagination', {})
             pagination = PaginationConfig(
                 page_size=pagination_data.get('page_size', 100),
                 max_pages=pagination_data.get('max_pages', 50)
             )
 
             # 构建 Maven 仓库认证配置
-            maven_repositories_data = config_data['coding'].get('maven_repositories', {})
+            maven_repositories_data = coding_data.get('maven_repositories', {})
             maven_repositories = {}
+            get_credentials = operator.itemgetter('username', 'password')
             for project_name, project_data in maven_repositories_data.items():
                 # 检查是否为新的嵌套格式
                 if 'releases' in project_data or 'snapshots' in project_data:
                     # 新格式：project_name -> {releases: {...}, snapshots: {...}}
                     project_config = {}
                     if 'releases' in project_data:
-                        releases_data = project_data['releases']
-                        project_config['releases'] = MavenRepositoryConfig(
-                            username=releases_data['username'],
-                            password=releases_data['password']
-                        )
+                        username, password = get_credentials(project_data['releases'])
+                        project_config['releases'] = MavenRepositoryConfig(username=username, password=password)
                     if 'snapshots' in project_data:
-                        snapshots_data = project_data['snapshots']
-                        project_config['snapshots'] = MavenRepositoryConfig(
-                            username=snapshots_data['username'],
-                            password=snapshots_data['password']
-                        )
+                        username, password = get_credentials(project_data['snapshots'])
+                        project_config['snapshots'] = MavenRepositoryConfig(username=username, password=password)
                     maven_repositories[project_name] = project_config
                 else:
                     # 旧格式：repo_name -> {username: ..., password: ...}
-                    maven_repositories[project_name] = MavenRepositoryConfig(
-                        username=project_data['username'],
-                        password=project_data['password']
-                    )
+                    username, password = get_credentials(project_data)
+                    maven_repositories[project_name] = MavenRepositoryConfig(username=username, password=password)
 
             # 构建性能优化配置
-            performance_data = config_data['coding'].get('performance', {})
+            performance_data = coding_data.get('performance', {})
             performance = PerformanceConfig(
                 max_workers=performance_data.get('max_workers', 12),
-                batch_size=performance_data.get('batch_size', 50)
+                batch_size=performance_data.get('batch_size', 50),
+                memory_limit_mb=performance_data.get('memory_limit_mb', 100),
+                upload_workers=performance_data.get('upload_workers'),
+                upload_buffer_size=performance_data.get('upload_buffer_size', 1 << 20),
+                http_pool_maxsize=performance_data.get('http_pool_maxsize', 32),
+                http_pool_block=performance_data.get('http_pool_block', False),
+                temp_dir=performance_data.get('temp_dir'),
+                http2=performance_data.get('http2', False)
             )
 
             # 构建 MigrationConfig 对象
             migration_config = MigrationConfig(
-                coding_token=config_data['coding']['token'],
-                coding_team_id=config_data['coding']['team_id'],
-                nexus_url=config_data['nexus']['url'],
-                nexus_username=config_data['nexus']['username'],
-                nexus_password=config_data['nexus']['password'],
-                nexus_repository=config_data['nexus'].get('release_repo', config_data['nexus'].get('repository', 'maven-releases')),
-                nexus_snapshot_repository=config_data['nexus'].get('snapshot_repo'),
-                nexus_releases_repository=config_data['nexus'].get('release_repo'),
-                project_names=config_data['migration'].get('project_names', []),
-                download_path=config_data['migration'].get('download_path', './downloads'),
-                batch_size=config_data['migration'].get('batch_size', 100),
-                parallel_downloads=config_data['migration'].get('parallel_downloads', 5),
+                coding_token=coding_data['token'],
+                coding_team_id=coding_data['team_id'],
+                nexus_url=nexus_data['url'],
+                nexus_username=nexus_data['username'],
+                nexus_password=nexus_data['password'],
+                nexus_repository=nexus_data.get('release_repo', nexus_data.get('repository', 'maven-releases')),
+                nexus_snapshot_repository=nexus_data.get('snapshot_repo'),
+                nexus_releases_repository=nexus_data.get('release_repo'),
+                project_names=migration_data.get('project_names', []),
+                download_path=migration_data.get('download_path', './downloads'),
+                batch_size=migration_data.get('batch_size', 100),
+                parallel_downloads=migration_data.get('parallel_downloads', 5),
+                prefer_disk_staging=migration_data.get('prefer_disk_staging', False),
+                prefetch_existing_assets=migration_data.get('prefetch_existing_assets', True),
+                skip_checksum_sidecars=migration_data.get('skip_checksum_sidecars', True),
                 maven_filter=maven_filter,
                 pagination=pagination,
                 performance=performance,
@@ -143,36 +180,38 @@ class ConfigManager:
         # 先加载基础配置
         config = self.load_config()
 
-        # 使用环境变量覆盖配置
-        if os.getenv('CODING_TOKEN'):
-            config.coding_token = os.getenv('CODING_TOKEN')
+        # 使用环境变量覆盖配置（每个变量只查找一次）
+        env = os.environ
+
+        if (value := env.get('CODING_TOKEN')):
+            config.coding_token = value
             logger.info("Using CODING_TOKEN from environment variable")
 
-        if os.getenv('CODING_TEAM_ID'):
+        if (value := env.get('CODING_TEAM_ID')):
             try:
-                config.coding_team_id = int(os.getenv('CODING_TEAM_ID'))
+                config.coding_team_id = int(value)
                 logger.info("Using CODING_TEAM_ID from environment variable")
             except ValueError:
                 raise ValueError("Invalid CODING_TEAM_ID in environment variable")
 
-        if os.getenv('NEXUS_URL'):
-            config.nexus_url = os.getenv('NEXUS_URL')
+        if (value := env.get('NEXUS_URL')):
+            config.nexus_url = value
             logger.info("Using NEXUS_URL from environment variable")
 
-        if os.getenv('NEXUS_USERNAME'):
-            config.nexus_username = os.getenv('NEXUS_USERNAME')
+        if (value := env.get('NEXUS_USERNAME')):
+            config.nexus_username = value
             logger.info("Using NEXUS_USERNAME from environment variable")
 
-        if os.getenv('NEXUS_PASSWORD'):
-            config.nexus_password = os.getenv('NEXUS_PASSWORD')
+        if (value := env.get('NEXUS_PASSWORD')):
+            config.nexus_password = value
             logger.info("Using NEXUS_PASSWORD from environment variable")
 
-        if os.getenv('NEXUS_REPOSITORY'):
-            config.nexus_repository = os.getenv('NEXUS_REPOSITORY')
+        if (value := env.get('NEXUS_REPOSITORY')):
+            config.nexus_repository = value
             logger.info("Using NEXUS_REPOSITORY from environment variable")
 
-        if os.getenv('NEXUS_SNAPSHOT_REPOSITORY'):
-            config.nexus_snapshot_repository = os.getenv('NEXUS_SNAPSHOT_REPOSITORY')
+        if (value := env.get('NEXUS_SNAPSHOT_REPOSITORY')):
+            config.nexus_snapshot_repository = value
             logger.info("Using NEXUS_SNAPSHOT_REPOSITORY from environment variable")
 
         return config
@@ -260,7 +299,7 @@ class ConfigManager:
 
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(sample_config, f, default_flow_style=False, allow_unicode=True, indent=2)
+                yaml.dump(sample_config, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, indent=2)
 
             logger.info(f"Sample configuration created: {output_path}")
 
@@ -284,6 +323,12 @@ class ConfigManager:
         level = logging_config.get('level', 'INFO').upper()
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
+        # 清除根日志记录器上已有的处理器，避免重复调用时处理器不断累积
+        self._stop_log_listener()
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+
         # 配置根日志记录器
         logging.basicConfig(
             level=getattr(logging, level),
@@ -293,15 +338,29 @@ class ConfigManager:
             ]
         )
 
-        # 添加文件处理器（如果配置了日志文件）
+        # 添加文件处理器（如果配置了日志文件），由后台监听线程写入
         log_file = logging_config.get('file')
         if log_file:
+            # 确保日志目录存在
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
             file_handler.setFormatter(logging.Formatter(log_format))
-            logging.getLogger().addHandler(file_handler)
+
+            log_queue = queue.Queue(-1)
+            self._log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            self._log_listener.start()
+            atexit.register(self._stop_log_listener)
+            root_logger.addHandler(QueueHandler(log_queue))
 
         logger.info(f"Logging configured with level: {level}")
 
+    def _stop_log_listener(self) -> None:
+        """停止文件日志监听器，写完队列中剩余的日志"""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
     def load_config_dict(self) -> Dict[str, Any]:
         """
         加载配置为字典
@@ -313,8 +372,7 @@ class ConfigManager:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return self._read_config_data()
 
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
@@ -3,10 +3,18 @@ Maven 制品下载器
 """
 
 import os
+import json
+import fnmatch
+import time
 import logging
+import queue
+import threading
 import concurrent.futures
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Set
 from tqdm import tqdm
 from .coding_client import CodingClient
 from .models import MavenArtifact, MigrationConfig
@@ -14,6 +22,54 @@ from .models import MavenArtifact, MigrationConfig
 
 logger = logging.getLogger(__name__)
 
+# 已下载文件清单（位于下载目录下，以 . 开头，不会被当作制品上传）
+_MANIFEST_FILE = '.migrator-manifest.json'
+# 每新增多少条记录写一次清单，避免每个文件都落盘
+_MANIFEST_SAVE_INTERVAL = 100
+# 同一项目中并发下载的仓库数上限
+_MAX_PARALLEL_REPOS = 4
+# 失败下载的重试等待时间（秒），每轮依次递增
+_RETRY_DELAYS = (1, 3, 9)
+# 重试失败下载时的并发数
+_RETRY_WORKERS = 4
+# 制品列表查询与下载之间缓冲的批次数
+_LISTING_QUEUE_SIZE = 2
+# 列表查询线程向队列放入批次时的等待间隔（秒），期间检查下载方是否已停止
+_LISTING_PUT_TIMEOUT = 1.0
+
+
+@lru_cache(maxsize=None)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """
+    解析版本号中的数字段，去掉末尾的 0 段
+
+    去掉末尾 0 后直接比较元组，与补零对齐后比较的结果一致。
+
+    Args:
+        version: 版本号
+
+    Returns:
+        数字段元组
+    """
+    parts = [int(x) for x in version.split('.') if x.isdigit()]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+@lru_cache(maxsize=4096)
+def _group_path(group_id: str) -> str:
+    """
+    将 group_id 的点号转换为路径分隔符
+
+    Args:
+        group_id: Maven group_id
+
+    Returns:
+        group 目录路径
+    """
+    return group_id.replace('.', '/')
+
 
 class MavenDownloader:
     """Maven 制品下载器"""
@@ -31,6 +87,16 @@ class MavenDownloader:
         self.download_path = Path(config.download_path)
         self.download_path.mkdir(parents=True, exist_ok=True)
 
+        # 已下载文件清单: 相对下载目录的路径 -> 文件大小
+        self.manifest_file = self.download_path / _MANIFEST_FILE
+        self._manifest = self._load_manifest()
+        self._manifest_pending = 0
+        self._manifest_lock = threading.RLock()
+
+        # 本次运行中已确保存在的目录
+        self._ensured_dirs = set()
+        self._ensured_lock = threading.Lock()
+
     def download_project_artifacts(self, project_name: str) -> Dict[str, Any]:
         """
         下载指定项目的所有 Maven 制品
@@ -53,7 +119,7 @@ class MavenDownloader:
         # 获取制品仓库列表
         repositories = self.client.get_artifact_repositories(project.id)
 
-        maven_repos = [repo for repo in repositories if repo.get('Type') == 3 or repo.get('Type') == 'maven']
+        maven_repos = [repo for repo in repositories if repo.get('_normalized_type') == 'maven']
 
         if not maven_repos:
             logger.warning(f"No Maven repositories found in project: {project_name}")
@@ -80,12 +146,17 @@ class MavenDownloader:
             "failed_files": []
         }
 
-        # 为每个 Maven 仓库下载制品
-        for repo in maven_repos:
+        def download_repo(repo: Dict[str, Any]) -> Dict[str, Any]:
+            """下载单个仓库的制品"""
             repo_name = repo.get('Name', '')
             logger.info(f"Processing repository: {repo_name}")
+            return self.download_repository_artifacts(project.id, repo_name)
+
+        # 多个 Maven 仓库（releases/snapshots 等）并发下载
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_REPOS, len(maven_repos))) as executor:
+            all_repo_stats = list(executor.map(download_repo, maven_repos))
 
-            repo_stats = self.download_repository_artifacts(project.id, repo_name)
+        for repo_stats in all_repo_stats:
             stats["total_artifacts"] += repo_stats["total_artifacts"]
             stats["downloaded"] += repo_stats["downloaded"]
             stats["failed"] += repo_stats["failed"]
@@ -106,53 +177,102 @@ class MavenDownloader:
         """
         logger.info(f"Downloading artifacts from repository: {repository_name}")
 
+        stats = {"total_artifacts": 0, "downloaded": 0, "failed": 0, "failed_files": []}
+
         try:
-            # 获取所有制品（现在分页在get_maven_artifacts中处理）
+            # 后台线程逐批查询制品列表，放入有界队列；当前线程边取边下载，
+            # 使列表查询与下载重叠进行
             logger.info(f"Fetching all artifacts from repository: {repository_name}")
-            all_artifacts = self.client.get_maven_artifacts(project_id, repository_name, self.config.maven_filter)
+            batch_queue = queue.Queue(maxsize=_LISTING_QUEUE_SIZE)
+            # 下载方出错退出时通知查询线程停止，避免其永远阻塞在已满的队列上
+            stop_listing = threading.Event()
+
+            def put_batch(item: Optional[List[MavenArtifact]]) -> bool:
+                """放入队列，下载方已停止时放弃并返回 False"""
+                while not stop_listing.is_set():
+                    try:
+                        batch_queue.put(item, timeout=_LISTING_PUT_TIMEOUT)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
 
-            logger.info(f"Found {len(all_artifacts)} artifacts in repository: {repository_name}")
+            def produce_batches() -> None:
+                """查询制品列表并逐批放入队列，结束时放入 None 作为结束标记"""
+                try:
+                    for batch in self.client.iter_maven_artifacts(project_id, repository_name, self.config.maven_filter):
+                        if batch and not put_batch(batch):
+                            return
+                finally:
+                    put_batch(None)
 
-            # 显示发现的制品类型统计
-            if all_artifacts:
-                jar_count = sum(1 for a in all_artifacts if a.packaging == 'jar')
-                pom_count = sum(1 for a in all_artifacts if a.packaging == 'pom')
-                logger.info(f"📊 Artifact types: {jar_count} JAR files, {pom_count} POM files")
+            producer = threading.Thread(target=produce_batches, name=f"list-{repository_name}", daemon=True)
+            producer.start()
 
-                # 过滤完全相同的制品（保留所有版本）
-                unique_artifacts = self._filter_duplicate_files(all_artifacts)
-                logger.info(f"After filtering duplicate files: {len(unique_artifacts)} unique artifacts")
+            seen_keys = set()
+            found_count = jar_count = pom_count = 0
 
-                # 并发下载
-                stats = self._download_artifacts_parallel(project_id, repository_name, unique_artifacts)
-                return stats
+            try:
+                with tqdm(desc=f"Downloading {repository_name}", miniters=32, mininterval=0.25) as pbar:
+                    while (batch := batch_queue.get()) is not None:
+                        found_count += len(batch)
+
+                        # 过滤完全相同的制品（保留所有版本），跨批次去重
+                        unique_artifacts = self._filter_duplicate_files(batch, seen_keys)
+                        if not unique_artifacts:
+                            continue
+
+                        for artifact in unique_artifacts:
+                            if artifact.packaging == 'jar':
+                                jar_count += 1
+                            elif artifact.packaging == 'pom':
+                                pom_count += 1
+
+                        # 并发下载
+                        batch_stats = self._download_artifacts_parallel(project_id, repository_name, unique_artifacts, pbar)
+                        stats["total_artifacts"] += batch_stats["total_artifacts"]
+                        stats["downloaded"] += batch_stats["downloaded"]
+                        stats["failed"] += batch_stats["failed"]
+                        stats["failed_files"].extend(batch_stats["failed_files"])
+            finally:
+                stop_listing.set()
+
+            producer.join()
+
+            if found_count:
+                logger.info(f"Found {found_count} artifacts in repository: {repository_name}")
+                logger.info(f"📊 Artifact types: {jar_count} JAR files, {pom_count} POM files")
+                logger.info(f"After filtering duplicate files: {stats['total_artifacts']} unique artifacts")
             else:
                 logger.warning(f"No artifacts found in repository: {repository_name}")
-                return {"total_artifacts": 0, "downloaded": 0, "failed": 0, "failed_files": []}
+
+            return stats
 
         except Exception as e:
             logger.error(f"Error downloading artifacts from repository {repository_name}: {e}")
-            return {"total_artifacts": 0, "downloaded": 0, "failed": 0, "failed_files": []}
+            return stats
 
-    def _filter_duplicate_files(self, artifacts: List[MavenArtifact]) -> List[MavenArtifact]:
+    def _filter_duplicate_files(self, artifacts: List[MavenArtifact],
+                                seen_keys: Optional[Set[Tuple[str, str, str, str]]] = None) -> List[MavenArtifact]:
         """
         过滤完全相同的制品文件，保留所有版本
 
         Args:
             artifacts: 原始制品列表
+            seen_keys: 已出现过的制品坐标集合，分批过滤时传入同一集合实现跨批次去重
 
         Returns:
             过滤后的制品列表
         """
-        seen_files = set()
+        if seen_keys is None:
+            seen_keys = set()
         unique_artifacts = []
 
+        # 使用完整的坐标（包括版本）元组作为唯一标识，保留首次出现的制品
         for artifact in artifacts:
-            # 使用完整的坐标（包括版本）作为唯一标识
-            file_key = f"{artifact.group_id}:{artifact.artifact_id}:{artifact.version}:{artifact.packaging}"
-
-            if file_key not in seen_files:
-                seen_files.add(file_key)
+            file_key = (artifact.group_id, artifact.artifact_id, artifact.version, artifact.packaging)
+            if file_key not in seen_keys:
+                seen_keys.add(file_key)
                 unique_artifacts.append(artifact)
 
         return unique_artifacts
@@ -190,21 +310,14 @@ class MavenDownloader:
         """
         try:
             # 简单的版本号比较，可以扩展为更复杂的语义版本比较
-            v1_parts = [int(x) for x in version1.split('.') if x.isdigit()]
-            v2_parts = [int(x) for x in version2.split('.') if x.isdigit()]
-
-            # 补齐长度
-            max_len = max(len(v1_parts), len(v2_parts))
-            v1_parts.extend([0] * (max_len - len(v1_parts)))
-            v2_parts.extend([0] * (max_len - len(v2_parts)))
-
-            return v1_parts > v2_parts
+            return _parse_version(version1) > _parse_version(version2)
 
         except (ValueError, AttributeError):
             # 如果无法解析为数字，则使用字符串比较
             return version1 > version2
 
-    def _download_artifacts_parallel(self, project_id: int, repository_name: str, artifacts: List[MavenArtifact]) -> Dict[str, Any]:
+    def _download_artifacts_parallel(self, project_id: int, repository_name: str, artifacts: List[MavenArtifact],
+                                     pbar: Optional[tqdm] = None) -> Dict[str, Any]:
         """
         并发下载制品
 
@@ -212,6 +325,7 @@ class MavenDownloader:
             project_id: 项目 ID
             repository_name: 仓库名称
             artifacts: 制品列表
+            pbar: 共用的进度条，为 None 时创建新的进度条
 
         Returns:
             下载结果统计
@@ -227,28 +341,21 @@ class MavenDownloader:
         project_download_path = self.download_path / repository_name
         project_download_path.mkdir(parents=True, exist_ok=True)
 
-        def download_single_artifact(artifact: MavenArtifact) -> bool:
+        def download_single_artifact(artifact: MavenArtifact, local_path: Path) -> bool:
             """下载单个制品"""
             try:
-                # 构建本地文件路径
-                local_path = self._build_local_path(project_download_path, artifact)
-
-                # 如果文件已存在，跳过
-                if local_path.exists() and local_path.stat().st_size > 0:
-                    logger.debug(f"File already exists, skipping: {local_path}")
+                # 清单中记录为已完整下载、且磁盘上大小一致的文件直接跳过
+                if self._is_downloaded(local_path):
+                    logger.debug(f"File already downloaded, skipping: {local_path}")
                     return True
 
-                # 创建目录
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-
                 # 下载文件，如果存在 download_url 则使用它
-                download_url = getattr(artifact, 'download_url', None)
                 success = self.client.download_artifact(
                     project_id,
                     repository_name,
                     artifact.file_path,
                     str(local_path),
-                    download_url
+                    artifact.download_url
                 )
 
                 if success:
@@ -262,37 +369,180 @@ class MavenDownloader:
                 logger.error(f"Error downloading {artifact.file_path}: {e}")
                 return False
 
+        # 按下载主机和 group 排序，使连续的请求落在同一主机上，提高长连接复用率
+        artifacts = sorted(artifacts, key=lambda a: (urlsplit(a.download_url or '').netloc, a.group_id))
+
+        base_str = str(project_download_path)
+        local_paths = [self._build_local_path(base_str, artifact) for artifact in artifacts]
+
+        # 下载前按目录深度串行创建所有目标目录，避免下载线程并发争抢目录创建
+        target_dirs = {local_path.parent for local_path in local_paths}
+        for directory in sorted(target_dirs, key=lambda d: len(d.parts)):
+            self._ensure_dir(directory)
+
+        # 下载失败的 (制品, 本地路径)，主流程结束后统一重试
+        failed = []
+
+        if pbar is not None:
+            pbar.total = (pbar.total or 0) + len(artifacts)
+            progress = nullcontext(pbar)
+        else:
+            # miniters/mininterval 让 tqdm 合并刷新，避免每个小文件都触发终端输出
+            progress = tqdm(total=len(artifacts), desc=f"Downloading {repository_name}", miniters=32, mininterval=0.25)
+
         # 使用线程池并发下载
-        with tqdm(total=len(artifacts), desc=f"Downloading {repository_name}") as pbar:
+        with progress as pbar:
             with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.parallel_downloads) as executor:
-                # 提交所有下载任务
-                future_to_artifact = {
-                    executor.submit(download_single_artifact, artifact): artifact
-                    for artifact in artifacts
-                }
-
-                # 处理完成的任务
-                for future in concurrent.futures.as_completed(future_to_artifact):
-                    artifact = future_to_artifact[future]
+                # 按提交顺序获取结果，省去逐个 future 的映射和完成通知开销
+                # （download_single_artifact 内部捕获所有异常，结果迭代不会中断）
+                results = executor.map(download_single_artifact, artifacts, local_paths)
 
-                    try:
-                        success = future.result()
-                        if success:
-                            stats["downloaded"] += 1
-                        else:
-                            stats["failed"] += 1
-                            stats["failed_files"].append(artifact.file_path)
-
-                    except Exception as e:
-                        logger.error(f"Download failed for {artifact.file_path}: {e}")
-                        stats["failed"] += 1
-                        stats["failed_files"].append(artifact.file_path)
+                for artifact, local_path, success in zip(artifacts, local_paths, results):
+                    if success:
+                        stats["downloaded"] += 1
+                        self._record_download(local_path)
+                    else:
+                        failed.append((artifact, local_path))
 
                     pbar.update(1)
 
+        # 对失败的下载以较低并发、指数退避重试，挽回瞬时网络错误导致的失败
+        for delay in _RETRY_DELAYS:
+            if not failed:
+                break
+
+            logger.info(f"Retrying {len(failed)} failed downloads from {repository_name} in {delay}s")
+            time.sleep(delay)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(_RETRY_WORKERS, len(failed))) as executor:
+                results = list(executor.map(lambda item: download_single_artifact(*item), failed))
+
+            still_failed = []
+            for (artifact, local_path), success in zip(failed, results):
+                if success:
+                    stats["downloaded"] += 1
+                    self._record_download(local_path)
+                else:
+                    still_failed.append((artifact, local_path))
+            failed = still_failed
+
+        stats["failed"] = len(failed)
+        stats["failed_files"] = [artifact.file_path for artifact, _ in failed]
+
+        self._save_manifest()
         return stats
 
-    def _build_local_path(self, base_path: Path, artifact: MavenArtifact) -> Path:
+    def _ensure_dir(self, directory: Path) -> None:
+        """
+        确保目录存在，已创建过的目录直接跳过
+
+        Args:
+            directory: 目录路径
+        """
+        dir_key = str(directory)
+        if dir_key in self._ensured_dirs:
+            return
+
+        with self._ensured_lock:
+            if dir_key not in self._ensured_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(dir_key)
+
+    def _manifest_key(self, local_path: Path) -> str:
+        """
+        获取文件在清单中的键
+
+        Args:
+            local_path: 本地文件路径
+
+        Returns:
+            相对下载目录的 POSIX 路径
+        """
+        return local_path.relative_to(self.download_path).as_posix()
+
+    def _load_manifest(self) -> Dict[str, int]:
+        """
+        加载已下载文件清单
+
+        Returns:
+            清单字典，文件不存在或损坏时返回空字典
+        """
+        try:
+            if self.manifest_file.exists():
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                logger.info(f"Loaded download manifest with {len(manifest)} entries")
+                return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load download manifest: {e}")
+        return {}
+
+    def _is_downloaded(self, local_path: Path) -> bool:
+        """
+        文件是否已完整下载：清单中有记录且磁盘上的文件大小与记录一致
+
+        文件已被删除或大小不符（如被截断）时从清单中移除记录，之后重新下载。
+
+        Args:
+            local_path: 本地文件路径
+
+        Returns:
+            是否可以跳过下载
+        """
+        key = self._manifest_key(local_path)
+        recorded_size = self._manifest.get(key)
+        if recorded_size is None:
+            return False
+
+        try:
+            if local_path.stat().st_size == recorded_size:
+                return True
+        except FileNotFoundError:
+            pass
+
+        with self._manifest_lock:
+            if self._manifest.pop(key, None) is not None:
+                self._manifest_pending += 1
+        return False
+
+    def _record_download(self, local_path: Path) -> None:
+        """
+        在清单中记录下载完成的文件，并按间隔批量落盘
+
+        Args:
+            local_path: 本地文件路径
+        """
+        key = self._manifest_key(local_path)
+        if key in self._manifest:
+            return
+
+        try:
+            size = local_path.stat().st_size
+        except OSError:
+            return
+
+        with self._manifest_lock:
+            self._manifest[key] = size
+            self._manifest_pending += 1
+            if self._manifest_pending >= _MANIFEST_SAVE_INTERVAL:
+                self._save_manifest()
+
+    def _save_manifest(self) -> None:
+        """将清单原子地写入磁盘"""
+        with self._manifest_lock:
+            if not self._manifest_pending:
+                return
+
+            try:
+                tmp_file = self.manifest_file.with_suffix('.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._manifest, f, ensure_ascii=False)
+                os.replace(tmp_file, self.manifest_file)
+                self._manifest_pending = 0
+            except OSError as e:
+                logger.error(f"Failed to save download manifest: {e}")
+
+    def _build_local_path(self, base_path: str, artifact: MavenArtifact) -> Path:
         """
         构建本地文件路径，保持 Maven 仓库结构
 
@@ -303,8 +553,8 @@ class MavenDownloader:
         Returns:
             本地文件路径
         """
-        # 转换 group_id 的点号为路径分隔符
-        group_path = artifact.group_id.replace('.', '/')
+        # 转换 group_id 的点号为路径分隔符（同一 group 下的制品共享缓存结果）
+        group_path = _group_path(artifact.group_id)
 
         # 构建文件名
         if artifact.packaging == "pom":
@@ -314,22 +564,30 @@ class MavenDownloader:
         else:
             filename = f"{artifact.artifact_id}-{artifact.version}.{artifact.packaging}"
 
-        return base_path / group_path / artifact.artifact_id / artifact.version / filename
+        # 一次字符串拼接，避免逐段构造中间 Path 对象
+        return Path(os.path.join(base_path, group_path, artifact.artifact_id, artifact.version, filename))
 
-    def get_downloaded_files(self) -> List[Path]:
+    def get_downloaded_files(self, pattern: Optional[str] = None) -> Iterator[Path]:
         """
-        获取已下载的文件列表
+        逐个获取已下载的文件
+
+        Args:
+            pattern: 文件名匹配模式（如 "*.pom"），为 None 时返回所有文件
 
         Returns:
-            已下载文件路径列表
+            已下载文件路径迭代器
         """
-        downloaded_files = []
-
-        for file_path in self.download_path.rglob('*'):
-            if file_path.is_file():
-                downloaded_files.append(file_path)
-
-        return downloaded_files
+        stack = [str(self.download_path)]
+
+        # 使用 os.scandir 遍历，DirEntry 的类型判断来自目录读取结果，无需逐个 stat
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and not entry.name.startswith('.'):
+                        if pattern is None or fnmatch.fnmatchcase(entry.name, pattern):
+                            yield Path(entry.path)
 
     def download_repository_artifacts_with_fallback(self, project_id: int, repository_name: str) -> Dict[str, Any]:
         """
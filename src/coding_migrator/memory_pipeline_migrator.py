@@ -2,16 +2,14 @@
 内存流流水线迁移器 - 零磁盘占用的边下载边上传迁移
 """
 
-import os
 import json
-import hashlib
 import logging
 import threading
-import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from queue import Queue, Empty
+from collections import defaultdict
 from dataclasses import dataclass, field
 from tqdm import tqdm
 import time
@@ -19,11 +17,30 @@ import io
 
 from .models import MavenArtifact, MigrationConfig
 from .coding_client import CodingClient
-from .nexus_uploader import NexusUploader
+from .nexus_uploader import NexusUploader, _file_path_to_maven_path
 
 
 logger = logging.getLogger(__name__)
 
+# 内存配额的最小单位（1 MiB）
+_MEMORY_SLOT_SIZE = 1024 * 1024
+
+# 单个文件上传的最大尝试次数（5xx 和网络错误时退避重试）
+_UPLOAD_ATTEMPTS = 3
+
+# 并发获取仓库制品列表的最大线程数
+_MAX_LISTING_WORKERS = 8
+
+# 大小未知时视为较大文件的扩展名
+_BINARY_SUFFIXES = ('.jar', '.war', '.ear', '.aar', '.zip')
+
+
+def _size_hint(artifact: MavenArtifact) -> int:
+    """估算制品大小，用于大文件优先调度（大小未知时按扩展名粗略估计）"""
+    if artifact.size is not None:
+        return artifact.size
+    return 1 if artifact.file_path.endswith(_BINARY_SUFFIXES) else 0
+
 
 @dataclass
 class MemoryMigrationTask:
@@ -34,33 +51,40 @@ class MemoryMigrationTask:
     upload_success: bool = False
     error_message: Optional[str] = None
     file_data: Optional[bytes] = None
+    memory_slots: int = 0  # 占用的内存配额单位数，上传完成后释放
     created_time: float = field(default_factory=time.time)  # 任务创建时间
 
 
 class MemoryPipelineMigrator:
     """内存流流水线迁移器 - 零磁盘占用"""
 
-    def __init__(self, config: MigrationConfig):
+    def __init__(self, config: MigrationConfig, coding_client: Optional[CodingClient] = None,
+                 nexus_uploader: Optional[NexusUploader] = None):
         """
         初始化内存流水线迁移器
 
         Args:
             config: 迁移配置
+            coding_client: 共享的 CODING 客户端，未提供时新建
+            nexus_uploader: 共享的 Nexus 上传器，未提供时新建
         """
         self.config = config
-        self.coding_client = CodingClient(
+        self.coding_client = coding_client or CodingClient(
             config.coding_token,
             config.coding_team_id,
             config.maven_repositories,
             config.pagination,
             config.performance.max_workers,
-            requests_per_second=config.rate_limit.requests_per_second
+            requests_per_second=config.rate_limit.requests_per_second,
+            http2=config.performance.http2,
+            pool_maxsize=config.performance.http_pool_maxsize,
+            pool_block=config.performance.http_pool_block
         )
-        self.nexus_uploader = NexusUploader(config)
+        self.nexus_uploader = nexus_uploader or NexusUploader(config)
 
         # 性能配置
         self.download_workers = config.performance.max_workers
-        self.upload_workers = min(config.performance.max_workers // 2, 5)
+        self.upload_workers = config.performance.upload_workers or config.performance.max_workers
 
         # 任务队列
         self.upload_queue = Queue(maxsize=50)  # 减小队列大小，减少内存占用
@@ -76,6 +100,8 @@ class MemoryPipelineMigrator:
             'upload_failed': 0,
             'skipped_existing': 0
         }
+        # 多个下载/上传线程同时更新统计，计数需在锁内完成（dict 的 += 不是原子操作）
+        self.stats_lock = threading.Lock()
 
         # 控制标志
         self.stop_event = threading.Event()
@@ -86,17 +112,25 @@ class MemoryPipelineMigrator:
 
         # 内存监控
         self.last_memory_check = time.time()
-        self.memory_check_interval = 30  # 每30秒检查一次内存
+        self.memory_check_interval = 300  # 每5分钟记录一次内存统计
 
         # 迁移记录文件和依赖列表（将在migrate_project中初始化）
         self.record_file = None
-        self.uploaded_hashes: Set[str] = set()
+        self.uploaded_keys: Set[Tuple[str, str, str, str]] = set()
         self.uploaded_dependencies = []
+        # 按 groupId:artifactId 分组的已上传依赖，随上传增量维护，供最终汇总使用
+        self.grouped_dependencies: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        # 迁移记录追加日志：每次上传成功追加一行，结束时合并为快照
+        self.record_journal = None
+        self.records_lock = threading.Lock()
 
-        # 内存限制（单位：字节）
-        self.max_memory_usage = 100 * 1024 * 1024  # 100MB
-        self.current_memory_usage = 0
-        self.memory_lock = threading.Lock()
+        # 内存限制：按 1 MiB 划分配额，下载前按列出的大小预留、上传完成后释放，
+        # 配额不足时下载线程阻塞等待，无需轮询
+        self.memory_slot_capacity = max(1, config.performance.memory_limit_mb)
+        self.memory_slots = threading.BoundedSemaphore(self.memory_slot_capacity)
+        # 多个配额必须一次性获取，避免多个线程各持有部分配额而互相等待
+        self.memory_acquire_lock = threading.Lock()
 
         # POM 文件追踪和调试
         self.pom_stats = {
@@ -141,6 +175,16 @@ class MemoryPipelineMigrator:
         except Exception as e:
             logger.error(f"Failed to initialize failed logs: {e}")
 
+    def _increment(self, key: str) -> None:
+        """
+        线程安全地将统计项加一
+
+        Args:
+            key: 统计项名称
+        """
+        with self.stats_lock:
+            self.stats[key] += 1
+
     def _log_failed_download(self, artifact: MavenArtifact, error_message: str) -> None:
         """记录下载失败的依赖路径"""
         try:
@@ -173,49 +217,168 @@ class MemoryPipelineMigrator:
         except Exception as e:
             logger.error(f"Failed to log upload failure: {e}")
 
+    def _journal_path(self) -> Path:
+        """迁移记录追加日志路径（与快照文件同名，扩展名为 .jsonl）"""
+        return self.record_file.with_suffix('.jsonl')
+
     def _load_migration_records(self) -> None:
-        """加载已迁移记录"""
+        """加载已迁移记录（快照 + 上次中断时留下的追加日志），并打开追加日志"""
         try:
+            self.uploaded_keys = set()
+            self.uploaded_dependencies = []
+
             if self.record_file.exists():
                 with open(self.record_file, 'r', encoding='utf-8') as f:
                     records = json.load(f)
-                    self.uploaded_hashes = set(records.get('uploaded_hashes', []))
+                    self.uploaded_keys = {tuple(key) for key in records.get('uploaded_keys', [])}
                     self.uploaded_dependencies = records.get('uploaded_dependencies', [])
-                logger.info(f"Loaded {len(self.uploaded_hashes)} migration records")
-                if self.uploaded_dependencies:
-                    logger.info(f"Previously uploaded {len(self.uploaded_dependencies)} dependencies")
+                    # 旧格式只保存了坐标的 MD5（uploaded_hashes），由依赖信息还原坐标
+                    if 'uploaded_keys' not in records:
+                        self.uploaded_keys.update(self._dependency_key(dep) for dep in self.uploaded_dependencies)
+
+            journal_path = self._journal_path()
+            if journal_path.exists():
+                with open(journal_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # 中断时写了一半的行
+                        self.uploaded_keys.add(tuple(entry['k']) if 'k' in entry else self._dependency_key(entry['dep']))
+                        self.uploaded_dependencies.append(entry['dep'])
+
+            self.grouped_dependencies = defaultdict(list)
+            for dep in self.uploaded_dependencies:
+                self.grouped_dependencies[f"{dep['group_id']}:{dep['artifact_id']}"].append(dep)
+
+            if self.uploaded_keys:
+                logger.info(f"Loaded {len(self.uploaded_keys)} migration records")
+            if self.uploaded_dependencies:
+                logger.info(f"Previously uploaded {len(self.uploaded_dependencies)} dependencies")
         except Exception as e:
             logger.warning(f"Failed to load migration records: {e}")
-            self.uploaded_hashes = set()
+            self.uploaded_keys = set()
             self.uploaded_dependencies = []
+            self.grouped_dependencies = defaultdict(list)
 
-    def _save_migration_records(self) -> None:
-        """保存迁移记录"""
         try:
+            self.record_journal = open(self._journal_path(), 'a', encoding='utf-8', buffering=1)
+        except OSError as e:
+            logger.warning(f"Failed to open migration record journal: {e}")
+            self.record_journal = None
+
+    def _append_migration_record(self, key: Tuple[str, str, str, str], dependency_info: Dict[str, Any]) -> None:
+        """
+        向追加日志写入一条上传成功记录
+
+        Args:
+            key: Maven 坐标 (groupId, artifactId, version, packaging)
+            dependency_info: 已上传依赖信息
+        """
+        if self.record_journal is None:
+            return
+        line = json.dumps({'k': key, 'dep': dependency_info}, ensure_ascii=False) + '\n'
+        try:
+            with self.records_lock:
+                self.record_journal.write(line)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to append migration record: {e}")
+
+    def _save_migration_records(self) -> None:
+        """保存迁移记录快照，快照写入成功后删除已合并的追加日志"""
+        # 在锁内关闭追加日志并复制记录，避免上传线程并发修改导致迭代出错，
+        # 也避免之后的记录写入即将删除的追加日志
+        with self.records_lock:
+            if self.record_journal is not None:
+                self.record_journal.close()
+                self.record_journal = None
             records = {
-                'uploaded_hashes': list(self.uploaded_hashes),
-                'uploaded_dependencies': self.uploaded_dependencies,
+                'uploaded_keys': list(self.uploaded_keys),
+                'uploaded_dependencies': list(self.uploaded_dependencies),
                 'last_updated': time.time()
             }
+
+        try:
             with open(self.record_file, 'w', encoding='utf-8') as f:
                 json.dump(records, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved {len(self.uploaded_hashes)} migration records")
+            logger.debug(f"Saved {len(records['uploaded_keys'])} migration records")
         except Exception as e:
             logger.error(f"Failed to save migration records: {e}")
+            return
 
-    def _calculate_file_hash(self, file_data: bytes) -> str:
-        """计算文件哈希值"""
-        return hashlib.sha256(file_data).hexdigest()
+        try:
+            self._journal_path().unlink()
+        except OSError:
+            pass
 
-    def _check_if_already_uploaded(self, artifact: MavenArtifact) -> Optional[str]:
-        """检查文件是否已经上传过"""
-        # 生成唯一标识
-        identifier = f"{artifact.group_id}:{artifact.artifact_id}:{artifact.version}:{artifact.packaging}"
-        hash_identifier = hashlib.md5(identifier.encode()).hexdigest()
+    def _acquire_memory(self, size: int) -> int:
+        """
+        为指定大小的数据获取内存配额，配额不足时阻塞等待
 
-        if hash_identifier in self.uploaded_hashes:
-            return hash_identifier
-        return None
+        Args:
+            size: 数据大小（字节）
+
+        Returns:
+            获取的配额单位数
+        """
+        slots = self._memory_slots_for(size)
+        with self.memory_acquire_lock:
+            for _ in range(slots):
+                self.memory_slots.acquire()
+        return slots
+
+    def _memory_slots_for(self, size: int) -> int:
+        """指定大小的数据需要的配额单位数（超过总配额的大文件按总配额计算，避免永久阻塞）"""
+        return min(self.memory_slot_capacity, max(1, (size + _MEMORY_SLOT_SIZE - 1) // _MEMORY_SLOT_SIZE))
+
+    def _adjust_memory(self, reserved: int, size: int) -> int:
+        """
+        下载完成后按实际大小调整下载前预留的配额
+
+        Args:
+            reserved: 已预留的配额单位数
+            size: 实际数据大小（字节）
+
+        Returns:
+            调整后持有的配额单位数
+        """
+        slots = self._memory_slots_for(size)
+        if slots < reserved:
+            self._release_slots(reserved - slots)
+            return slots
+        if slots > reserved:
+            # 列出的大小偏小或未知：先归还已预留的配额再一次性获取，避免持有部分配额时等待其他线程
+            self._release_slots(reserved)
+            return self._acquire_memory(size)
+        return reserved
+
+    def _release_slots(self, slots: int) -> None:
+        """归还指定数量的配额单位"""
+        for _ in range(slots):
+            self.memory_slots.release()
+
+    def _release_memory(self, task: MemoryMigrationTask) -> None:
+        """
+        释放任务占用的内存数据和配额
+
+        Args:
+            task: 迁移任务
+        """
+        task.file_data = None
+        slots, task.memory_slots = task.memory_slots, 0
+        self._release_slots(slots)
+
+    @staticmethod
+    def _dependency_key(dependency_info: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """由已上传依赖信息生成 Maven 坐标键"""
+        return (dependency_info.get('group_id'), dependency_info.get('artifact_id'),
+                dependency_info.get('version'), dependency_info.get('packaging'))
+
+    def _check_if_already_uploaded(self, artifact: MavenArtifact) -> bool:
+        """检查文件是否已经上传过（本地迁移记录或目标仓库的资源索引）"""
+        if (artifact.group_id, artifact.artifact_id, artifact.version, artifact.packaging) in self.uploaded_keys:
+            return True
+        return self.nexus_uploader.is_indexed_asset(self._convert_to_maven_path(artifact))
 
     def migrate_project(self, project_id: int, project_name: str) -> Dict[str, Any]:
         """
@@ -236,6 +399,7 @@ class MemoryPipelineMigrator:
             self._load_migration_records()
 
             # 获取所有制品
+            self.coding_client.set_project_name(project_id, project_name)
             all_artifacts = self._get_all_artifacts(project_id)
             self.stats['total_artifacts'] = len(all_artifacts)
 
@@ -243,12 +407,20 @@ class MemoryPipelineMigrator:
                 logger.warning(f"No artifacts found for project: {project_name}")
                 return self.stats
 
+            # 列出目标仓库中已存在的资源（每次运行每个仓库只列出一次），本地迁移记录丢失时也能跳过；
+            # 这些资源只用于去重，不写入本项目的迁移记录
+            target_repositories = {self.nexus_uploader.determine_repository(version)
+                                   for version in {artifact.version for artifact in all_artifacts}}
+            self.nexus_uploader.prefetch_existing_assets(target_repositories)
+
             # 过滤已上传的制品
             filtered_artifacts = []
             for artifact in all_artifacts:
-                existing_hash = self._check_if_already_uploaded(artifact)
-                if existing_hash:
-                    self.stats['skipped_existing'] += 1
+                if self._check_if_already_uploaded(artifact):
+                    self._increment('skipped_existing')
+                    if artifact.file_path.endswith('.pom') or artifact.packaging == 'pom':
+                        with self.pom_lock:
+                            self.pom_stats['skipped_already_uploaded'] += 1
                     logger.debug(f"Skipping already uploaded: {artifact.file_path}")
                 else:
                     filtered_artifacts.append(artifact)
@@ -260,21 +432,32 @@ class MemoryPipelineMigrator:
                 logger.info("All artifacts have already been migrated")
                 return self.stats
 
-            # 启动下载和上传线程池
-            with ThreadPoolExecutor(max_workers=self.download_workers + self.upload_workers) as executor:
+            # 启动下载和上传线程池：下载和上传使用独立线程池，阻塞在网络上的上传线程不会占用下载的并发额度
+            with ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="dl") as dl_pool, \
+                    ThreadPoolExecutor(max_workers=self.upload_workers, thread_name_prefix="up") as up_pool:
                 # 启动上传工作线程
                 upload_futures = []
                 for i in range(self.upload_workers):
-                    future = executor.submit(self._upload_worker)
+                    future = up_pool.submit(self._upload_worker)
                     upload_futures.append(future)
 
                 # 启动下载任务
                 download_futures = []
-                progress_bar = tqdm(total=len(filtered_artifacts), desc="Memory Pipeline",
-                                  unit="files", postfix={"down": 0, "up": 0, "skip": self.stats['skipped_existing']})
-
+                progress_bar = tqdm(total=len(filtered_artifacts), desc="Memory Pipeline", unit="files",
+                                  mininterval=0.5, miniters=10, smoothing=0.1)
+                reporter_stop = threading.Event()
+                reporter = threading.Thread(target=self._stats_reporter, args=(progress_bar, reporter_stop),
+                                            name="stats-reporter", daemon=True)
+                reporter.start()
+
+                # 按 GAV 分组，同一 GAV 下的文件一起下载并通过一次请求上传
+                gav_groups: Dict[Tuple[str, str, str], List[MavenArtifact]] = {}
                 for artifact in filtered_artifacts:
-                    future = executor.submit(self._download_and_queue, artifact, progress_bar)
+                    gav_groups.setdefault((artifact.group_id, artifact.artifact_id, artifact.version), []).append(artifact)
+
+                # 大文件优先提交（LPT 调度），避免最后提交的大文件拖长收尾时间
+                for artifacts in sorted(gav_groups.values(), key=lambda group: sum(map(_size_hint, group)), reverse=True):
+                    future = dl_pool.submit(self._download_and_queue, artifacts, progress_bar)
                     download_futures.append(future)
 
                 # 等待所有下载任务完成
@@ -284,26 +467,22 @@ class MemoryPipelineMigrator:
                     except Exception as e:
                         logger.error(f"Download task failed: {e}")
 
-                # 等待上传队列清空
-                logger.info("Waiting for upload queue to empty...")
-                queue_wait_count = 0
-                max_queue_wait = 600  # 最大等待60秒
-                while not self.upload_queue.empty() and queue_wait_count < max_queue_wait:
-                    queue_wait_count += 1
-                    if queue_wait_count % 50 == 0:  # 每5秒打印一次
-                        logger.info(f"Upload queue size: {self.upload_queue.qsize()}, waiting... ({queue_wait_count * 0.1:.1f}s)")
-                    time.sleep(0.1)
-
-                if not self.upload_queue.empty():
-                    logger.warning(f"Upload queue not empty after timeout, {self.upload_queue.qsize()} items remaining")
+                # 等待上传队列中的任务全部处理完成（上传线程对每个任务调用 task_done）
+                logger.info(f"Waiting for upload queue to drain ({self.upload_queue.qsize()} queued)...")
+                self.upload_queue.join()
 
-                # 停止上传工作线程
-                self.stop_event.set()
+                # 为每个上传线程放入结束标记，唤醒阻塞在 get() 上的线程
+                for _ in range(self.upload_workers):
+                    self.upload_queue.put(None)
 
                 # 等待上传线程完成
                 for future in upload_futures:
                     future.result()
 
+                self.stop_event.set()
+
+                reporter_stop.set()
+                reporter.join()
                 progress_bar.close()
 
         except Exception as e:
@@ -347,14 +526,7 @@ class MemoryPipelineMigrator:
         logger.info("=" * 60)
 
         # 按group_id和artifact_id分组显示
-        grouped_deps = {}
-        for dep in self.uploaded_dependencies:
-            key = f"{dep['group_id']}:{dep['artifact_id']}"
-            if key not in grouped_deps:
-                grouped_deps[key] = []
-            grouped_deps[key].append(dep)
-
-        for group_key, deps in sorted(grouped_deps.items()):
+        for group_key, deps in sorted(self.grouped_dependencies.items()):
             logger.info(f"📋 {group_key}")
             for dep in sorted(deps, key=lambda x: x['version']):
                 logger.info(f"   🏷️  {dep['version']} ({dep['packaging']}) - {dep['repository']}")
@@ -372,67 +544,119 @@ class MemoryPipelineMigrator:
 
         # 获取制品仓库
         repositories = self.coding_client.get_artifact_repositories(project_id)
-        maven_repos = [repo for repo in repositories if repo.get('Type') == 3]
+        maven_repos = [repo for repo in repositories if repo.get('_normalized_type') == 'maven']
+
+        if not maven_repos:
+            return all_artifacts
+
+        # 各仓库的制品列表互不依赖，并发获取；每个仓库内部还会并发查询版本文件，
+        # 按总并发数扩大 API 会话的连接池，避免超出的连接用完即弃、反复重新握手
+        listing_workers = min(_MAX_LISTING_WORKERS, len(maven_repos))
+        self.coding_client.ensure_pool_size(listing_workers * self.config.performance.max_workers)
+        with ThreadPoolExecutor(max_workers=listing_workers) as executor:
+            for artifacts in executor.map(
+                    lambda repo: self._get_repository_artifacts(project_id, project_name, repo.get('Name', '')),
+                    maven_repos):
+                all_artifacts.extend(artifacts)
 
-        for repo in maven_repos:
-            repo_name = repo.get('Name', '')
-            logger.info(f"Processing repository: {repo_name}")
+        # 同一文件可能出现在多个仓库中（如快照/发布镜像），目标路径相同，只迁移第一次出现的
+        seen: Dict[str, MavenArtifact] = {}
+        unique_artifacts = [artifact for artifact in all_artifacts
+                            if seen.setdefault(artifact.maven_path, artifact) is artifact]
+        if len(unique_artifacts) < len(all_artifacts):
+            logger.info(f"Skipped {len(all_artifacts) - len(unique_artifacts)} duplicate artifacts "
+                        f"listed in more than one repository")
 
-            try:
-                artifacts = self.coding_client.get_maven_artifacts(
-                    project_id, repo_name, self.config.maven_filter
-                )
-                all_artifacts.extend(artifacts)
-                logger.info(f"Found {len(artifacts)} artifacts in repository: {repo_name}")
+        return unique_artifacts
 
-                # 统计POM文件
-                pom_artifacts = [art for art in artifacts if art.file_path.endswith('.pom')]
-                with self.pom_lock:
-                    self.pom_stats['discovered_in_coding'] += len(pom_artifacts)
+    def _get_repository_artifacts(self, project_id: int, project_name: str, repo_name: str) -> List[MavenArtifact]:
+        """获取单个仓库的制品（失败时记录错误并返回空列表，不影响其他仓库）"""
+        logger.info(f"Processing repository: {repo_name}")
 
-                if pom_artifacts:
-                    logger.info(f"Found {len(pom_artifacts)} POM files in repository {repo_name}")
-                    # 记录前几个POM文件用于调试
-                    for i, pom in enumerate(pom_artifacts[:3]):
-                        logger.info(f"  POM {i+1}: {pom.group_id}:{pom.artifact_id}:{pom.version} ({pom.file_path})")
-                    if len(pom_artifacts) > 3:
-                        logger.info(f"  ... and {len(pom_artifacts) - 3} more POM files")
+        try:
+            artifacts = self.coding_client.get_maven_artifacts(
+                project_id, repo_name, self.config.maven_filter
+            )
+        except Exception as e:
+            logger.error(f"Failed to get artifacts from repository {repo_name}: {e}")
+            return []
+
+        # 记录项目、仓库信息和 Maven 路径，下载和上传时直接使用
+        for artifact in artifacts:
+            artifact.project_name = project_name
+            artifact.project_id = project_id
+            if not artifact.repository:
+                artifact.repository = repo_name
+            artifact.maven_path = self._convert_to_maven_path(artifact)
+        logger.info(f"Found {len(artifacts)} artifacts in repository: {repo_name}")
+
+        # 统计POM文件
+        pom_artifacts = [art for art in artifacts if art.file_path.endswith('.pom')]
+        with self.pom_lock:
+            self.pom_stats['discovered_in_coding'] += len(pom_artifacts)
 
-            except Exception as e:
-                logger.error(f"Failed to get artifacts from repository {repo_name}: {e}")
+        if pom_artifacts:
+            logger.info(f"Found {len(pom_artifacts)} POM files in repository {repo_name}")
+            # 记录前几个POM文件用于调试
+            for i, pom in enumerate(pom_artifacts[:3]):
+                logger.info(f"  POM {i+1}: {pom.group_id}:{pom.artifact_id}:{pom.version} ({pom.file_path})")
+            if len(pom_artifacts) > 3:
+                logger.info(f"  ... and {len(pom_artifacts) - 3} more POM files")
 
-        return all_artifacts
+        return artifacts
 
-    def _download_and_queue(self, artifact: MavenArtifact, progress_bar: tqdm) -> bool:
+    def _download_and_queue(self, artifacts: List[MavenArtifact], progress_bar: tqdm) -> bool:
         """
-        下载制品到内存并加入上传队列
+        下载同一 GAV 下的制品到内存，并作为一组加入上传队列
 
         Args:
-            artifact: 制品信息
+            artifacts: 同一 GAV 下的制品列表
             progress_bar: 进度条
 
         Returns:
-            下载是否成功
+            是否有制品下载成功并入队
         """
         if self.stop_event.is_set():
             return False
 
-        # 检查是否已经上传过
-        existing_hash = self._check_if_already_uploaded(artifact)
-        if existing_hash:
-            # POM文件特殊处理
-            if artifact.file_path.endswith('.pom') or artifact.packaging == 'pom':
-                with self.pom_lock:
-                    self.pom_stats['skipped_already_uploaded'] += 1
-                logger.info(f"⏭️  SKIP POM: {artifact.group_id}:{artifact.artifact_id}:{artifact.version} already uploaded")
-            else:
-                logger.info(f"⏭️  SKIP: {artifact.group_id}:{artifact.artifact_id}:{artifact.version} already uploaded")
-            self.stats['skipped_existing'] += 1
-            progress_bar.set_postfix({"down": self.stats['downloaded'],
-                                       "up": self.stats['uploaded'],
-                                       "skip": self.stats['skipped_existing']})
-            return True
+        # 下载前按列出的文件大小整组预留内存配额（配额不足时阻塞，直到上传线程释放），
+        # 同时下载中的数据总量受内存上限约束
+        reserved = self._acquire_memory(sum(artifact.size or 0 for artifact in artifacts))
+
+        tasks = []
+        for artifact in artifacts:
+            task = self._download_task(artifact)
+            if task is not None:
+                tasks.append(task)
+
+        # 整组更新进度条（统计信息由后台线程定期刷新）
+        progress_bar.update(len(artifacts))
+
+        if not tasks:
+            self._release_slots(reserved)
+            return False
 
+        # 按实际大小调整配额，配额记在第一个任务上
+        tasks[0].memory_slots = self._adjust_memory(reserved, sum(len(task.file_data) for task in tasks))
+
+        # 加入上传队列，之后由上传线程负责释放内存：队列满时一直阻塞，由上传速度对下载形成背压；
+        # 不设超时，避免上传较慢时已下载成功的制品被误记为失败
+        self.upload_queue.put(tasks if len(tasks) > 1 else tasks[0])
+
+        logger.debug(f"Downloaded and queued {len(tasks)} files for "
+                     f"{tasks[0].artifact.group_id}:{tasks[0].artifact.artifact_id}:{tasks[0].artifact.version}")
+        return True
+
+    def _download_task(self, artifact: MavenArtifact) -> Optional[MemoryMigrationTask]:
+        """
+        下载单个制品到内存
+
+        Args:
+            artifact: 制品信息
+
+        Returns:
+            下载成功的迁移任务，下载失败时返回 None
+        """
         task = MemoryMigrationTask(artifact=artifact)
 
         try:
@@ -447,37 +671,19 @@ class MemoryPipelineMigrator:
                 if hasattr(artifact, 'download_url') and artifact.download_url:
                     logger.info(f"  Download URL: {artifact.download_url}")
 
-            # 定期内存检查和清理
+            # 定期记录内存统计
             current_time = time.time()
             if current_time - self.last_memory_check > self.memory_check_interval:
-                self._check_and_cleanup_memory()
+                self._log_memory_stats()
                 self.last_memory_check = current_time
 
-            # 检查内存使用限制
-            with self.memory_lock:
-                if self.current_memory_usage > self.max_memory_usage:
-                    logger.warning(f"Memory usage limit reached: {self.current_memory_usage}/{self.max_memory_usage} bytes, waiting...")
-                    wait_count = 0
-                    max_wait_time = 300  # 最大等待30秒
-                    while self.current_memory_usage > self.max_memory_usage * 0.5:
-                        wait_count += 1
-                        if wait_count % 10 == 0:  # 每1秒打印一次
-                            logger.info(f"Waiting for memory release: {self.current_memory_usage}/{self.max_memory_usage} bytes (waited {wait_count * 0.1:.1f}s)")
-                        if wait_count >= max_wait_time:  # 超时保护
-                            logger.error(f"Memory wait timeout after {max_wait_time * 0.1:.1f}s, forcing continue")
-                            # 强制清理一些内存：清理失败的任务
-                            self._emergency_memory_cleanup()
-                            break
-                        time.sleep(0.1)
-
             # 下载文件到内存
             file_data = self._download_to_memory(artifact)
 
             if file_data:
                 task.file_data = file_data
-                task.file_hash = self._calculate_file_hash(file_data)
                 task.download_success = True
-                self.stats['downloaded'] += 1
+                self._increment('downloaded')
 
                 # POM文件下载成功统计
                 if is_pom_file:
@@ -485,56 +691,25 @@ class MemoryPipelineMigrator:
                         self.pom_stats['download_success'] += 1
                     logger.info(f"✅ POM DOWNLOAD SUCCESS: {artifact.group_id}:{artifact.artifact_id}:{artifact.version}")
                     logger.info(f"  File size: {len(file_data)} bytes")
-                    logger.info(f"  File hash: {task.file_hash[:16]}...")
-
-                # 更新内存使用量
-                with self.memory_lock:
-                    self.current_memory_usage += len(file_data)
-
-                # 加入上传队列
-                try:
-                    self.upload_queue.put(task, timeout=30)
-                except Exception as queue_error:
-                    logger.error(f"Failed to add task to upload queue: {queue_error}")
-                    task.error_message = f"Queue error: {queue_error}"
-                    self.stats['upload_failed'] += 1
-                    self.failed_tasks.append(task)
-
-                    # 记录上传失败到日志文件（队列错误也算上传失败）
-                    maven_path = self._convert_to_maven_path(artifact)
-                    self._log_failed_upload(artifact, maven_path, task.error_message)
-
-                    # POM文件队列失败统计
-                    if is_pom_file:
-                        with self.pom_lock:
-                            self.pom_stats['upload_failed'] += 1
-                        logger.error(f"❌ POM QUEUE FAILED: {artifact.group_id}:{artifact.artifact_id}:{artifact.version} - {queue_error}")
-                    # 释放内存
-                    with self.memory_lock:
-                        self.current_memory_usage -= len(file_data)
-                    logger.debug(f"Released memory due to queue error: {len(file_data)} bytes, current usage: {self.current_memory_usage}")
-                    task.file_data = None
-                    return False
 
-                logger.debug(f"Downloaded and queued: {artifact.file_path} ({len(file_data)} bytes)")
+                return task
 
-            else:
-                task.error_message = "Download failed"
-                self.stats['download_failed'] += 1
-                self.failed_tasks.append(task)
+            task.error_message = "Download failed"
+            self._increment('download_failed')
+            self.failed_tasks.append(task)
 
-                # 记录下载失败到日志文件
-                self._log_failed_download(artifact, task.error_message)
+            # 记录下载失败到日志文件
+            self._log_failed_download(artifact, task.error_message)
 
-                # POM文件下载失败统计
-                if is_pom_file:
-                    with self.pom_lock:
-                        self.pom_stats['download_failed'] += 1
-                    logger.error(f"❌ POM DOWNLOAD FAILED: {artifact.group_id}:{artifact.artifact_id}:{artifact.version} - {task.error_message}")
+            # POM文件下载失败统计
+            if is_pom_file:
+                with self.pom_lock:
+                    self.pom_stats['download_failed'] += 1
+                logger.error(f"❌ POM DOWNLOAD FAILED: {artifact.group_id}:{artifact.artifact_id}:{artifact.version} - {task.error_message}")
 
         except Exception as e:
             task.error_message = str(e)
-            self.stats['download_failed'] += 1
+            self._increment('download_failed')
             self.failed_tasks.append(task)
 
             # 记录下载失败到日志文件
@@ -542,130 +717,27 @@ class MemoryPipelineMigrator:
 
             logger.error(f"Failed to download {artifact.file_path}: {e}")
 
-        # 确保在所有情况下都清理内存
-        if hasattr(task, 'file_data') and task.file_data is not None:
-            with self.memory_lock:
-                self.current_memory_usage -= len(task.file_data)
-            logger.debug(f"Cleaned up memory: {len(task.file_data)} bytes, current usage: {self.current_memory_usage}")
-            task.file_data = None
-
-        # 更新进度条
-        progress_bar.set_postfix({"down": self.stats['downloaded'],
-                                   "up": self.stats['uploaded'],
-                                   "skip": self.stats['skipped_existing']})
-        progress_bar.update(1)
-
-        return task.download_success
-
-    def _emergency_memory_cleanup(self) -> None:
-        """紧急内存清理：清理失败的任务内存"""
-        try:
-            with self.memory_lock:
-                # 清理失败的任务内存
-                cleared_memory = 0
-                for task in self.failed_tasks[:]:  # 复制列表，避免修改时出错
-                    if hasattr(task, 'file_data') and task.file_data is not None:
-                        file_size = len(task.file_data)
-                        self.current_memory_usage -= file_size
-                        cleared_memory += file_size
-                        task.file_data = None
-
-                # 清理上传队列中的任务内存
-                temp_tasks = []
-                while not self.upload_queue.empty():
-                    try:
-                        task = self.upload_queue.get_nowait()
-                        if hasattr(task, 'file_data') and task.file_data is not None:
-                            file_size = len(task.file_data)
-                            self.current_memory_usage -= file_size
-                            cleared_memory += file_size
-                            task.file_data = None
-                        temp_tasks.append(task)
-                    except:
-                        break
-
-                # 将任务放回队列（没有内存数据的）
-                for task in temp_tasks:
-                    try:
-                        self.upload_queue.put_nowait(task)
-                    except:
-                        pass
-
-                if cleared_memory > 0:
-                    logger.warning(f"Emergency cleanup: released {cleared_memory} bytes, current usage: {self.current_memory_usage}")
-
-        except Exception as e:
-            logger.error(f"Error during emergency memory cleanup: {e}")
-
-    def _check_and_cleanup_memory(self) -> None:
-        """定期检查和清理内存"""
-        try:
-            with self.memory_lock:
-                memory_usage_mb = self.current_memory_usage / (1024 * 1024)
-                limit_mb = self.max_memory_usage / (1024 * 1024)
-
-                # 如果内存使用超过80%的阈值，进行预防性清理
-                if memory_usage_mb > limit_mb * 0.8:
-                    logger.info(f"Memory usage high ({memory_usage_mb:.1f}MB/{limit_mb:.1f}MB), performing preventive cleanup")
-                    self._preventive_memory_cleanup()
-
-                # 每5分钟记录一次内存统计
-                if hasattr(self, '_last_stats_log'):
-                    if time.time() - self._last_stats_log > 300:
-                        logger.info(f"Memory statistics: {memory_usage_mb:.1f}MB/{limit_mb:.1f}MB, "
-                                   f"Queue size: {self.upload_queue.qsize()}, "
-                                   f"Failed tasks: {len(self.failed_tasks)}")
-                        self._last_stats_log = time.time()
-                else:
-                    self._last_stats_log = time.time()
-
-        except Exception as e:
-            logger.error(f"Error during memory check: {e}")
-
-    def _preventive_memory_cleanup(self) -> None:
-        """预防性内存清理：清理旧的任务内存"""
-        try:
-            cleared_memory = 0
-
-            # 清理上传队列中等待时间过长的任务（超过5分钟）
-            current_time = time.time()
-            temp_tasks = []
-            while not self.upload_queue.empty():
-                try:
-                    task = self.upload_queue.get_nowait()
-                    # 检查任务是否等待时间过长
-                    if hasattr(task, 'file_data') and task.file_data is not None:
-                        # 如果任务创建时间超过5分钟，清理内存但保留任务
-                        if hasattr(task, 'created_time'):
-                            if current_time - task.created_time > 300:  # 5分钟
-                                file_size = len(task.file_data)
-                                self.current_memory_usage -= file_size
-                                cleared_memory += file_size
-                                task.file_data = None
-                                logger.debug(f"Preventive cleanup: released {file_size} bytes from old task")
-                        else:
-                            # 没有创建时间信息，也清理以防万一
-                            file_size = len(task.file_data)
-                            self.current_memory_usage -= file_size
-                            cleared_memory += file_size
-                            task.file_data = None
-                            logger.debug(f"Preventive cleanup: released {file_size} bytes from unknown task")
-                    temp_tasks.append(task)
-                except:
-                    break
-
-            # 将任务放回队列
-            for task in temp_tasks:
-                try:
-                    self.upload_queue.put_nowait(task)
-                except:
-                    pass
+        return None
 
-            if cleared_memory > 0:
-                logger.info(f"Preventive cleanup: released {cleared_memory} bytes")
+    def _stats_reporter(self, progress_bar: tqdm, stop: threading.Event) -> None:
+        """
+        每秒刷新一次进度条上的统计信息，避免下载线程频繁争用 tqdm 锁
 
-        except Exception as e:
-            logger.error(f"Error during preventive memory cleanup: {e}")
+        Args:
+            progress_bar: 进度条
+            stop: 停止事件
+        """
+        while True:
+            progress_bar.set_postfix_str(f"down={self.stats['downloaded']} up={self.stats['uploaded']} "
+                                         f"skip={self.stats['skipped_existing']}", refresh=False)
+            if stop.wait(1.0):
+                break
+
+    def _log_memory_stats(self) -> None:
+        """定期记录内存与队列统计"""
+        logger.info(f"Memory statistics: limit {self.memory_slot_capacity}MB, "
+                    f"Queue size: {self.upload_queue.qsize()}, "
+                    f"Failed tasks: {len(self.failed_tasks)}")
 
     def _download_artifact_simple(self, artifact: MavenArtifact) -> bool:
         """
@@ -680,65 +752,51 @@ class MemoryPipelineMigrator:
         if self.stop_event.is_set():
             return False
 
+        # 下载前按列出的文件大小预留内存配额，上传完成后释放
+        reserved = self._acquire_memory(artifact.size or 0)
         try:
             # 下载到内存
             file_data = self._download_to_memory(artifact)
             if not file_data:
                 logger.error(f"Failed to download {artifact.file_path}")
-                self.stats['download_failed'] += 1
+                self._increment('download_failed')
+                self._release_slots(reserved)
                 return False
 
-            # 创建内存任务对象
+            # 创建内存任务对象（配额按实际大小调整后交给任务）
             task = MemoryMigrationTask(
                 artifact=artifact,
                 file_data=file_data,
-                download_success=True
+                download_success=True,
+                memory_slots=self._adjust_memory(reserved, len(file_data))
             )
+            reserved = 0
 
             # 添加到上传队列
             self.upload_queue.put(task)
-            self.stats['downloaded'] += 1
+            self._increment('downloaded')
             logger.debug(f"Successfully downloaded and queued: {artifact.file_path}")
             return True
 
         except Exception as e:
             logger.error(f"Download failed for {artifact.file_path}: {e}")
-            self.stats['download_failed'] += 1
+            self._increment('download_failed')
             self._log_failed_download(artifact, str(e))
+            self._release_slots(reserved)
             return False
 
     def _download_to_memory(self, artifact: MavenArtifact) -> Optional[bytes]:
         """下载文件到内存"""
         try:
-            # 创建临时目录避免权限问题
-            temp_dir = tempfile.mkdtemp()
-            temp_file_path = os.path.join(temp_dir, f"temp_{hash(artifact.file_path)}.tmp")
-
-            try:
-                success = self.coding_client.download_artifact(
-                    artifact.file_path.split('/')[0],  # project_name from file_path
-                    "releases" if "releases" in artifact.file_path else "snapshots",
-                    artifact.file_path,
-                    temp_file_path,
-                    getattr(artifact, 'download_url', None)
-                )
-
-                if success and os.path.exists(temp_file_path):
-                    # 读取文件到内存
-                    with open(temp_file_path, 'rb') as f:
-                        file_data = f.read()
-                    return file_data
-                else:
-                    return None
-
-            finally:
-                # 清理临时文件和目录
-                try:
-                    if os.path.exists(temp_file_path):
-                        os.unlink(temp_file_path)
-                    os.rmdir(temp_dir)
-                except Exception:
-                    pass  # 忽略清理错误
+            buffer = io.BytesIO()
+            success = self.coding_client.download_artifact_stream(
+                artifact.project_id,
+                artifact.repository,
+                artifact.file_path,
+                buffer,
+                artifact.download_url
+            )
+            return buffer.getvalue() if success else None
 
         except Exception as e:
             logger.error(f"Failed to download {artifact.file_path} to memory: {e}")
@@ -748,8 +806,7 @@ class MemoryPipelineMigrator:
         """上传工作线程"""
         logger.info("Memory upload worker started")
 
-        # 记录保存计数器和状态报告
-        save_counter = 0
+        # 状态报告计数器
         status_counter = 0
 
         while not self.stop_event.is_set():
@@ -757,138 +814,32 @@ class MemoryPipelineMigrator:
                 # 定期报告状态（每30秒）
                 status_counter += 1
                 if status_counter % 300 == 0:  # 300 * 0.1s = 30s
-                    logger.info(f"Upload worker status - Memory usage: {self.current_memory_usage}/{self.max_memory_usage} bytes, "
+                    logger.info(f"Upload worker status - Memory limit: {self.memory_slot_capacity}MB, "
                                f"Queue size: {self.upload_queue.qsize()}, Uploaded: {self.stats['uploaded']}, "
                                f"Failed: {self.stats['upload_failed']}")
 
-                # 从队列获取任务
-                task = self.upload_queue.get(timeout=1.0)
+                # 从队列获取任务（单个任务或同一 GAV 下的一组任务）
+                item = self.upload_queue.get(timeout=1.0)
 
                 # 检查是否为结束标记
-                if task is None:
+                if item is None:
                     logger.debug("Upload worker received shutdown signal")
+                    self.upload_queue.task_done()
                     break
 
+                tasks = item if isinstance(item, list) else [item]
                 try:
-                    if task.download_success and task.file_data:
-                        # 检查是否为POM文件
-                        is_pom_file = task.artifact.file_path.endswith('.pom') or task.artifact.packaging == 'pom'
-                        if is_pom_file:
-                            with self.pom_lock:
-                                self.pom_stats['upload_attempted'] += 1
-                            logger.info(f"🔄 STARTING POM UPLOAD: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
-
-                        # 创建临时目录和文件用于上传
-                        temp_dir = tempfile.mkdtemp()
-                        temp_file_path = os.path.join(temp_dir, f"upload_{hash(task.artifact.file_path)}.tmp")
-
-                        try:
-                            # 写入临时文件
-                            with open(temp_file_path, 'wb') as temp_file:
-                                temp_file.write(task.file_data)
-                                temp_file.flush()
-
-                            # 上传文件
-                            maven_path = self._convert_to_maven_path(task.artifact)
-                            logger.debug(f"Uploading to Nexus path: {maven_path}")
-                            result = self.nexus_uploader.upload_file(
-                                Path(temp_file_path), maven_path
-                            )
+                    if len(tasks) > 1 and self._upload_component(tasks):
+                        continue
 
-                            if result.get('success'):
-                                task.upload_success = True
-                                self.stats['uploaded'] += 1
-
-                                # POM文件上传成功统计
-                                if is_pom_file:
-                                    with self.pom_lock:
-                                        self.pom_stats['upload_success'] += 1
-                                    logger.info(f"✅ POM UPLOAD SUCCESS: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
-                                    logger.info(f"  Maven path: {maven_path}")
-                                    logger.info(f"  File size: {len(task.file_data)} bytes")
-                                elif task.artifact.file_path.endswith('.pom'):
-                                    with self.pom_lock:
-                                        self.pom_stats['upload_success'] += 1
-                                    logger.info(f"✅ POM UPLOAD SUCCESS: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
-
-                                # 记录已上传的依赖信息
-                                repository_name = task.artifact.repository or "Unknown"
-                                file_name = task.artifact.file_path.split('/')[-1] if task.artifact.file_path else "Unknown"
-                                dependency_info = {
-                                    'group_id': task.artifact.group_id,
-                                    'artifact_id': task.artifact.artifact_id,
-                                    'version': task.artifact.version,
-                                    'packaging': task.artifact.packaging,
-                                    'repository': repository_name,
-                                    'filename': file_name,
-                                    'upload_time': time.time()
-                                }
-                                self.uploaded_dependencies.append(dependency_info)
-
-                                # 记录已上传的文件 - 使用Maven坐标哈希而不是文件内容哈希
-                                identifier = f"{task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}:{task.artifact.packaging}"
-                                maven_hash = hashlib.md5(identifier.encode()).hexdigest()
-                                self.uploaded_hashes.add(maven_hash)
-
-                                # 清晰显示上传成功的依赖
-                                logger.info(f"[OK] UPLOADED DEPENDENCY: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version} ({task.artifact.packaging})")
-                                logger.info(f"   Repository: {repository_name}")
-                                logger.info(f"   Filename: {file_name}")
-
-                                # 定期保存记录（每10个上传保存一次）
-                                save_counter += 1
-                                if save_counter % 10 == 0:
-                                    self._save_migration_records()
-                            else:
-                                task.error_message = result.get('error', 'Upload failed')
-                                self.stats['upload_failed'] += 1
-                                self.failed_tasks.append(task)
-
-                                # 记录上传失败到日志文件
-                                self._log_failed_upload(task.artifact, maven_path, task.error_message)
-
-                                # POM文件上传失败统计
-                                if is_pom_file:
-                                    with self.pom_lock:
-                                        self.pom_stats['upload_failed'] += 1
-                                    logger.error(f"❌ POM UPLOAD FAILED: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
-                                    logger.error(f"  Error: {task.error_message}")
-                                    logger.error(f"  Maven path: {maven_path}")
-
-                        finally:
-                            # 清理临时文件和目录
-                            try:
-                                if os.path.exists(temp_file_path):
-                                    os.unlink(temp_file_path)
-                                os.rmdir(temp_dir)
-                            except Exception:
-                                pass  # 忽略清理错误
-
-                except Exception as e:
-                    task.error_message = str(e)
-                    self.stats['upload_failed'] += 1
-                    self.failed_tasks.append(task)
-
-                    # 记录上传失败到日志文件
-                    maven_path = self._convert_to_maven_path(task.artifact)
-                    self._log_failed_upload(task.artifact, maven_path, task.error_message)
-
-                    # POM文件异常失败统计
-                    is_pom_file = task.artifact.file_path.endswith('.pom') or task.artifact.packaging == 'pom'
-                    if is_pom_file:
-                        with self.pom_lock:
-                            self.pom_stats['upload_failed'] += 1
-                        logger.error(f"❌ POM UPLOAD EXCEPTION: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version} - {e}")
-                    logger.error(f"Failed to upload {task.artifact.file_path}: {e}")
+                    # 单个文件或组件上传失败时逐个文件上传
+                    for task in tasks:
+                        self._upload_task(task)
 
                 finally:
-                    # 释放内存（重要：确保总是释放内存）
-                    if task.file_data:
-                        file_size = len(task.file_data)
-                        with self.memory_lock:
-                            self.current_memory_usage -= file_size
-                        logger.debug(f"Released {file_size} bytes from memory, current usage: {self.current_memory_usage}")
-                        task.file_data = None
+                    # 释放内存和配额（重要：确保总是释放）
+                    for task in tasks:
+                        self._release_memory(task)
 
                     # 标记任务完成
                     try:
@@ -901,23 +852,162 @@ class MemoryPipelineMigrator:
                 continue
             except Exception as e:
                 logger.error(f"Upload worker error: {e}")
-                # 确保在异常情况下也等待一小段时间，避免CPU占用过高
-                time.sleep(0.1)
 
-        logger.info("Memory upload worker stopped - Final memory usage: {self.current_memory_usage} bytes")
+        logger.info("Memory upload worker stopped")
 
-    def _convert_to_maven_path(self, artifact: MavenArtifact) -> str:
-        """转换为 Maven 路径格式"""
-        parts = artifact.file_path.split('/')
-        if len(parts) >= 4:
-            group_id = '.'.join(parts[:-3])
-            artifact_id = parts[-3]
-            version = parts[-2]
-            filename = parts[-1]
+    def _upload_component(self, tasks: List[MemoryMigrationTask]) -> bool:
+        """
+        通过一次 multipart 请求上传同一 GAV 下的所有文件
 
-            return f"{group_id.replace('.', '/')}/{artifact_id}/{version}/{filename}"
+        Args:
+            tasks: 同一 GAV 下的迁移任务列表
 
-        return artifact.file_path
+        Returns:
+            是否上传成功（失败时由调用方逐个文件上传）
+        """
+        artifact = tasks[0].artifact
+
+        # SNAPSHOT 仓库不支持 components 上传接口
+        if self.nexus_uploader.is_snapshot_version(artifact.version):
+            return False
+
+        maven_paths = [self._convert_to_maven_path(task.artifact) for task in tasks]
+        try:
+            result = self.nexus_uploader.upload_component(
+                artifact.group_id, artifact.artifact_id, artifact.version,
+                [(maven_path.rsplit('/', 1)[-1], task.file_data) for maven_path, task in zip(maven_paths, tasks)]
+            )
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+
+        if not result.get('success'):
+            logger.debug(f"Component upload failed for {artifact.group_id}:{artifact.artifact_id}:{artifact.version}, "
+                         f"falling back to per-file upload: {result.get('error')}")
+            return False
+
+        for maven_path, task in zip(maven_paths, tasks):
+            if task.artifact.file_path.endswith('.pom') or task.artifact.packaging == 'pom':
+                with self.pom_lock:
+                    self.pom_stats['upload_attempted'] += 1
+            self._record_upload_success(task, maven_path)
+        return True
+
+    def _upload_task(self, task: MemoryMigrationTask) -> None:
+        """
+        上传单个内存中的制品
+
+        Args:
+            task: 迁移任务
+        """
+        try:
+            if task.download_success and task.file_data:
+                # 检查是否为POM文件
+                is_pom_file = task.artifact.file_path.endswith('.pom') or task.artifact.packaging == 'pom'
+                if is_pom_file:
+                    with self.pom_lock:
+                        self.pom_stats['upload_attempted'] += 1
+                    logger.info(f"🔄 STARTING POM UPLOAD: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
+
+                # 直接上传内存中的文件内容
+                maven_path = self._convert_to_maven_path(task.artifact)
+                logger.debug(f"Uploading to Nexus path: {maven_path}")
+                for attempt in range(_UPLOAD_ATTEMPTS):
+                    result = self.nexus_uploader.upload_bytes(
+                        task.file_data, maven_path, task.artifact.file_path
+                    )
+                    # 仅对 5xx 和网络错误（无状态码）重试，4xx 直接失败
+                    status_code = result.get('status_code')
+                    if (result.get('success') or (status_code is not None and status_code < 500)
+                            or attempt == _UPLOAD_ATTEMPTS - 1 or self.stop_event.is_set()):
+                        break
+                    delay = min(2 ** attempt * 0.5, 4)
+                    logger.warning(f"Upload of {maven_path} failed ({status_code or result.get('error')}), "
+                                   f"retrying in {delay}s")
+                    time.sleep(delay)
+
+                if result.get('success'):
+                    self._record_upload_success(task, maven_path)
+                else:
+                    task.error_message = result.get('error', 'Upload failed')
+                    self._increment('upload_failed')
+                    self.failed_tasks.append(task)
+
+                    # 记录上传失败到日志文件
+                    self._log_failed_upload(task.artifact, maven_path, task.error_message)
+
+                    # POM文件上传失败统计
+                    if is_pom_file:
+                        with self.pom_lock:
+                            self.pom_stats['upload_failed'] += 1
+                        logger.error(f"❌ POM UPLOAD FAILED: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
+                        logger.error(f"  Error: {task.error_message}")
+                        logger.error(f"  Maven path: {maven_path}")
+
+        except Exception as e:
+            task.error_message = str(e)
+            self._increment('upload_failed')
+            self.failed_tasks.append(task)
+
+            # 记录上传失败到日志文件
+            maven_path = self._convert_to_maven_path(task.artifact)
+            self._log_failed_upload(task.artifact, maven_path, task.error_message)
+
+            # POM文件异常失败统计
+            is_pom_file = task.artifact.file_path.endswith('.pom') or task.artifact.packaging == 'pom'
+            if is_pom_file:
+                with self.pom_lock:
+                    self.pom_stats['upload_failed'] += 1
+                logger.error(f"❌ POM UPLOAD EXCEPTION: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version} - {e}")
+            logger.error(f"Failed to upload {task.artifact.file_path}: {e}")
+
+    def _record_upload_success(self, task: MemoryMigrationTask, maven_path: str) -> None:
+        """
+        记录上传成功的制品
+
+        Args:
+            task: 迁移任务
+            maven_path: Maven 仓库中的路径
+        """
+        task.upload_success = True
+        self._increment('uploaded')
+
+        # POM文件上传成功统计
+        if task.artifact.file_path.endswith('.pom') or task.artifact.packaging == 'pom':
+            with self.pom_lock:
+                self.pom_stats['upload_success'] += 1
+            logger.info(f"✅ POM UPLOAD SUCCESS: {task.artifact.group_id}:{task.artifact.artifact_id}:{task.artifact.version}")
+            logger.info(f"  Maven path: {maven_path}")
+            logger.info(f"  File size: {len(task.file_data)} bytes")
+
+        # 记录已上传的依赖信息
+        repository_name = task.artifact.repository or "Unknown"
+        file_name = task.artifact.file_path.split('/')[-1] if task.artifact.file_path else "Unknown"
+        dependency_info = {
+            'group_id': task.artifact.group_id,
+            'artifact_id': task.artifact.artifact_id,
+            'version': task.artifact.version,
+            'packaging': task.artifact.packaging,
+            'repository': repository_name,
+            'filename': file_name,
+            'upload_time': time.time()
+        }
+        # 记录已上传的文件 - 直接使用Maven坐标作为键
+        key = (task.artifact.group_id, task.artifact.artifact_id, task.artifact.version, task.artifact.packaging)
+        with self.records_lock:
+            self.uploaded_dependencies.append(dependency_info)
+            self.grouped_dependencies[f"{task.artifact.group_id}:{task.artifact.artifact_id}"].append(dependency_info)
+            self.uploaded_keys.add(key)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[OK] UPLOADED DEPENDENCY: {task.artifact.group_id}:{task.artifact.artifact_id}:"
+                         f"{task.artifact.version} ({task.artifact.packaging}) - {repository_name}/{file_name}")
+
+        # 追加记录，结束时再统一写快照
+        self._append_migration_record(key, dependency_info)
+
+    def _convert_to_maven_path(self, artifact: MavenArtifact) -> str:
+        """转换为 Maven 路径格式（优先使用发现制品时计算好的路径）"""
+        return artifact.maven_path or _file_path_to_maven_path(artifact.file_path)
 
     def _generate_final_stats(self) -> None:
         """生成最终统计信息"""
@@ -1125,7 +1215,7 @@ class MemoryPipelineMigrator:
                     try:
                         repos = self.coding_client.get_artifact_repositories(project.id)
                         for repo in repos:
-                            if repo.get('Type') == 3:  # Maven 类型
+                            if repo.get('_normalized_type') == 'maven':  # Maven 类型
                                 repositories.append(repo.get('Name'))
                         logger.debug(f"[SEARCH] 项目 {project.name} 找到 Maven 仓库: {repositories}")
                     except Exception as e:
@@ -1155,6 +1245,7 @@ class MemoryPipelineMigrator:
                                     # 如果仓库信息为空，则设置
                                     if not artifact.repository:
                                         artifact.repository = repository_name
+                                    artifact.maven_path = self._convert_to_maven_path(artifact)
 
                                 all_artifacts.extend(artifacts)
                                 component_found = True
@@ -1193,8 +1284,7 @@ class MemoryPipelineMigrator:
             # 过滤已上传的制品
             filtered_artifacts = []
             for artifact in all_artifacts:
-                existing_hash = self._check_if_already_uploaded(artifact)
-                if existing_hash:
+                if self._check_if_already_uploaded(artifact):
                     stats['skipped_existing'] += 1
                     logger.debug(f"Skipping already uploaded: {artifact.file_path}")
                 else:
@@ -1215,20 +1305,23 @@ class MemoryPipelineMigrator:
             self.stats = stats.copy()
             self.stop_event.clear()
 
-            # 启动下载和上传线程池
-            with ThreadPoolExecutor(max_workers=self.download_workers + self.upload_workers) as executor:
+            # 启动下载和上传线程池：下载和上传使用独立线程池，阻塞在网络上的上传线程不会占用下载的并发额度
+            with ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="dl") as dl_pool, \
+                    ThreadPoolExecutor(max_workers=self.upload_workers, thread_name_prefix="up") as up_pool:
                 # 启动上传工作线程
                 upload_futures = []
                 for i in range(self.upload_workers):
-                    future = executor.submit(self._upload_worker)
+                    future = up_pool.submit(self._upload_worker)
                     upload_futures.append(future)
 
                 # 启动下载工作线程
                 download_futures = []
+                # 大文件优先提交（LPT 调度）
+                filtered_artifacts.sort(key=_size_hint, reverse=True)
                 for artifact in filtered_artifacts:
                     if self.stop_event.is_set():
                         break
-                    future = executor.submit(self._download_artifact_simple, artifact)
+                    future = dl_pool.submit(self._download_artifact_simple, artifact)
                     download_futures.append(future)
 
                 # 等待所有下载任务完成
@@ -2,20 +2,125 @@
 主迁移模块
 """
 
+import io
+import os
 import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from .config import ConfigManager
-from .coding_client import CodingClient
-from .downloader import MavenDownloader
-from .nexus_uploader import NexusUploader
-from .pipeline_migrator import PipelineMigrator
-from .memory_pipeline_migrator import MemoryPipelineMigrator
 from .models import MigrationConfig
 
+# 客户端和各迁移器依赖 requests/tqdm 等较重的模块，在实际用到时才导入，
+# 让只查看配置或清理目录的命令启动更快
+if TYPE_CHECKING:
+    from .coding_client import CodingClient
+    from .downloader import MavenDownloader
+    from .nexus_uploader import NexusUploader
+
 
 logger = logging.getLogger(__name__)
 
+# migrate_all 同时下载的最大项目数（每个项目内部还会并发下载多个仓库）
+_MAX_PARALLEL_PROJECTS = 4
+
+# 项目列表缓存有效期（秒）
+_PROJECTS_CACHE_TTL = 60
+
+# 清理下载目录时并发删除文件的最大线程数
+_MAX_CLEANUP_WORKERS = 32
+
+# 迁移报告模板
+_REPORT_RULE = "=" * 60
+_REPORT_HEADER = f"{_REPORT_RULE}\nCODING Maven 制品库迁移报告\n{_REPORT_RULE}\n"
+_REPORT_TOTALS_TMPL = (
+    "\n总体统计:\n"
+    "  总下载制品数: {total_artifacts_downloaded}\n"
+    "  总上传制品数: {total_artifacts_uploaded}\n"
+    "  下载失败数: {total_download_failures}\n"
+    "  上传失败数: {total_upload_failures}\n"
+)
+_REPORT_PROJECT_TMPL = "  {name}:\n    下载: {downloaded} 成功, {download_failures} 失败\n"
+_REPORT_PROJECT_UPLOAD_TMPL = "    上传: {uploaded} 成功, {upload_failures} 失败\n"
+_REPORT_PROJECT_SKIPPED_TMPL = "    跳过: {skipped}\n"
+
+
+def _remove_tree(root: str, max_workers: int) -> None:
+    """
+    删除目录树：文件由多个线程并发删除，目录在文件删除后自底向上删除
+
+    Args:
+        root: 要删除的目录
+        max_workers: 并发删除文件的线程数
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    stack = [root]
+
+    # 使用 os.scandir 遍历，DirEntry 的类型判断来自目录读取结果，无需逐个 stat
+    while stack:
+        path = stack.pop()
+        dirs.append(path)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() 等待全部完成并抛出删除失败的异常
+        list(executor.map(os.unlink, files, chunksize=256))
+
+    # 父目录总是先于子目录加入列表，逆序即为自底向上
+    for path in reversed(dirs):
+        os.rmdir(path)
+
+
+@dataclass
+class MigrationStats:
+    """migrate_all 的汇总统计，各项目结果直接累加到计数器上"""
+    projects: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    total_artifacts_downloaded: int = 0
+    total_artifacts_uploaded: int = 0
+    total_download_failures: int = 0
+    total_upload_failures: int = 0
+    total_skipped: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add_project(self, project_name: str, project_stats: Dict[str, Any]) -> None:
+        """记录单个项目的结果并累加到总计（可在多个线程中调用）"""
+        with self.lock:
+            self.projects[project_name] = project_stats
+            self.total_artifacts_downloaded += project_stats.get("downloaded", 0)
+            self.total_artifacts_uploaded += project_stats.get("uploaded", 0)
+            self.total_download_failures += project_stats.get("download_failures", 0)
+            self.total_upload_failures += project_stats.get("upload_failures", 0)
+
+    def add_error(self, error_msg: str) -> None:
+        """记录错误信息"""
+        logger.error(error_msg)
+        with self.lock:
+            self.errors.append(error_msg)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为报告和 CLI 使用的统计字典"""
+        result = {
+            "projects": self.projects,
+            "total_artifacts_downloaded": self.total_artifacts_downloaded,
+            "total_artifacts_uploaded": self.total_artifacts_uploaded,
+            "total_download_failures": self.total_download_failures,
+            "total_upload_failures": self.total_upload_failures,
+            "errors": self.errors
+        }
+        if self.total_skipped is not None:
+            result["total_skipped"] = self.total_skipped
+        return result
+
 
 class MavenMigrator:
     """Maven 制品迁移器"""
@@ -29,6 +134,62 @@ class MavenMigrator:
         """
         self.config = config
 
+        # 客户端在各入口间复用（延迟创建），保持连接池和认证状态
+        self._coding_client: Optional["CodingClient"] = None
+        self._nexus_uploader: Optional["NexusUploader"] = None
+        self._clients_lock = threading.Lock()
+
+        # 项目列表缓存：(获取时间, 项目列表)
+        self._projects_cache: Optional[Tuple[float, List[Any]]] = None
+        self._projects_by_name: Dict[str, Any] = {}
+
+        # Nexus 仓库信息缓存
+        self._repository_info: Optional[Dict[str, Any]] = None
+
+    def invalidate_caches(self) -> None:
+        """清空项目和仓库信息缓存（重新加载配置后调用）"""
+        self._projects_cache = None
+        self._projects_by_name = {}
+        self._repository_info = None
+
+    def _get_coding_client(self) -> "CodingClient":
+        """获取共享的 CODING 客户端（首次调用时创建）"""
+        with self._clients_lock:
+            if self._coding_client is None:
+                from .coding_client import CodingClient
+                self._coding_client = CodingClient(
+                    self.config.coding_token,
+                    self.config.coding_team_id,
+                    self.config.maven_repositories,
+                    self.config.pagination,
+                    self.config.performance.max_workers,
+                    requests_per_second=self.config.rate_limit.requests_per_second,
+                    http2=self.config.performance.http2,
+                    pool_maxsize=self.config.performance.http_pool_maxsize,
+                    pool_block=self.config.performance.http_pool_block
+                )
+            return self._coding_client
+
+    def _get_nexus_uploader(self) -> "NexusUploader":
+        """获取共享的 Nexus 上传器（首次调用时创建）"""
+        with self._clients_lock:
+            if self._nexus_uploader is None:
+                from .nexus_uploader import NexusUploader
+                self._nexus_uploader = NexusUploader(self.config)
+            return self._nexus_uploader
+
+    def _get_all_projects(self) -> List[Any]:
+        """获取所有项目（在缓存有效期内复用上次的结果）"""
+        if self._projects_cache is not None:
+            fetched_at, projects = self._projects_cache
+            if time.monotonic() - fetched_at < _PROJECTS_CACHE_TTL:
+                return projects
+
+        projects = self._get_coding_client().get_all_projects()
+        self._projects_by_name = {project.name: project for project in projects}
+        self._projects_cache = (time.monotonic(), projects)
+        return projects
+
     def get_projects(self) -> List[Any]:
         """
         获取所有可用的项目列表
@@ -40,18 +201,8 @@ class MavenMigrator:
             raise ValueError("Migrator not properly initialized")
 
         try:
-            # 创建 CODING 客户端
-            coding_client = CodingClient(
-                self.config.coding_token,
-                self.config.coding_team_id,
-                self.config.maven_repositories,
-                self.config.pagination,
-                self.config.performance.max_workers,
-                requests_per_second=self.config.rate_limit.requests_per_second
-            )
-
             # 获取所有项目
-            projects = coding_client.get_all_projects()
+            projects = self._get_all_projects()
             return projects
 
         except Exception as e:
@@ -68,12 +219,13 @@ class MavenMigrator:
         if not self.config:
             raise ValueError("Migrator not properly initialized")
 
-        try:
-            # 创建 Nexus 上传器
-            nexus_uploader = NexusUploader(self.config)
+        if self._repository_info is not None:
+            return self._repository_info
 
+        try:
             # 获取仓库信息
-            repository_info = nexus_uploader.get_repository_info()
+            repository_info = self._get_nexus_uploader().get_repository_info()
+            self._repository_info = repository_info
             return repository_info
 
         except Exception as e:
@@ -96,17 +248,12 @@ class MavenMigrator:
 
         logger.info("Starting full migration process")
 
+        from .downloader import MavenDownloader
+
         # 初始化客户端
-        coding_client = CodingClient(
-            self.config.coding_token,
-            self.config.coding_team_id,
-            self.config.maven_repositories,
-            self.config.pagination,
-            self.config.performance.max_workers,
-            requests_per_second=self.config.rate_limit.requests_per_second
-        )
+        coding_client = self._get_coding_client()
         downloader = MavenDownloader(coding_client, self.config)
-        nexus_uploader = NexusUploader(self.config)
+        nexus_uploader = self._get_nexus_uploader()
 
         # 测试 Nexus 连接
         if not nexus_uploader.test_connection():
@@ -114,48 +261,124 @@ class MavenMigrator:
 
         # 获取要迁移的项目列表
         project_names = self.config.project_names
-        if not project_names:
+        if project_names:
+            # 并发查询指定的项目，结果缓存后各项目迁移时不再逐个查询
+            found = self._get_projects_by_names(project_names)
+            missing = [name for name in project_names if name not in found]
+            if missing:
+                logger.warning(f"Projects not found: {missing}")
+        else:
             # 如果没有指定项目，获取所有项目
-            all_projects = coding_client.get_all_projects()
+            all_projects = self._get_all_projects()
             project_names = [project.name for project in all_projects]
 
         logger.info(f"Projects to migrate: {project_names}")
 
+        if not self.config.prefer_disk_staging:
+            return self._migrate_all_in_memory(project_names)
+
         # 总体统计
-        total_stats = {
-            "projects": {},
-            "total_artifacts_downloaded": 0,
-            "total_artifacts_uploaded": 0,
-            "total_download_failures": 0,
-            "total_upload_failures": 0,
-            "errors": []
-        }
+        total_stats = MigrationStats()
 
-        # 逐个项目迁移
-        for project_name in project_names:
+        def download_project(project_name: str) -> Dict[str, Any]:
+            """下载单个项目的制品"""
+            logger.info(f"Starting download for project: {project_name}")
+            download_stats = downloader.download_project_artifacts(project_name)
+            logger.info(f"Completed download for project: {project_name}")
+            return {
+                "downloaded": download_stats.get("downloaded", 0),
+                "download_failures": download_stats.get("failed", 0)
+            }
+
+        # 第一步：多个项目并发下载（各项目写入同一下载目录，互不依赖）
+        max_parallel = max(1, min(len(project_names), self.config.performance.max_workers, _MAX_PARALLEL_PROJECTS))
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = {executor.submit(download_project, name): name for name in project_names}
+            for future in as_completed(futures):
+                project_name = futures[future]
+                try:
+                    total_stats.add_project(project_name, future.result())
+                except Exception as e:
+                    total_stats.add_error(f"Failed to migrate project {project_name}: {e}")
+
+        # 第二步：所有下载完成后统一上传一次下载目录，
+        # 避免并发时上传其他项目尚未写完的文件，也避免同一文件被多个项目重复上传
+        if total_stats.total_artifacts_downloaded > 0:
+            logger.info("Uploading downloaded artifacts to Nexus")
             try:
-                logger.info(f"Starting migration for project: {project_name}")
+                upload_stats = nexus_uploader.upload_directory(Path(self.config.download_path), self.config.batch_size)
+                total_stats.total_artifacts_uploaded = upload_stats.get("uploaded", 0)
+                total_stats.total_upload_failures = upload_stats.get("failed", 0)
+                total_stats.total_skipped = upload_stats.get("skipped", 0)
+            except Exception as e:
+                total_stats.add_error(f"Failed to upload downloaded artifacts: {e}")
 
-                project_stats = self.migrate_project(project_name, coding_client, downloader, nexus_uploader)
-                total_stats["projects"][project_name] = project_stats
+        logger.info("Full migration process completed")
+        return total_stats.to_dict()
 
-                total_stats["total_artifacts_downloaded"] += project_stats.get("downloaded", 0)
-                total_stats["total_artifacts_uploaded"] += project_stats.get("uploaded", 0)
-                total_stats["total_download_failures"] += project_stats.get("download_failures", 0)
-                total_stats["total_upload_failures"] += project_stats.get("upload_failures", 0)
+    def _migrate_all_in_memory(self, project_names: List[str]) -> Dict[str, Any]:
+        """
+        通过内存流水线并发迁移多个项目（不经过磁盘）
 
-                logger.info(f"Completed migration for project: {project_name}")
+        Args:
+            project_names: 项目名称列表
 
-            except Exception as e:
-                error_msg = f"Failed to migrate project {project_name}: {e}"
-                logger.error(error_msg)
-                total_stats["errors"].append(error_msg)
+        Returns:
+            迁移结果统计
+        """
+        total_stats = MigrationStats()
+
+        # 与磁盘模式相同的项目并发数；内存配额在同时运行的项目间均分，总占用不超过配置的上限
+        max_parallel = max(1, min(len(project_names), self.config.performance.max_workers, _MAX_PARALLEL_PROJECTS))
+        performance = self.config.performance.model_copy(
+            update={'memory_limit_mb': max(1, self.config.performance.memory_limit_mb // max_parallel)})
+        project_config = self.config.model_copy(update={'performance': performance})
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = {executor.submit(self._migrate_project_in_memory, name, project_config): name
+                       for name in project_names}
+            for future in as_completed(futures):
+                project_name = futures[future]
+                try:
+                    total_stats.add_project(project_name, future.result())
+                except Exception as e:
+                    total_stats.add_error(f"Failed to migrate project {project_name}: {e}")
 
         logger.info("Full migration process completed")
-        return total_stats
+        return total_stats.to_dict()
+
+    def _migrate_project_in_memory(self, project_name: str,
+                                   config: Optional[MigrationConfig] = None) -> Dict[str, Any]:
+        """
+        通过内存流水线迁移单个项目，并转换为标准模式的统计格式
+
+        Args:
+            project_name: 项目名称
+            config: 本项目使用的迁移配置，默认使用迁移器的配置
+
+        Returns:
+            项目迁移结果
+        """
+        project_info = self._get_project_by_name(project_name)
+        if not project_info:
+            raise ValueError(f"Project '{project_name}' not found")
+
+        from .memory_pipeline_migrator import MemoryPipelineMigrator
+
+        # 复用共享的客户端，各项目不再各自建立连接池
+        migrator = MemoryPipelineMigrator(config or self.config, self._get_coding_client(), self._get_nexus_uploader())
+        stats = migrator.migrate_project(project_info['id'], project_name)
+        return {
+            "downloaded": stats.get('downloaded', 0),
+            "download_failures": stats.get('download_failed', 0),
+            "uploaded": stats.get('uploaded', 0),
+            "upload_failures": stats.get('upload_failed', 0),
+            "skipped": stats.get('skipped_existing', 0),
+            "repositories": {}
+        }
 
-    def migrate_project(self, project_name: str, coding_client: CodingClient,
-                       downloader: MavenDownloader, nexus_uploader: NexusUploader) -> Dict[str, Any]:
+    def migrate_project(self, project_name: str, coding_client: "CodingClient",
+                       downloader: "MavenDownloader", nexus_uploader: "NexusUploader") -> Dict[str, Any]:
         """
         迁移单个项目
 
@@ -177,6 +400,11 @@ class MavenMigrator:
         }
 
         try:
+            # 未要求磁盘中转时直接走内存流水线，下载与上传重叠进行
+            if not self.config.prefer_disk_staging:
+                logger.info(f"Migrating project {project_name} through the memory pipeline")
+                return self._migrate_project_in_memory(project_name)
+
             # 第一步：下载制品
             logger.info(f"Step 1: Downloading artifacts from project: {project_name}")
             download_stats = downloader.download_project_artifacts(project_name)
@@ -223,17 +451,12 @@ class MavenMigrator:
             raise ValueError("Migrator not properly initialized")
 
         try:
+            from .downloader import MavenDownloader
+
             # 初始化客户端
-            coding_client = CodingClient(
-                self.config.coding_token,
-                self.config.coding_team_id,
-                self.config.maven_repositories,
-                self.config.pagination,
-                self.config.performance.max_workers,
-                requests_per_second=self.config.rate_limit.requests_per_second
-            )
+            coding_client = self._get_coding_client()
             downloader = MavenDownloader(coding_client, self.config)
-            nexus_uploader = NexusUploader(self.config)
+            nexus_uploader = self._get_nexus_uploader()
 
             # 测试 Nexus 连接
             if not nexus_uploader.test_connection():
@@ -275,13 +498,7 @@ class MavenMigrator:
 
         # 测试 CODING 连接
         try:
-            coding_client = CodingClient(
-                self.config.coding_token,
-                self.config.coding_team_id,
-                self.config.maven_repositories,
-                requests_per_second=self.config.rate_limit.requests_per_second
-            )
-            projects = coding_client.get_projects(1, 1)  # 只获取一个项目测试连接
+            projects = self._get_coding_client().get_projects(1, 1)  # 只获取一个项目测试连接
             results["coding"] = True
             logger.info("CODING connection test successful")
         except Exception as e:
@@ -289,8 +506,7 @@ class MavenMigrator:
 
         # 测试 Nexus 连接
         try:
-            nexus_uploader = NexusUploader(self.config)
-            results["nexus"] = nexus_uploader.test_connection()
+            results["nexus"] = self._get_nexus_uploader().test_connection()
         except Exception as e:
             logger.error(f"Nexus connection test failed: {e}")
 
@@ -306,8 +522,7 @@ class MavenMigrator:
         download_path = Path(self.config.download_path)
 
         if download_path.exists():
-            import shutil
-            shutil.rmtree(download_path)
+            _remove_tree(str(download_path), min(_MAX_CLEANUP_WORKERS, self.config.performance.max_workers))
             logger.info(f"Cleaned up download directory: {download_path}")
 
     def get_migration_report(self, stats: Dict[str, Any]) -> str:
@@ -320,36 +535,37 @@ class MavenMigrator:
         Returns:
             格式化的迁移报告
         """
-        report = []
-        report.append("=" * 60)
-        report.append("CODING Maven 制品库迁移报告")
-        report.append("=" * 60)
+        buf = io.StringIO()
+        buf.write(_REPORT_HEADER)
 
         # 总体统计
-        report.append("\n总体统计:")
-        report.append(f"  总下载制品数: {stats['total_artifacts_downloaded']}")
-        report.append(f"  总上传制品数: {stats['total_artifacts_uploaded']}")
-        report.append(f"  下载失败数: {stats['total_download_failures']}")
-        report.append(f"  上传失败数: {stats['total_upload_failures']}")
+        buf.write(_REPORT_TOTALS_TMPL.format_map(stats))
 
         # 项目详情
-        report.append("\n项目详情:")
+        buf.write("\n项目详情:\n")
         for project_name, project_stats in stats["projects"].items():
-            report.append(f"  {project_name}:")
-            report.append(f"    下载: {project_stats.get('downloaded', 0)} 成功, {project_stats.get('download_failures', 0)} 失败")
-            report.append(f"    上传: {project_stats.get('uploaded', 0)} 成功, {project_stats.get('upload_failures', 0)} 失败")
+            buf.write(_REPORT_PROJECT_TMPL.format(
+                name=project_name,
+                downloaded=project_stats.get('downloaded', 0),
+                download_failures=project_stats.get('download_failures', 0)
+            ))
+            if 'uploaded' in project_stats:
+                buf.write(_REPORT_PROJECT_UPLOAD_TMPL.format(
+                    uploaded=project_stats['uploaded'],
+                    upload_failures=project_stats.get('upload_failures', 0)
+                ))
             if 'skipped' in project_stats:
-                report.append(f"    跳过: {project_stats.get('skipped', 0)}")
+                buf.write(_REPORT_PROJECT_SKIPPED_TMPL.format(skipped=project_stats['skipped']))
 
         # 错误信息
         if stats["errors"]:
-            report.append("\n错误信息:")
+            buf.write("\n错误信息:\n")
             for error in stats["errors"]:
-                report.append(f"  - {error}")
+                buf.write(f"  - {error}\n")
 
-        report.append("\n" + "=" * 60)
+        buf.write(f"\n{_REPORT_RULE}")
 
-        return "\n".join(report)
+        return buf.getvalue()
 
     def migrate_project_pipeline(self, project_name: str) -> Dict[str, Any]:
         """
@@ -378,6 +594,7 @@ class MavenMigrator:
         project_id = project_info['id']
 
         # 创建流水线迁移器
+        from .pipeline_migrator import PipelineMigrator
         pipeline_migrator = PipelineMigrator(self.config)
 
         # 执行流水线迁移
@@ -412,7 +629,8 @@ class MavenMigrator:
         project_id = project_info['id']
 
         # 创建内存流水线迁移器
-        memory_migrator = MemoryPipelineMigrator(self.config)
+        from .memory_pipeline_migrator import MemoryPipelineMigrator
+        memory_migrator = MemoryPipelineMigrator(self.config, self._get_coding_client(), self._get_nexus_uploader())
 
         # 执行内存流水线迁移
         stats = memory_migrator.migrate_project(project_id, project_name)
@@ -422,28 +640,14 @@ class MavenMigrator:
     def _test_connections(self) -> bool:
         """测试连接"""
         try:
-            # 初始化客户端（如果还没有初始化）
-            if not hasattr(self, 'coding_client'):
-                self.coding_client = CodingClient(
-                    self.config.coding_token,
-                    self.config.coding_team_id,
-                    self.config.maven_repositories,
-                    self.config.pagination,
-                    self.config.performance.max_workers,
-                    requests_per_second=self.config.rate_limit.requests_per_second
-                )
-
-            if not hasattr(self, 'nexus_uploader'):
-                self.nexus_uploader = NexusUploader(self.config)
-
-            # 测试 CODING 连接
-            projects = self.coding_client.get_all_projects()
+            # 测试 CODING 连接（只获取一个项目）
+            projects = self._get_coding_client().get_projects(1, 1)
             if not projects:
                 logger.error("Failed to connect to CODING API")
                 return False
 
             # 测试 Nexus 连接
-            nexus_ok = self.nexus_uploader.test_connection()
+            nexus_ok = self._get_nexus_uploader().test_connection()
             if not nexus_ok:
                 logger.error("Failed to connect to Nexus")
                 return False
@@ -455,28 +659,43 @@ class MavenMigrator:
             logger.error(f"Connection test failed: {e}")
             return False
 
+    @staticmethod
+    def _project_info(project: Any) -> Dict[str, Any]:
+        """项目信息字典"""
+        return {
+            'id': project.id,
+            'name': project.name,
+            'display_name': getattr(project, 'display_name', project.name)
+        }
+
     def _get_project_by_name(self, project_name: str) -> Optional[Dict[str, Any]]:
-        """根据项目名称获取项目信息"""
+        """根据项目名称获取项目信息（只查询该项目，不拉取全部项目列表）"""
         try:
-            if not hasattr(self, 'coding_client'):
-                self.coding_client = CodingClient(
-                    self.config.coding_token,
-                    self.config.coding_team_id,
-                    self.config.maven_repositories,
-                    self.config.pagination,
-                    self.config.performance.max_workers,
-                    requests_per_second=self.config.rate_limit.requests_per_second
-                )
-
-            projects = self.coding_client.get_all_projects()
-            for project in projects:
-                if project.name == project_name:
-                    return {
-                        'id': project.id,
-                        'name': project.name,
-                        'display_name': getattr(project, 'display_name', project.name)
-                    }
-            return None
+            project = self._projects_by_name.get(project_name)
+            if project is None:
+                project = self._get_coding_client().describe_project_by_name(project_name)
+                if project is not None:
+                    self._projects_by_name[project_name] = project
+            return self._project_info(project) if project else None
         except Exception as e:
             logger.error(f"Failed to get project by name {project_name}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _get_projects_by_names(self, project_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        批量根据项目名称获取项目信息
+
+        Args:
+            project_names: 项目名称列表
+
+        Returns:
+            项目名称到项目信息的映射（不包含未找到的项目）
+        """
+        if not project_names:
+            return {}
+
+        # 各项目独立查询，并发进行
+        max_workers = max(1, min(len(project_names), self.config.performance.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            infos = executor.map(self._get_project_by_name, project_names)
+            return {name: info for name, info in zip(project_names, infos) if info}
\ No newline at end of file
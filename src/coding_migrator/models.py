@@ -2,39 +2,44 @@
 数据模型定义
 """
 
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CodingProject(BaseModel):
     """CODING 项目模型"""
-    id: int
-    created_at: Union[int, datetime]
-    updated_at: Union[int, datetime]
-    status: int
-    type: int
-    max_member: int
-    name: str
-    display_name: str
-    description: str
-    icon: str
-    team_owner_id: int
-    user_owner_id: int
-    start_date: int
-    end_date: int
-    team_id: int
-    is_demo: bool
-    archived: bool
-    program_ids: List[int] = []
+    # 项目信息只读，冻结后可作为字典键/集合元素；
+    # 字段别名与 CODING API 的大写字段名一致，可直接校验接口返回的数据
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    id: int = Field(0, alias="Id")
+    created_at: int = Field(0, alias="CreatedAt")  # 毫秒时间戳
+    updated_at: int = Field(0, alias="UpdatedAt")  # 毫秒时间戳
+    status: int = Field(0, alias="Status")
+    type: int = Field(0, alias="Type")
+    max_member: int = Field(0, alias="MaxMember")
+    name: str = Field('', alias="Name")
+    display_name: str = Field('', alias="DisplayName")
+    description: str = Field('', alias="Description")
+    icon: str = Field('', alias="Icon")
+    team_owner_id: int = Field(0, alias="TeamOwnerId")
+    user_owner_id: int = Field(0, alias="UserOwnerId")
+    start_date: int = Field(0, alias="StartDate")
+    end_date: int = Field(0, alias="EndDate")
+    team_id: int = Field(0, alias="TeamId")
+    is_demo: bool = Field(False, alias="IsDemo")
+    archived: bool = Field(False, alias="Archived")
+    program_ids: Tuple[int, ...] = Field((), alias="ProgramIds")
 
 
 class DescribeProjectsResponse(BaseModel):
     """获取项目列表响应模型"""
-    page_number: int = Field(alias="PageNumber")
-    page_size: int = Field(alias="PageSize")
-    total_count: int = Field(alias="TotalCount")
-    project_list: List[CodingProject] = Field(alias="ProjectList")
+    model_config = ConfigDict(populate_by_name=True)
+
+    page_number: int = Field(0, alias="PageNumber")
+    page_size: int = Field(0, alias="PageSize")
+    total_count: int = Field(0, alias="TotalCount")
+    project_list: List[CodingProject] = Field([], alias="ProjectList")
 
 
 class ApiResponse(BaseModel):
@@ -54,6 +59,7 @@ class MavenArtifact(BaseModel):
     sha1: Optional[str] = None
     md5: Optional[str] = None
     download_url: Optional[str] = None
+    maven_path: Optional[str] = None  # Nexus 中的 Maven 路径（发现制品时计算）
     project_name: Optional[str] = None  # 所属的项目名称
     project_id: Optional[int] = None  # 所属的项目ID
 
@@ -87,6 +93,12 @@ class PerformanceConfig(BaseModel):
     max_workers: int = 12
     batch_size: int = 50
     memory_limit_mb: int = 100
+    upload_workers: Optional[int] = None  # 上传线程数，默认与 max_workers 相同
+    upload_buffer_size: int = 1 << 20  # 从磁盘上传文件时每次读取的字节数
+    http_pool_maxsize: int = 32  # 每个主机的 HTTP 连接池大小（不小于并发线程数）
+    http_pool_block: bool = False  # 连接池耗尽时是否阻塞等待空闲连接
+    temp_dir: Optional[str] = None  # 流水线模式大文件转存的临时目录，默认使用系统临时目录
+    http2: bool = False
 
 
 class RateLimitConfig(BaseModel):
@@ -108,6 +120,9 @@ class MigrationConfig(BaseModel):
     download_path: str = "./downloads"
     batch_size: int = 100
     parallel_downloads: int = 5
+    prefer_disk_staging: bool = False  # 标准模式是否先下载到磁盘再上传（否则走内存流水线）
+    prefetch_existing_assets: bool = True  # 上传目录前一次性列出目标仓库的全部资源用于去重
+    skip_checksum_sidecars: bool = True  # 上传目录时跳过 .md5/.sha1 校验和文件（上传时会重新生成，.sha256/.sha512 照常上传）
     maven_filter: MavenFilterConfig = MavenFilterConfig()
     pagination: PaginationConfig = PaginationConfig()
     performance: PerformanceConfig = PerformanceConfig()
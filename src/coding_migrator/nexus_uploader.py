@@ -4,18 +4,225 @@ Nexus 上传器
 
 import os
 import re
+import json
+import time
 import logging
+import urllib3
 import requests
 import hashlib
+import threading
+import tempfile
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+from typing import Callable, Iterable, List, Dict, Any, Optional, Set, Tuple, Union
 from tqdm import tqdm
 from requests.auth import HTTPBasicAuth
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
+from .coding_client import _KeepAliveAdapter, _KEEPALIVE_SOCKET_OPTIONS
 from .models import MigrationConfig, MavenArtifact
 
 
 logger = logging.getLogger(__name__)
 
+# 通过 components 接口合并上传时，同一 GAV 全部文件的总大小上限
+# （multipart 请求体需要整体读入内存，超出时逐个文件流式上传）
+_COMPONENT_UPLOAD_MAX_SIZE = 16 << 20
+
+# 用于识别快照/发布仓库的名称关键字
+_REPOSITORY_KEYWORDS = ('snapshot', 'snap', 'release', 'hosted')
+
+# 仓库列表和资源索引的磁盘缓存目录及有效期（秒）
+_METADATA_CACHE_DIR = Path("target")
+_METADATA_CACHE_TTL = 3600
+
+# 上传读取块大小的对齐粒度
+_UPLOAD_BUFFER_ALIGNMENT = 256 * 1024
+
+# 错误响应体只解码前若干字节写入日志和结果（Nexus 可能返回很大的 HTML 错误页）
+_ERROR_BODY_LIMIT = 512
+
+# 通过 sendfile 上传时的最大尝试次数（连接错误和 502/503/504 时退避重试）
+_SENDFILE_ATTEMPTS = 3
+
+# 校验和附属文件的扩展名
+_CHECKSUM_SUFFIXES = ('.md5', '.sha1', '.sha256', '.sha512')
+# 上传制品时会重新生成的校验和文件扩展名，上传目录时可以跳过本地的同类文件
+_REGENERATED_CHECKSUM_SUFFIXES = ('.md5', '.sha1')
+
+# 主制品的扩展名（同一 GAV 内紧随 POM 上传）
+_PRIMARY_EXTENSIONS = ('.jar', '.war', '.ear')
+
+# Maven 制品文件的 Content-Type 映射
+_CONTENT_TYPE_MAP = {
+    '.jar': 'application/java-archive',
+    '.pom': 'text/xml',
+    '.xml': 'text/xml',
+    '.war': 'application/java-archive',
+    '.ear': 'application/java-archive',
+    '.zip': 'application/zip',
+    '.tar': 'application/x-tar',
+    '.gz': 'application/gzip',
+    '.txt': 'text/plain',
+    '.md5': 'text/plain',
+    '.sha1': 'text/plain',
+    '.asc': 'text/plain',
+    '.json': 'application/json',
+    '.properties': 'text/plain',
+    '.yml': 'text/yaml',
+    '.yaml': 'text/yaml'
+}
+
+
+def _split_maven_path(repository_path: str) -> Optional[Tuple[str, str, str, str]]:
+    """
+    拆分 Maven 仓库路径
+
+    Args:
+        repository_path: 以 / 分隔的 Maven 路径，如 com/example/demo/1.0/demo-1.0.jar
+
+    Returns:
+        (groupId 路径, artifactId, version, 文件名)，路径格式不正确时返回 None
+    """
+    parts = repository_path.rsplit('/', 3)
+    if len(parts) < 4 or not parts[0]:
+        return None
+    return parts[0], parts[1], parts[2], parts[3]
+
+
+@lru_cache(maxsize=4096)
+def _maven_group_path(group: str) -> str:
+    """
+    将 groupId 的点号转换为路径分隔符（同一 groupId 的大量文件共享缓存结果）
+
+    Args:
+        group: groupId 或其路径形式
+
+    Returns:
+        groupId 的路径形式
+    """
+    return group.replace('.', '/')
+
+
+def _file_path_to_maven_path(file_path: str) -> str:
+    """
+    将 CODING 制品的文件路径转换为 Maven 仓库路径（groupId 部分的点号转换为 /）
+
+    Args:
+        file_path: 制品文件路径 group/artifactId/version/filename
+
+    Returns:
+        Maven 路径，段数不足时原样返回
+    """
+    # 只需要末尾三段（artifactId/version/文件名），从右侧逐段切分，不拆分整个路径
+    if file_path.count('/') < 3:
+        return file_path
+    head = file_path.rpartition('/')[0]
+    head = head.rpartition('/')[0]
+    group_path = head.rpartition('/')[0]
+    return f"{_maven_group_path(group_path)}/{file_path[len(group_path) + 1:]}"
+
+
+def _upload_order(repository_path: str) -> int:
+    """
+    同一 GAV 内文件的上传顺序：POM、主制品、带 classifier 的制品及其他文件、校验和文件
+
+    Args:
+        repository_path: 使用 / 分隔的 Maven 仓库路径
+
+    Returns:
+        排序键，越小越先上传
+    """
+    coordinates = _split_maven_path(repository_path)
+    filename = coordinates[3] if coordinates else repository_path.rpartition('/')[2]
+    lower = filename.lower()
+    if lower.endswith(_CHECKSUM_SUFFIXES):
+        return 3
+    if lower.endswith('.pom'):
+        return 0
+    if coordinates and lower.endswith(_PRIMARY_EXTENSIONS) and \
+            filename.rpartition('.')[0] == f"{coordinates[1]}-{coordinates[2]}":
+        return 1
+    return 2
+
+
+def _error_excerpt(body: bytes) -> str:
+    """
+    解码错误响应体的开头部分
+
+    Args:
+        body: 响应体
+
+    Returns:
+        最多 _ERROR_BODY_LIMIT 字节解码后的文本
+    """
+    return body[:_ERROR_BODY_LIMIT].decode('utf-8', 'replace')
+
+
+class _FileUploadBody:
+    """
+    以较大的块读取文件的请求体，避免按 HTTP 连接默认的 8-16 KiB 小块发送
+
+    发送的同时计算 SHA1 和 MD5，文件只需读取一遍。
+    """
+
+    def __init__(self, f, size: int, chunk_size: int):
+        self._file = f
+        self._size = size
+        self._chunk_size = chunk_size
+        self._reset_hashes()
+
+    def _reset_hashes(self) -> None:
+        self.sha1 = hashlib.sha1()
+        self.md5 = hashlib.md5()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return iter(lambda: self.read(self._chunk_size), b'')
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._file.read()
+        else:
+            data = self._file.read(max(size, self._chunk_size))
+        self.sha1.update(data)
+        self.md5.update(data)
+        return data
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        # 连接层重试时会回到起始位置重新发送，校验和随之重新计算
+        position = self._file.seek(offset, whence)
+        if position == 0:
+            self._reset_hashes()
+        return position
+
+    def checksums(self) -> Tuple[str, str]:
+        """已发送内容的 (SHA1, MD5)，在整个文件发送完成后调用"""
+        return self.sha1.hexdigest(), self.md5.hexdigest()
+
+
+class _SendfileBody(_FileUploadBody):
+    """
+    通过 sendfile 发送的文件请求体（仅用于明文 HTTP 的 Nexus）
+
+    逐块读取计算校验和，随即用 sendfile 从页缓存发送刚读过的这一块，
+    文件只读取一遍，发送时省去一次用户态复制。
+    """
+
+    @property
+    def file(self):
+        """底层文件对象"""
+        return self._file
+
 
 class NexusUploader:
     """Nexus 上传器"""
@@ -34,11 +241,151 @@ class NexusUploader:
         self.session = requests.Session()
         self.session.auth = self.auth
 
+        # 上传线程数
+        self.upload_workers = config.performance.upload_workers or config.performance.max_workers
+
+        # 连接池容纳所有上传线程，避免超出连接池的线程每次重新建立 TCP/TLS 连接；
+        # 开启 TCP keepalive，下载较慢时空闲的长连接不会被 NAT/负载均衡静默断开。
+        # 只重试幂等请求（components 的 POST 由调用方退回逐个 PUT）
+        pool_size = max(config.performance.http_pool_maxsize, self.upload_workers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                        allowed_methods=frozenset({'HEAD', 'GET', 'PUT'}),
+                        raise_on_status=False)
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=config.performance.http_pool_block,
+            max_retries=retries
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # 文件 PUT 直接走 urllib3 连接池，省去 requests 每次请求的 hook/重定向/环境变量处理；
+        # 元数据和搜索接口仍使用 session。配置了代理时 PUT 也退回 session，由 requests 处理代理
+        self._put_pool: Optional[urllib3.PoolManager] = None
+        self._put_headers: Dict[str, str] = {}
+        if not requests.utils.get_environ_proxies(self.nexus_url):
+            self._put_pool = urllib3.PoolManager(
+                num_pools=1,
+                maxsize=pool_size,
+                block=config.performance.http_pool_block,
+                retries=retries,
+                socket_options=HTTPConnection.default_socket_options + _KEEPALIVE_SOCKET_OPTIONS,
+                **self._put_pool_tls_options()
+            )
+            self._put_headers = make_headers(basic_auth=f"{config.nexus_username}:{config.nexus_password}",
+                                             keep_alive=True)
+
+        # 明文 HTTP 的 Nexus 从磁盘上传文件时使用 sendfile，每个线程保持一个持久连接（按线程 ID 登记，
+        # 上传完成后统一关闭）
+        self._use_sendfile = (self._put_pool is not None and self.nexus_url.startswith('http://')
+                              and hasattr(os, 'sendfile'))
+        self._sendfile_conns: Dict[int, http.client.HTTPConnection] = {}
+        self._sendfile_conns_lock = threading.Lock()
+
+        # 从磁盘上传时的读取块大小，向上取整到 256 KiB
+        buffer_size = max(config.performance.upload_buffer_size, 1)
+        self.upload_buffer_size = -(-buffer_size // _UPLOAD_BUFFER_ALIGNMENT) * _UPLOAD_BUFFER_ALIGNMENT
+
         # 缓存仓库信息
         self.repositories_cache = None
+        self._classified_repos: Optional[Tuple[List[Dict[str, Any]], Dict[str, str]]] = None
         self.snapshot_repo = config.nexus_snapshot_repository
         self.releases_repo = config.nexus_releases_repository
 
+        # Nexus 不支持 components 上传接口时关闭合并上传
+        self._supports_component_upload = True
+
+        # 预先列出的仓库资源索引: 仓库 -> 全部资源路径
+        self._asset_index: Dict[str, Set[str]] = {}
+        self._asset_index_lock = threading.Lock()
+        # 同一仓库只列出一次，多个项目并发迁移时后来者等待先到者的结果
+        self._asset_prefetch_lock = threading.Lock()
+
+        # 仓库列表和资源索引在多次运行间通过磁盘缓存复用，两者分别存放：
+        # 刷新仓库列表不会重写体积很大的资源索引
+        url_digest = hashlib.sha1(self.nexus_url.encode('utf-8')).hexdigest()[:12]
+        self._repositories_cache_path = _METADATA_CACHE_DIR / f"nexus_repositories_{url_digest}.json"
+        self._asset_cache_path = _METADATA_CACHE_DIR / f"nexus_assets_{url_digest}.json"
+        # 各仓库资源索引的列出时间；从磁盘加载的索引可能已过时，其中查不到的资源仍需向 Nexus 确认
+        self._asset_listed_at: Dict[str, float] = {}
+        self._cached_asset_repos: Set[str] = set()
+        self._asset_index_dirty = False
+        self._load_metadata_cache()
+
+    def _put_pool_tls_options(self) -> Dict[str, Any]:
+        """
+        PUT 连接池的证书校验参数，与 session 请求使用相同的 CA 配置
+
+        session.verify 以及 REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE 环境变量都会生效，
+        与 requests 的 HTTPAdapter 一样区分 CA 文件和 CA 目录。
+        """
+        verify = self.session.merge_environment_settings(self.nexus_url, {}, None, None, None)['verify']
+        if verify is False:
+            return {'cert_reqs': 'CERT_NONE'}
+        ca_bundle = verify if isinstance(verify, str) else requests.certs.where()
+        if os.path.isdir(ca_bundle):
+            return {'cert_reqs': 'CERT_REQUIRED', 'ca_cert_dir': ca_bundle}
+        return {'cert_reqs': 'CERT_REQUIRED', 'ca_certs': ca_bundle}
+
+    def _read_cache_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """读取属于当前 Nexus 的磁盘缓存文件，不存在或无法解析时返回 None"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if data.get('nexus_url') == self.nexus_url else None
+
+    def _write_cache_file(self, path: Path, data: Dict[str, Any]) -> None:
+        """把缓存数据原子地写入磁盘"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=str(path.parent),
+                                             suffix='.tmp', delete=False) as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.warning(f"Failed to save Nexus metadata cache {path}: {e}")
+
+    def _load_metadata_cache(self) -> None:
+        """从磁盘加载未过期的仓库列表和各仓库资源索引"""
+        now = time.time()
+
+        data = self._read_cache_file(self._repositories_cache_path)
+        if data and now - data.get('cached_at', 0) < _METADATA_CACHE_TTL:
+            self.repositories_cache = data.get('repositories')
+
+        data = self._read_cache_file(self._asset_cache_path)
+        for repository, entry in (data or {}).get('assets', {}).items():
+            listed_at = entry.get('listed_at', 0)
+            if now - listed_at < _METADATA_CACHE_TTL:
+                self._asset_index[repository] = set(entry.get('paths', []))
+                self._asset_listed_at[repository] = listed_at
+                self._cached_asset_repos.add(repository)
+
+        if self.repositories_cache is not None or self._asset_index:
+            logger.info(f"Loaded Nexus metadata cache from {_METADATA_CACHE_DIR}")
+
+    def _save_repositories_cache(self) -> None:
+        """把仓库列表写入磁盘缓存"""
+        self._write_cache_file(self._repositories_cache_path, {
+            'nexus_url': self.nexus_url,
+            'cached_at': time.time(),
+            'repositories': self.repositories_cache
+        })
+
+    def _save_asset_index(self) -> None:
+        """资源索引自上次保存后有变化（新列出仓库或上传了新资源）时写入磁盘缓存"""
+        with self._asset_index_lock:
+            if not self._asset_index_dirty:
+                return
+            self._asset_index_dirty = False
+            assets = {repository: {'listed_at': self._asset_listed_at.get(repository, 0), 'paths': sorted(paths)}
+                      for repository, paths in self._asset_index.items()}
+
+        self._write_cache_file(self._asset_cache_path, {'nexus_url': self.nexus_url, 'assets': assets})
+
     def is_snapshot_version(self, version: str) -> bool:
         """
         判断是否为 SNAPSHOT 版本
@@ -90,28 +437,40 @@ class NexusUploader:
             logger.warning(f"No releases repository found, using default: {self.repository}")
             return self.repository
 
-    def _find_snapshot_repository(self) -> Optional[str]:
+    def _classify_repositories(self) -> Dict[str, str]:
         """
-        查找快照仓库
+        按名称关键字对 Maven 仓库分类（一次遍历，结果随仓库列表缓存）
 
         Returns:
-            快照仓库名称或 None
+            关键字（snapshot、snap、release、hosted）到第一个名称包含该关键字的仓库的映射
         """
         repositories = self._get_all_repositories()
+        if self._classified_repos is not None and self._classified_repos[0] is repositories:
+            return self._classified_repos[1]
 
-        # 优先查找名称包含 snapshot 的仓库
+        classified = {}
         for repo in repositories:
-            repo_name = repo.get('name', '').lower()
-            if 'snapshot' in repo_name and repo.get('format') == 'maven2':
-                return repo.get('name')
+            if repo.get('format') != 'maven2':
+                continue
+            repo_name = repo.get('name', '')
+            lowered = repo_name.lower()
+            for keyword in _REPOSITORY_KEYWORDS:
+                if keyword in lowered and keyword not in classified:
+                    classified[keyword] = repo_name
 
-        # 如果没找到，尝试查找包含 snap 的仓库
-        for repo in repositories:
-            repo_name = repo.get('name', '').lower()
-            if 'snap' in repo_name and repo.get('format') == 'maven2':
-                return repo.get('name')
+        self._classified_repos = (repositories, classified)
+        return classified
 
-        return None
+    def _find_snapshot_repository(self) -> Optional[str]:
+        """
+        查找快照仓库
+
+        Returns:
+            快照仓库名称或 None
+        """
+        # 优先选择名称包含 snapshot 的仓库，其次是包含 snap 的仓库
+        classified = self._classify_repositories()
+        return classified.get('snapshot') or classified.get('snap')
 
     def _find_releases_repository(self) -> Optional[str]:
         """
@@ -120,21 +479,9 @@ class NexusUploader:
         Returns:
             发布仓库名称或 None
         """
-        repositories = self._get_all_repositories()
-
-        # 优先查找名称包含 release 的仓库
-        for repo in repositories:
-            repo_name = repo.get('name', '').lower()
-            if 'release' in repo_name and repo.get('format') == 'maven2':
-                return repo.get('name')
-
-        # 如果没找到，尝试查找包含 hosted 的仓库
-        for repo in repositories:
-            repo_name = repo.get('name', '').lower()
-            if 'hosted' in repo_name and repo.get('format') == 'maven2':
-                return repo.get('name')
-
-        return None
+        # 优先选择名称包含 release 的仓库，其次是包含 hosted 的仓库
+        classified = self._classify_repositories()
+        return classified.get('release') or classified.get('hosted')
 
     def _get_all_repositories(self) -> List[Dict[str, Any]]:
         """
@@ -151,6 +498,7 @@ class NexusUploader:
                 if response.status_code == 200:
                     self.repositories_cache = response.json()
                     logger.debug(f"Retrieved {len(self.repositories_cache)} repositories from Nexus")
+                    self._save_repositories_cache()
                 else:
                     logger.error(f"Failed to retrieve repositories: {response.status_code}")
                     self.repositories_cache = []
@@ -161,7 +509,8 @@ class NexusUploader:
 
         return self.repositories_cache
 
-    def _get_content_type(self, file_extension: str) -> str:
+    @staticmethod
+    def _get_content_type(file_extension: str) -> str:
         """
         根据文件扩展名确定正确的 Content-Type
 
@@ -171,31 +520,9 @@ class NexusUploader:
         Returns:
             Content-Type 字符串
         """
-        extension = file_extension.lower()
-
-        # Maven 制品文件的 Content-Type 映射
-        content_type_map = {
-            '.jar': 'application/java-archive',
-            '.pom': 'text/xml',
-            '.xml': 'text/xml',
-            '.war': 'application/java-archive',
-            '.ear': 'application/java-archive',
-            '.zip': 'application/zip',
-            '.tar': 'application/x-tar',
-            '.gz': 'application/gzip',
-            '.txt': 'text/plain',
-            '.md5': 'text/plain',
-            '.sha1': 'text/plain',
-            '.asc': 'text/plain',
-            '.json': 'application/json',
-            '.properties': 'text/plain',
-            '.yml': 'text/yaml',
-            '.yaml': 'text/yaml'
-        }
-
-        return content_type_map.get(extension, 'application/octet-stream')
+        return _CONTENT_TYPE_MAP.get(file_extension.lower(), 'application/octet-stream')
 
-    def upload_file(self, file_path: Path, maven_path: str) -> Dict[str, Any]:
+    def upload_file(self, file_path: Union[str, Path], maven_path: str) -> Dict[str, Any]:
         """
         上传单个文件到 Nexus (使用 PUT 方法)
         同时生成并上传对应的 SHA1 和 MD5 校验和文件
@@ -207,52 +534,106 @@ class NexusUploader:
         Returns:
             上传结果
         """
-        if not file_path.exists():
+        if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if self._use_sendfile:
+                    body = _SendfileBody(f, size, self.upload_buffer_size)
+                    return self._upload_with_checksums(body, body.checksums, maven_path, str(file_path))
+                return self.upload_fileobj(f, size, maven_path, str(file_path))
+        except OSError as e:
+            logger.error(f"Error uploading {file_path}: {e}")
+            return {
+                "success": False,
+                "file_path": str(file_path),
+                "maven_path": maven_path.replace('\\', '/'),
+                "error": str(e)
+            }
+
+    def upload_fileobj(self, f, size: int, maven_path: str, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        从可读的二进制文件对象上传文件，同时生成并上传对应的 SHA1 和 MD5 校验和文件
+
+        Args:
+            f: 位于起始位置、支持 seek 的二进制文件对象
+            size: 文件大小（字节）
+            maven_path: Maven 仓库中的路径
+            source: 内容来源（用于结果和日志），默认为 Maven 路径
+
+        Returns:
+            上传结果
+        """
+        # 按块流式上传，发送的同时计算校验和，内容只读取一遍且不整体读入内存
+        body = _FileUploadBody(f, size, self.upload_buffer_size)
+        return self._upload_with_checksums(body, body.checksums, maven_path, source)
+
+    def upload_bytes(self, file_content: bytes, maven_path: str, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        上传内存中的文件内容到 Nexus (使用 PUT 方法)
+        同时生成并上传对应的 SHA1 和 MD5 校验和文件
+
+        Args:
+            file_content: 文件内容
+            maven_path: Maven 仓库中的路径
+            source: 内容来源（用于结果和日志），默认为 Maven 路径
+
+        Returns:
+            上传结果
+        """
+        def checksums() -> Tuple[str, str]:
+            return hashlib.sha1(file_content).hexdigest(), hashlib.md5(file_content).hexdigest()
+
+        return self._upload_with_checksums(file_content, checksums, maven_path, source)
+
+    def _upload_with_checksums(self, body, checksums: Callable[[], Tuple[str, str]], maven_path: str,
+                               source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        上传文件内容及其 SHA1 和 MD5 校验和文件
+
+        Args:
+            body: 文件内容（bytes 或支持 len() 的可读文件体）
+            checksums: 返回文件内容 (SHA1, MD5) 的函数，在主文件上传成功后调用
+            maven_path: Maven 仓库中的路径
+            source: 内容来源（用于结果和日志），默认为 Maven 路径
+
+        Returns:
+            上传结果
+        """
         # 构建仓库路径
         repository_path = maven_path.replace('\\', '/')
+        source = source or repository_path
 
         try:
-            # 读取文件内容
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
+            # 根据版本号确定目标仓库并构建 PUT URL
+            put_url, target_repository = self._build_put_url(repository_path)
 
             # 从 repository_path 解析 Maven 坐标
-            parts = repository_path.split('/')
-            if len(parts) >= 4:
-                group_id = '.'.join(parts[:-3])
-                artifact_id = parts[-3]
-                version = parts[-2]
-                filename = parts[-1]
-
-                # 根据版本号确定目标仓库
-                target_repository = self.determine_repository(version)
-
-                # 构建 PUT URL: /repository/{repo-name}/{maven-path}
-                put_url = f"{self.nexus_url}/repository/{target_repository}/{repository_path}"
+            coordinates = _split_maven_path(repository_path)
+            if coordinates:
+                group_path, artifact_id, version, filename = coordinates
+                group_id = group_path.replace('/', '.')
             else:
-                # 如果路径格式不正确，使用默认仓库
-                target_repository = self.repository
-                put_url = f"{self.nexus_url}/repository/{target_repository}/{repository_path}"
                 group_id = "unknown"
                 artifact_id = "unknown"
                 version = "unknown"
-                filename = repository_path.split('/')[-1] if repository_path else "unknown"
+                filename = repository_path.rpartition('/')[2] or "unknown"
 
             # 上传主文件
-            main_result = self._upload_single_file(put_url, file_content, filename, target_repository,
-                                                  group_id, artifact_id, version, file_path.suffix)
+            main_result = self._upload_single_file(put_url, body, filename, target_repository,
+                                                  group_id, artifact_id, version, os.path.splitext(filename)[1])
 
             if not main_result["success"]:
                 return main_result
 
+            self._remember_asset(target_repository, repository_path)
+
             # 生成并上传校验和文件
             checksum_results = []
             try:
-                # 计算 SHA1 和 MD5
-                sha1_hash = hashlib.sha1(file_content).hexdigest()
-                md5_hash = hashlib.md5(file_content).hexdigest()
+                sha1_hash, md5_hash = checksums()
 
                 # 上传 SHA1 文件
                 sha1_url = f"{put_url}.sha1"
@@ -276,15 +657,13 @@ class NexusUploader:
                         if not result["success"]:
                             logger.warning(f"Failed to upload {result.get('maven_path', 'unknown')}: {result.get('error', 'unknown')}")
 
-                # 显示更清晰的上传信息
-                logger.info(f"[OK] UPLOAD: {group_id}:{artifact_id}:{version} -> {target_repository}")
-                logger.info(f"   File: {filename}")
-                logger.info(f"   SHA1: {sha1_hash}")
-                logger.info(f"   MD5: {md5_hash}")
+                # 逐个文件的上传信息只在 DEBUG 级别输出，批次汇总见 upload_directory
+                logger.debug("[OK] UPLOAD: %s:%s:%s -> %s (%s, sha1=%s, md5=%s)",
+                             group_id, artifact_id, version, target_repository, filename, sha1_hash, md5_hash)
 
                 return {
                     "success": True,
-                    "file_path": str(file_path),
+                    "file_path": source,
                     "maven_path": repository_path,
                     "repository": target_repository,
                     "status_code": main_result["status_code"],
@@ -298,7 +677,7 @@ class NexusUploader:
                 # 即使校验和文件上传失败，主文件已经上传成功，仍然返回成功
                 return {
                     "success": True,
-                    "file_path": str(file_path),
+                    "file_path": source,
                     "maven_path": repository_path,
                     "repository": target_repository,
                     "status_code": main_result["status_code"],
@@ -308,14 +687,103 @@ class NexusUploader:
                 raise ValueError(f"Invalid Maven path format: {repository_path}")
 
         except Exception as e:
-            logger.error(f"Error uploading {file_path}: {e}")
+            logger.error(f"Error uploading {source}: {e}")
             return {
                 "success": False,
-                "file_path": str(file_path),
+                "file_path": source,
                 "maven_path": repository_path,
                 "error": str(e)
             }
 
+    def _build_put_url(self, repository_path: str) -> Tuple[str, str]:
+        """
+        构建文件的 PUT URL: /repository/{repo-name}/{maven-path}
+
+        Args:
+            repository_path: 使用 / 分隔的 Maven 仓库路径
+
+        Returns:
+            (PUT URL, 目标仓库)；路径格式不正确时使用默认仓库
+        """
+        coordinates = _split_maven_path(repository_path)
+        target_repository = self.determine_repository(coordinates[2]) if coordinates else self.repository
+        return f"{self.nexus_url}/repository/{target_repository}/{repository_path}", target_repository
+
+    def upload_component(self, group_id: str, artifact_id: str, version: str,
+                         assets: List[Tuple[str, bytes]]) -> Dict[str, Any]:
+        """
+        通过 components 接口一次性上传同一 GAV 下的所有文件（multipart POST）
+        校验和文件由 Nexus 自动生成
+
+        Args:
+            group_id: Maven groupId
+            artifact_id: Maven artifactId
+            version: Maven version
+            assets: (文件名, 文件内容) 列表
+
+        Returns:
+            上传结果
+        """
+        target_repository = self.determine_repository(version)
+        prefix = f"{artifact_id}-{version}"
+        data = {
+            'maven2.groupId': group_id,
+            'maven2.artifactId': artifact_id,
+            'maven2.version': version,
+        }
+        files = []
+
+        # 由文件名解析 extension 和 classifier，无法解析的文件不能走 components 接口
+        for index, (filename, file_content) in enumerate(assets, 1):
+            suffix = filename[len(prefix):] if filename.startswith(prefix) else ''
+            if suffix.startswith('-'):
+                classifier, _, extension = suffix[1:].partition('.')
+            elif suffix.startswith('.'):
+                classifier, extension = '', suffix[1:]
+            else:
+                classifier, extension = '', ''
+            if not extension or extension.rsplit('.', 1)[-1] in ('sha1', 'md5'):
+                return {"success": False, "repository": target_repository,
+                        "error": f"Unsupported asset for component upload: {filename}"}
+
+            field_name = f"maven2.asset{index}"
+            files.append((field_name, (filename, file_content,
+                                       self._get_content_type(os.path.splitext(filename)[1]))))
+            data[f"{field_name}.extension"] = extension
+            if classifier:
+                data[f"{field_name}.classifier"] = classifier
+
+        upload_url = f"{self.nexus_url}/service/rest/v1/components"
+        logger.debug("Uploading component %s:%s:%s (%d assets) to repository: %s",
+                     group_id, artifact_id, version, len(assets), target_repository)
+
+        try:
+            response = self.session.post(upload_url, params={'repository': target_repository},
+                                         data=data, files=files)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error uploading component {group_id}:{artifact_id}:{version}: {e}")
+            return {"success": False, "repository": target_repository, "error": str(e)}
+
+        if response.status_code in [200, 201, 204]:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[OK] UPLOAD COMPONENT: %s:%s:%s -> %s (%s)", group_id, artifact_id, version,
+                             target_repository, ', '.join(filename for filename, _ in assets))
+            return {
+                "success": True,
+                "repository": target_repository,
+                "status_code": response.status_code
+            }
+
+        error_text = _error_excerpt(response.content)
+        logger.warning(f"Failed to upload component {group_id}:{artifact_id}:{version}: "
+                       f"{response.status_code} - {error_text}")
+        return {
+            "success": False,
+            "repository": target_repository,
+            "status_code": response.status_code,
+            "error": error_text
+        }
+
     def _upload_single_file(self, put_url: str, file_content: bytes, filename: str,
                            target_repository: str, group_id: str, artifact_id: str,
                            version: str, file_suffix: str) -> Dict[str, Any]:
@@ -324,7 +792,7 @@ class NexusUploader:
 
         Args:
             put_url: 上传URL
-            file_content: 文件内容
+            file_content: 文件内容（bytes 或支持 len() 的可读文件体）
             filename: 文件名
             target_repository: 目标仓库
             group_id: Maven groupId
@@ -343,35 +811,45 @@ class NexusUploader:
             'Content-Length': str(len(file_content))
         }
 
-        logger.debug(f"Uploading {filename} to repository: {target_repository} using PUT method")
-        logger.debug(f"PUT URL: {put_url}")
-        logger.debug(f"File size: {len(file_content)} bytes")
+        logger.debug("Uploading %s (%d bytes) to repository %s: PUT %s",
+                     filename, len(file_content), target_repository, put_url)
 
         # 发送 PUT 请求上传文件
-        response = self.session.put(put_url, data=file_content, headers=headers)
-
-        # 调试：打印更详细的响应信息
-        if response.status_code not in [201, 204]:
-            logger.warning(f"Unexpected status code {response.status_code} for PUT request")
-            logger.warning(f"Response content: {response.text[:500]}")  # 只显示前500个字符
+        if isinstance(file_content, _SendfileBody):
+            headers.update(self._put_headers)
+            status_code, response_body, response_type = self._sendfile_put(put_url, file_content, headers)
+        elif self._put_pool is not None:
+            headers.update(self._put_headers)
+            raw = self._put_pool.urlopen('PUT', put_url, body=file_content, headers=headers)
+            status_code, response_body = raw.status, raw.data
+            response_type = raw.headers.get('Content-Type', '')
+        else:
+            response = self.session.put(put_url, data=file_content, headers=headers)
+            status_code, response_body = response.status_code, response.content
+            response_type = response.headers.get('Content-Type', '')
 
-        if response.status_code in [201, 204]:
+        if status_code in [201, 204]:
             return {
                 "success": True,
                 "maven_path": put_url.split(f"/repository/{target_repository}/", 1)[-1] if f"/repository/{target_repository}/" in put_url else put_url.split("/repository/", 1)[-1],
                 "repository": target_repository,
-                "status_code": response.status_code
+                "status_code": status_code
             }
         else:
-            error_text = response.text
-            try:
-                # 尝试解析JSON错误信息
-                error_json = response.json()
-                error_detail = error_json.get('error_details', error_text)
-            except:
-                error_detail = error_text
+            # 只解码响应体开头部分
+            error_text = _error_excerpt(response_body)
+            logger.warning(f"Unexpected status code {status_code} for PUT request")
+            logger.warning(f"Response content: {error_text}")
 
-            logger.error(f"Failed to upload {filename}: {response.status_code} - {error_detail}")
+            error_detail = error_text
+            if response_type.startswith('application/json'):
+                try:
+                    # 尝试解析JSON错误信息
+                    error_detail = json.loads(response_body).get('error_details', error_text)
+                except (ValueError, AttributeError):
+                    pass
+
+            logger.error(f"Failed to upload {filename}: {status_code} - {error_detail}")
             logger.error(f"Upload URL: {put_url}")
             logger.error(f"Repository: {target_repository}")
             logger.error(f"Maven coordinates: {group_id}:{artifact_id}:{version}")
@@ -381,10 +859,76 @@ class NexusUploader:
                 "success": False,
                 "maven_path": put_url.split(f"/repository/{target_repository}/", 1)[-1] if f"/repository/{target_repository}/" in put_url else put_url.split("/repository/", 1)[-1],
                 "repository": target_repository,
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "error": error_detail
             }
 
+    def _sendfile_put(self, put_url: str, body: _SendfileBody, headers: Dict[str, str]) -> Tuple[int, bytes, str]:
+        """
+        通过当前线程的持久 HTTP 连接发送 PUT 请求，请求体用 sendfile 发送
+
+        Args:
+            put_url: 上传URL（http://）
+            body: 文件请求体
+            headers: 请求头
+
+        Returns:
+            (状态码, 响应体, Content-Type)
+        """
+        parts = urlsplit(put_url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        thread_id = threading.get_ident()
+
+        for attempt in range(1, _SENDFILE_ATTEMPTS + 1):
+            with self._sendfile_conns_lock:
+                conn = self._sendfile_conns.get(thread_id)
+                if conn is None:
+                    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80)
+                    self._sendfile_conns[thread_id] = conn
+
+            try:
+                # 回到起始位置时校验和随之重置
+                body.seek(0)
+                conn.putrequest('PUT', path, skip_accept_encoding=True)
+                for name, value in headers.items():
+                    conn.putheader(name, value)
+                conn.endheaders()
+                # 每读取（并计算校验和）一块，就从页缓存 sendfile 发送同一块
+                offset = 0
+                for chunk in body:
+                    conn.sock.sendfile(body.file, offset, len(chunk))
+                    offset += len(chunk)
+                response = conn.getresponse()
+                response_body = response.read()
+            except (OSError, http.client.HTTPException):
+                # 连接可能已被服务端关闭，丢弃后重建
+                conn.close()
+                with self._sendfile_conns_lock:
+                    self._sendfile_conns.pop(thread_id, None)
+                if attempt == _SENDFILE_ATTEMPTS:
+                    raise
+                time.sleep(0.3 * (2 ** (attempt - 1)))
+                continue
+
+            if response.status in (502, 503, 504) and attempt < _SENDFILE_ATTEMPTS:
+                time.sleep(0.3 * (2 ** (attempt - 1)))
+                continue
+            return response.status, response_body, response.getheader('Content-Type', '')
+
+    def _close_sendfile_connections(self) -> None:
+        """关闭各上传线程的 sendfile 持久连接"""
+        with self._sendfile_conns_lock:
+            conns, self._sendfile_conns = list(self._sendfile_conns.values()), {}
+        for conn in conns:
+            conn.close()
+
+    def close(self) -> None:
+        """关闭上传器持有的全部连接"""
+        self._close_sendfile_connections()
+        if self._put_pool is not None:
+            self._put_pool.clear()
+        self.session.close()
+
     def upload_directory(self, directory_path: Path, batch_size: Optional[int] = None) -> Dict[str, Any]:
         """
         上传目录中的所有 Maven 制品到 Nexus
@@ -401,17 +945,39 @@ class NexusUploader:
 
         batch_size = batch_size or self.config.batch_size
 
-        # 获取所有需要上传的文件
+        # 获取所有需要上传的文件：(本地路径, 以 / 分隔的 Maven 路径)
         files_to_upload = []
-        for file_path in directory_path.rglob('*'):
-            if file_path.is_file():
-                # 转换为 Maven 路径
-                relative_path = file_path.relative_to(directory_path)
-                maven_path = str(relative_path)
-                files_to_upload.append((file_path, maven_path))
+        root = str(directory_path)
+        prefix_len = len(os.path.join(root, ''))
+        stack = [root]
+        skip_checksums = self.config.skip_checksum_sidecars
+        skipped_checksums = 0
+
+        # 使用 os.scandir 遍历，DirEntry 的类型判断来自目录读取结果，无需逐个 stat
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    # 跳过以 . 开头的内部文件（如下载清单）
+                    elif entry.is_file() and not entry.name.startswith('.'):
+                        # SHA1/MD5 校验和文件在上传制品时重新生成，不单独上传；.sha256/.sha512 照常上传
+                        if skip_checksums and entry.name.lower().endswith(_REGENERATED_CHECKSUM_SUFFIXES):
+                            skipped_checksums += 1
+                            continue
+                        files_to_upload.append((entry.path, entry.path[prefix_len:].replace(os.sep, '/')))
+
+        if skipped_checksums:
+            logger.info(f"Skipped {skipped_checksums} checksum sidecar files")
 
         logger.info(f"Found {len(files_to_upload)} files to upload")
 
+        # 一次性列出涉及的目标仓库中已有的资源，之后的存在性检查只查本地索引
+        if self.config.prefetch_existing_assets and files_to_upload:
+            versions = {maven_path.rsplit('/', 2)[-2] for _, maven_path in files_to_upload
+                        if maven_path.count('/') >= 3}
+            self.prefetch_existing_assets({self.determine_repository(version) for version in versions})
+
         # 统计信息
         stats = {
             "total_files": len(files_to_upload),
@@ -422,26 +988,59 @@ class NexusUploader:
             "uploaded_files": []
         }
 
-        # 分批上传
-        for i in range(0, len(files_to_upload), batch_size):
-            batch = files_to_upload[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(files_to_upload) + batch_size - 1)//batch_size}")
-
-            batch_stats = self._upload_batch(batch)
-            stats["uploaded"] += batch_stats["uploaded"]
-            stats["failed"] += batch_stats["failed"]
-            stats["skipped"] += batch_stats["skipped"]
-            stats["failed_files"].extend(batch_stats["failed_files"])
-            stats["uploaded_files"].extend(batch_stats["uploaded_files"])
+        # 按 GAV 目录分组（同一 GAV 下的小文件通过一次 components 请求上传），
+        # 再按文件数把分组切成批次，同一 GAV 的文件不会被拆到两个批次
+        gav_groups: Dict[str, List[tuple]] = {}
+        for file_path, maven_path in files_to_upload:
+            gav_groups.setdefault(maven_path.rsplit('/', 1)[0], []).append((file_path, maven_path))
+
+        # 逐个上传时先传 POM 和主制品，Nexus 在 GAV 首次出现时就能建立完整的元数据，
+        # 校验和文件排在最后
+        for files in gav_groups.values():
+            files.sort(key=lambda item: _upload_order(item[1]))
+
+        batches: List[List[List[tuple]]] = []
+        batch: List[List[tuple]] = []
+        batch_files = 0
+        for files in gav_groups.values():
+            batch.append(files)
+            batch_files += len(files)
+            if batch_files >= batch_size:
+                batches.append(batch)
+                batch, batch_files = [], 0
+        if batch:
+            batches.append(batch)
+
+        # 所有批次共用一个上传线程池
+        with ThreadPoolExecutor(max_workers=max(1, self.upload_workers), thread_name_prefix="nexus-upload") as executor:
+            for i, batch in enumerate(batches, 1):
+                logger.info(f"Processing batch {i}/{len(batches)}")
+
+                batch_stats = self._upload_batch(batch, executor)
+                stats["uploaded"] += batch_stats["uploaded"]
+                stats["failed"] += batch_stats["failed"]
+                stats["skipped"] += batch_stats["skipped"]
+                stats["failed_files"].extend(batch_stats["failed_files"])
+                stats["uploaded_files"].extend(batch_stats["uploaded_files"])
+
+                logger.info(f"Batch {i}/{len(batches)}: {batch_stats['uploaded']} uploaded, "
+                            f"{batch_stats['skipped']} skipped, {batch_stats['failed']} failed")
+
+        # 上传线程已全部结束，关闭它们的 sendfile 连接
+        self._close_sendfile_connections()
+
+        # 本次上传的文件已加入索引，保存后下次运行不会重复上传
+        self._save_asset_index()
 
         return stats
 
-    def _upload_batch(self, file_batch: List[tuple]) -> Dict[str, Any]:
+    def _upload_batch(self, gav_groups: List[List[tuple]], executor: ThreadPoolExecutor) -> Dict[str, Any]:
         """
         批量上传文件
 
         Args:
-            file_batch: 文件批次列表，每个元素为 (file_path, maven_path) 元组
+            gav_groups: 按 GAV 目录分组的文件列表，每个元素为 (file_path, maven_path) 元组
+            executor: 上传线程池
 
         Returns:
             批次上传结果
@@ -454,47 +1053,139 @@ class NexusUploader:
             "uploaded_files": []
         }
 
-        with tqdm(total=len(file_batch), desc="Uploading to Nexus") as pbar:
-            for file_path, maven_path in file_batch:
-                try:
-                    # 检查文件是否已存在于 Nexus
-                    if self._check_file_exists(maven_path):
-                        logger.debug(f"File already exists in Nexus, skipping: {maven_path}")
-                        stats["skipped"] += 1
-                        pbar.update(1)
-                        continue
-
-                    # 上传文件
-                    result = self.upload_file(file_path, maven_path)
-
-                    if result["success"]:
-                        stats["uploaded"] += 1
-                        stats["uploaded_files"].append(result["maven_path"])
-                    else:
-                        stats["failed"] += 1
-                        stats["failed_files"].append({
-                            "file_path": result["file_path"],
-                            "maven_path": result["maven_path"],
-                            "error": result.get("error", f"HTTP {result.get('status_code', 'Unknown')}")
-                        })
-
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {e}")
-                    stats["failed"] += 1
-                    stats["failed_files"].append({
-                        "file_path": str(file_path),
-                        "maven_path": maven_path,
-                        "error": str(e)
-                    })
-
-                pbar.update(1)
+        # 各 GAV 分组相互独立，由多个线程并发上传，统计结果在主线程合并
+        with tqdm(total=sum(len(files) for files in gav_groups), desc="Uploading to Nexus") as pbar:
+            futures = {executor.submit(self._upload_gav_group, files): files for files in gav_groups}
+            for future in as_completed(futures):
+                group_stats = future.result()
+                for key in ("uploaded", "failed", "skipped"):
+                    stats[key] += group_stats[key]
+                stats["failed_files"].extend(group_stats["failed_files"])
+                stats["uploaded_files"].extend(group_stats["uploaded_files"])
+                pbar.update(len(futures[future]))
+
+        return stats
+
+    def _upload_gav_group(self, files: List[tuple]) -> Dict[str, Any]:
+        """
+        上传同一 GAV 目录下的文件
+
+        Args:
+            files: 同一 GAV 目录下的 (file_path, maven_path) 列表
+
+        Returns:
+            该分组的上传结果
+        """
+        stats = {
+            "uploaded": 0,
+            "failed": 0,
+            "skipped": 0,
+            "failed_files": [],
+            "uploaded_files": []
+        }
+
+        pending = []
+        for file_path, maven_path in files:
+            # 检查文件是否已存在于 Nexus
+            if self._check_file_exists(maven_path):
+                logger.debug("File already exists in Nexus, skipping: %s", maven_path)
+                stats["skipped"] += 1
+                continue
+            pending.append((file_path, maven_path))
+
+        if self._upload_component_files(pending, stats):
+            return stats
+
+        for file_path, maven_path in pending:
+            self._upload_batch_file(file_path, maven_path, stats)
 
         return stats
 
+    def _upload_component_files(self, files: List[tuple], stats: Dict[str, Any]) -> bool:
+        """
+        通过 components 接口一次上传同一 GAV 下的多个小文件
+
+        Args:
+            files: 同一 GAV 目录下的 (file_path, maven_path) 列表
+            stats: 批次统计信息（成功时更新）
+
+        Returns:
+            是否上传成功（失败时由调用方逐个文件上传）
+        """
+        if not self._supports_component_upload or len(files) < 2:
+            return False
+
+        coordinates = _split_maven_path(files[0][1].replace('\\', '/'))
+        if not coordinates or self.is_snapshot_version(coordinates[2]):
+            return False
+        group_path, artifact_id, version, _ = coordinates
+
+        try:
+            if sum(os.path.getsize(file_path) for file_path, _ in files) > _COMPONENT_UPLOAD_MAX_SIZE:
+                return False
+            assets = []
+            for file_path, _ in files:
+                with open(file_path, 'rb') as f:
+                    assets.append((os.path.basename(file_path), f.read()))
+        except OSError as e:
+            logger.warning(f"Failed to read files for component upload: {e}")
+            return False
+
+        result = self.upload_component(group_path.replace('/', '.'), artifact_id, version, assets)
+        if not result["success"]:
+            # 接口不存在说明 Nexus 版本不支持，之后不再尝试
+            if result.get("status_code") in (404, 405):
+                logger.info("Nexus does not support component uploads, falling back to per-file uploads")
+                self._supports_component_upload = False
+            return False
+
+        repository = self.determine_repository(version)
+        for _, maven_path in files:
+            repository_path = maven_path.replace('\\', '/')
+            self._remember_asset(repository, repository_path)
+            stats["uploaded_files"].append(repository_path)
+        stats["uploaded"] += len(files)
+        return True
+
+    def _upload_batch_file(self, file_path: str, maven_path: str, stats: Dict[str, Any]) -> None:
+        """
+        上传批次中的单个文件并更新统计
+
+        Args:
+            file_path: 本地文件路径
+            maven_path: Maven 仓库路径
+            stats: 批次统计信息
+        """
+        try:
+            # 上传文件
+            result = self.upload_file(file_path, maven_path)
+
+            if result["success"]:
+                stats["uploaded"] += 1
+                stats["uploaded_files"].append(result["maven_path"])
+            else:
+                stats["failed"] += 1
+                stats["failed_files"].append({
+                    "file_path": result["file_path"],
+                    "maven_path": result["maven_path"],
+                    "error": result.get("error", f"HTTP {result.get('status_code', 'Unknown')}")
+                })
+
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}")
+            stats["failed"] += 1
+            stats["failed_files"].append({
+                "file_path": str(file_path),
+                "maven_path": maven_path,
+                "error": str(e)
+            })
+
     def _check_file_exists(self, maven_path: str) -> bool:
         """
         检查文件是否已存在于 Nexus
 
+        已预先列出目标仓库资源时直接查本地索引，否则对文件的 PUT URL 发送 HEAD 请求。
+
         Args:
             maven_path: Maven 仓库路径
 
@@ -502,36 +1193,109 @@ class NexusUploader:
             文件是否存在
         """
         try:
-            # 从路径中解析出版本号
-            parts = maven_path.split('/')
-            if len(parts) < 2:
+            repository_path = maven_path.replace('\\', '/').lstrip('/')
+            if repository_path.count('/') < 3:
                 return False
 
-            version = parts[-2]
-            target_repository = self.determine_repository(version)
+            put_url, target_repository = self._build_put_url(repository_path)
 
-            # 构建 Nexus 搜索 URL
-            search_url = f"{self.nexus_url}/service/rest/v1/search/assets"
+            index = self._asset_index.get(target_repository)
+            if index is not None:
+                # 本次运行列出的索引是完整的；从磁盘缓存加载的索引可能缺少之后新增的资源，查不到时再发 HEAD 确认
+                if repository_path in index or target_repository not in self._cached_asset_repos:
+                    return repository_path in index
 
-            params = {
-                "repository": target_repository,
-                "name": Path(maven_path).name
-            }
+            # HEAD 只查找单个资源，比搜索接口轻得多，且没有响应体
+            response = self.session.head(put_url, allow_redirects=False)
+            return response.status_code == 200
 
-            response = self.session.get(search_url, params=params)
+        except Exception as e:
+            logger.warning(f"Failed to check if file exists in Nexus: {maven_path} - {e}")
+            return False  # 出错时假设文件不存在，尝试上传
 
-            if response.status_code == 200:
-                assets = response.json().get('items', [])
-                # 检查是否有匹配路径的资源
-                for asset in assets:
-                    if maven_path in asset.get('path', ''):
-                        return True
+    def _remember_asset(self, repository: str, repository_path: str) -> None:
+        """上传成功后把资源路径加入仓库资源索引"""
+        with self._asset_index_lock:
+            index = self._asset_index.get(repository)
+            if index is not None and repository_path not in index:
+                index.add(repository_path)
+                self._asset_index_dirty = True
 
-            return False
+    def _prefetch_existing_assets(self, repository: str) -> Optional[Set[str]]:
+        """
+        分页列出仓库中的全部资源路径
+
+        Args:
+            repository: Nexus 仓库名称
+
+        Returns:
+            资源路径集合，出错时返回 None（退回按 GAV 查询）
+        """
+        search_url = f"{self.nexus_url}/service/rest/v1/search/assets"
+        params = {"repository": repository}
+        paths = set()
+
+        try:
+            while True:
+                response = self.session.get(search_url, params=params)
+                if response.status_code != 200:
+                    logger.warning(f"Failed to list assets in {repository}: {response.status_code}")
+                    return None
+
+                data = response.json()
+                paths.update(asset.get('path', '').lstrip('/') for asset in data.get('items', []))
+
+                token = data.get('continuationToken')
+                if not token:
+                    break
+                params['continuationToken'] = token
 
         except Exception as e:
-            logger.warning(f"Failed to check if file exists in Nexus: {maven_path} - {e}")
-            return False  # 出错时假设文件不存在，尝试上传
+            logger.warning(f"Failed to list assets in {repository}: {e}")
+            return None
+
+        logger.info(f"Found {len(paths)} existing assets in Nexus repository {repository}")
+        return paths
+
+    def prefetch_existing_assets(self, repositories: Iterable[str]) -> None:
+        """
+        一次性列出目标仓库中的全部资源路径并加入资源索引
+
+        已在索引中（本次运行列出过或从磁盘缓存加载）的仓库不再重复请求。
+
+        Args:
+            repositories: Nexus 仓库名称
+        """
+        with self._asset_prefetch_lock:
+            for repository in repositories:
+                if repository in self._asset_index:
+                    continue
+                listed_at = time.time()
+                assets = self._prefetch_existing_assets(repository)
+                if assets is not None:
+                    with self._asset_index_lock:
+                        self._asset_index[repository] = assets
+                        self._asset_listed_at[repository] = listed_at
+                        self._asset_index_dirty = True
+            self._save_asset_index()
+
+    def is_indexed_asset(self, maven_path: str) -> bool:
+        """
+        资源是否已记录在目标仓库的资源索引中（只查本地索引，不发送请求）
+
+        Args:
+            maven_path: Maven 仓库路径（含 classifier 和扩展名）
+
+        Returns:
+            索引中存在该资源时返回 True，仓库未列出时返回 False
+        """
+        repository_path = maven_path.replace('\\', '/').lstrip('/')
+        if repository_path.count('/') < 3:
+            return False
+        _, repository = self._build_put_url(repository_path)
+        with self._asset_index_lock:
+            index = self._asset_index.get(repository)
+            return index is not None and repository_path in index
 
     def test_connection(self) -> bool:
         """
@@ -541,12 +1305,14 @@ class NexusUploader:
             连接是否成功
         """
         try:
-            # 获取仓库列表作为连接测试
+            # 获取仓库列表作为连接测试（总是请求 Nexus，不使用缓存），
+            # 结果放入内存中的仓库列表缓存，之后的仓库检测不再重复请求（连接测试不写磁盘缓存）
             repositories_url = f"{self.nexus_url}/service/rest/v1/repositories"
             response = self.session.get(repositories_url)
 
             if response.status_code == 200:
                 repositories = response.json()
+                self.repositories_cache = repositories
                 repo_exists = any(repo.get('name') == self.repository for repo in repositories)
 
                 if repo_exists:
@@ -559,7 +1325,7 @@ class NexusUploader:
 
                 return True
             else:
-                logger.error(f"Failed to connect to Nexus: {response.status_code} - {response.text}")
+                logger.error(f"Failed to connect to Nexus: {response.status_code} - {_error_excerpt(response.content)}")
                 return False
 
         except Exception as e:
@@ -620,29 +1386,23 @@ class NexusUploader:
             仓库信息字典或 None
         """
         try:
-            repositories_url = f"{self.nexus_url}/service/rest/v1/repositories"
-            response = self.session.get(repositories_url)
-
-            if response.status_code == 200:
-                repositories = response.json()
-
-                # 筛选出 Maven 仓库
-                maven_repos = {}
-                for repo in repositories:
-                    if repo.get('format') == 'maven2':
-                        repo_name = repo.get('name')
-                        maven_repos[repo_name] = {
-                            'name': repo_name,
-                            'format': repo.get('format'),
-                            'type': repo.get('type'),
-                            'url': f"{self.nexus_url}/repository/{repo_name}",
-                            'size': repo.get('assets', {}).get('totalSize', 0),
-                            'count': repo.get('assets', {}).get('assetCount', 0)
-                        }
-
-                return maven_repos if maven_repos else None
+            repositories = self._get_all_repositories()
 
-            return None
+            # 筛选出 Maven 仓库
+            maven_repos = {}
+            for repo in repositories:
+                if repo.get('format') == 'maven2':
+                    repo_name = repo.get('name')
+                    maven_repos[repo_name] = {
+                        'name': repo_name,
+                        'format': repo.get('format'),
+                        'type': repo.get('type'),
+                        'url': f"{self.nexus_url}/repository/{repo_name}",
+                        'size': repo.get('assets', {}).get('totalSize', 0),
+                        'count': repo.get('assets', {}).get('assetCount', 0)
+                    }
+
+            return maven_repos if maven_repos else None
 
         except Exception as e:
             logger.error(f"Error getting repository info: {e}")
@@ -7,26 +7,121 @@ import logging
 import tempfile
 import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import IO, List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue, Empty
+from queue import SimpleQueue
 from dataclasses import dataclass
 from tqdm import tqdm
-import time
 
 from .models import MavenArtifact, MigrationConfig
 from .coding_client import CodingClient
-from .nexus_uploader import NexusUploader
+from .nexus_uploader import NexusUploader, _file_path_to_maven_path
 
 
 logger = logging.getLogger(__name__)
 
+# 并发获取仓库制品列表的最大线程数
+_MAX_LISTING_WORKERS = 8
+
+# 下载内容在内存中缓冲的上限，超出后转存到匿名临时文件（关闭时自动删除）
+_SPOOL_MAX_SIZE = 8 << 20
+
+# 上传队列最多容纳的任务数
+_QUEUE_MAX_TASKS = 100
+
+# 进度条刷新间隔（秒）
+_PROGRESS_INTERVAL = 0.25
+
+# 网络文件系统类型（/proc/mounts 中的 fstype）
+_REMOTE_FS_TYPES = frozenset({'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', 'glusterfs', 'ceph', 'fuse.s3fs'})
+
+
+def _filesystem_type(path: str) -> Optional[str]:
+    """
+    查找路径所在文件系统的类型（仅 Linux，通过 /proc/mounts 最长挂载点匹配）
+
+    Args:
+        path: 目录路径
+
+    Returns:
+        文件系统类型，无法确定时返回 None
+    """
+    path = os.path.realpath(path)
+    best_mount, best_type = '', None
+    try:
+        with open('/proc/mounts', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace('\\040', ' ')
+                if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) \
+                        and len(mount_point) > len(best_mount):
+                    best_mount, best_type = mount_point, fields[2]
+    except OSError:
+        return None
+    return best_type
+
+
+class _UploadQueue:
+    """
+    按任务数和内存占用双重限制容量的上传队列
+
+    接口与 queue.Queue 的 put/get/task_done/join 一致，put 和 task_done 额外传入任务占用的内存字节数。
+    制品大小差异很大时，只按任务数限制要么放入过多大文件占满内存，要么小文件过早阻塞下载。
+
+    容量（任务数和字节数）统计已放入但尚未完成的任务，只在 put 和 task_done 时加锁；
+    任务本身经 C 实现的 SimpleQueue 传递，上传线程取任务时不与下载线程争用同一把锁。
+    """
+
+    def __init__(self, maxsize: int, max_bytes: int):
+        self._items = SimpleQueue()
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._unfinished = 0
+        lock = threading.Lock()
+        self._not_full = threading.Condition(lock)
+        self._all_done = threading.Condition(lock)
+
+    def put(self, item, size: int = 0) -> None:
+        """放入任务，未完成任务数或内存占用超限时阻塞（没有占用时总是接收，避免超大任务永远无法入队）"""
+        with self._not_full:
+            while self._unfinished >= self._maxsize or (self._bytes and self._bytes + size > self._max_bytes):
+                self._not_full.wait()
+            self._bytes += size
+            self._unfinished += 1
+        self._items.put(item)
+
+    def get(self):
+        """取出任务，队列为空时阻塞"""
+        return self._items.get()
+
+    def task_done(self, size: int = 0) -> None:
+        """标记任务完成并释放其内存占用（上传完成后内容才被释放）"""
+        with self._all_done:
+            self._bytes -= size
+            self._unfinished -= 1
+            self._not_full.notify_all()
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+
+    def join(self) -> None:
+        """等待所有已放入的任务完成"""
+        with self._all_done:
+            while self._unfinished:
+                self._all_done.wait()
+
+    def qsize(self) -> int:
+        return self._items.qsize()
+
 
 @dataclass
 class MigrationTask:
     """迁移任务"""
     artifact: MavenArtifact
-    temp_file_path: Optional[Path] = None
+    content: Optional[IO[bytes]] = None
+    size: int = 0
     download_success: bool = False
     upload_success: bool = False
     error_message: Optional[str] = None
@@ -49,16 +144,28 @@ class PipelineMigrator:
             config.maven_repositories,
             config.pagination,
             config.performance.max_workers,
-            requests_per_second=config.rate_limit.requests_per_second
+            requests_per_second=config.rate_limit.requests_per_second,
+            http2=config.performance.http2,
+            pool_maxsize=config.performance.http_pool_maxsize,
+            pool_block=config.performance.http_pool_block
         )
         self.nexus_uploader = NexusUploader(config)
 
         # 性能配置
         self.download_workers = config.performance.max_workers
-        self.upload_workers = min(config.performance.max_workers // 2, 5)  # 上传线程数稍少
+        # 上传线程数：优先使用配置，否则与下载线程数相同（与其他迁移模式一致）
+        self.upload_workers = max(1, config.performance.upload_workers or config.performance.max_workers)
+
+        # 大文件转存目录：未配置时使用系统临时目录；位于网络文件系统时提示
+        self.spool_dir = config.performance.temp_dir
+        spool_dir = self.spool_dir or tempfile.gettempdir()
+        if _filesystem_type(spool_dir) in _REMOTE_FS_TYPES:
+            logger.warning(f"Temporary directory {spool_dir} is on a network filesystem; "
+                           f"set coding.performance.temp_dir to a local disk for better throughput")
 
         # 任务队列
-        self.upload_queue = Queue(maxsize=100)  # 限制队列大小避免内存溢出
+        # 同时按任务数和内存中的字节数（memory_limit_mb）限制，避免内存溢出
+        self.upload_queue = _UploadQueue(_QUEUE_MAX_TASKS, max(1, config.performance.memory_limit_mb) << 20)
         self.completed_tasks = []
         self.failed_tasks = []
 
@@ -70,10 +177,8 @@ class PipelineMigrator:
             'download_failed': 0,
             'upload_failed': 0
         }
-
-        # 控制标志
-        self.stop_event = threading.Event()
-        self.temp_dir = None
+        # 多个下载/上传线程同时更新统计，计数需在锁内完成（dict 的 += 不是原子操作）
+        self.stats_lock = threading.Lock()
 
     def migrate_project(self, project_id: int, project_name: str) -> Dict[str, Any]:
         """
@@ -89,11 +194,8 @@ class PipelineMigrator:
         logger.info(f"Starting pipeline migration for project: {project_name}")
 
         try:
-            # 创建临时目录
-            self.temp_dir = Path(tempfile.mkdtemp(prefix=f"migration_{project_name}_"))
-            logger.info(f"Created temporary directory: {self.temp_dir}")
-
             # 获取所有制品
+            self.coding_client.set_project_name(project_id, project_name)
             all_artifacts = self._get_all_artifacts(project_id)
             self.stats['total_artifacts'] = len(all_artifacts)
 
@@ -115,38 +217,42 @@ class PipelineMigrator:
                 download_futures = []
                 progress_bar = tqdm(total=len(all_artifacts), desc="Pipeline Migration",
                                   unit="files", postfix={"down": 0, "up": 0})
+                # 进度由单独的线程定时刷新，下载线程不再逐个制品争用 tqdm 锁
+                reporter_stop = threading.Event()
+                reporter = threading.Thread(target=self._progress_reporter, args=(progress_bar, reporter_stop),
+                                            name="progress-reporter", daemon=True)
+                reporter.start()
 
-                for artifact in all_artifacts:
-                    future = executor.submit(self._download_and_queue, artifact, progress_bar)
-                    download_futures.append(future)
-
-                # 等待所有下载任务完成
-                for future in as_completed(download_futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        logger.error(f"Download task failed: {e}")
+                try:
+                    for artifact in all_artifacts:
+                        future = executor.submit(self._download_and_queue, artifact)
+                        download_futures.append(future)
 
-                # 等待上传队列清空
-                logger.info("Waiting for upload queue to empty...")
-                while not self.upload_queue.empty():
-                    time.sleep(0.1)
+                    # 等待所有下载任务完成
+                    for future in as_completed(download_futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logger.error(f"Download task failed: {e}")
 
-                # 停止上传工作线程
-                self.stop_event.set()
+                    # 等待队列中的任务全部上传完成
+                    logger.info("Waiting for upload queue to empty...")
+                    self.upload_queue.join()
+                finally:
+                    # 每个上传线程收到一个结束标记后退出（出错时也要发送，否则线程池无法关闭）
+                    for _ in upload_futures:
+                        self.upload_queue.put(None)
 
                 # 等待上传线程完成
                 for future in upload_futures:
                     future.result()
 
+                reporter_stop.set()
+                reporter.join()
                 progress_bar.close()
 
         except Exception as e:
             logger.error(f"Pipeline migration failed: {e}")
-        finally:
-            # 清理临时目录
-            if self.temp_dir and self.temp_dir.exists():
-                self._cleanup_temp_dir()
 
         # 生成最终统计
         self._generate_final_stats()
@@ -170,137 +276,199 @@ class PipelineMigrator:
 
         # 获取制品仓库
         repositories = self.coding_client.get_artifact_repositories(project_id)
-        maven_repos = [repo for repo in repositories if repo.get('Type') == 3]
+        maven_repos = [repo for repo in repositories if repo.get('_normalized_type') == 'maven']
+        if not maven_repos:
+            return all_artifacts
+
+        # 各仓库的制品列表互不依赖，并发获取；每个仓库内部还会并发查询版本文件，
+        # 按总并发数扩大 API 会话的连接池，避免超出的连接用完即弃、反复重新握手
+        listing_workers = min(_MAX_LISTING_WORKERS, len(maven_repos))
+        self.coding_client.ensure_pool_size(listing_workers * self.config.performance.max_workers)
+        with ThreadPoolExecutor(max_workers=listing_workers) as executor:
+            for artifacts in executor.map(
+                    lambda repo: self._get_repository_artifacts(project_id, project_name, repo.get('Name', '')),
+                    maven_repos):
+                all_artifacts.extend(artifacts)
 
-        for repo in maven_repos:
-            repo_name = repo.get('Name', '')
-            logger.info(f"Processing repository: {repo_name}")
+        # 同一文件可能出现在多个仓库中（如快照/发布镜像），目标路径相同，只迁移第一次出现的
+        seen: Dict[str, MavenArtifact] = {}
+        unique_artifacts = [artifact for artifact in all_artifacts
+                            if seen.setdefault(artifact.maven_path, artifact) is artifact]
+        if len(unique_artifacts) < len(all_artifacts):
+            logger.info(f"Skipped {len(all_artifacts) - len(unique_artifacts)} duplicate artifacts "
+                        f"listed in more than one repository")
 
-            try:
-                artifacts = self.coding_client.get_maven_artifacts(
-                    project_id, repo_name, self.config.maven_filter
-                )
-                all_artifacts.extend(artifacts)
-                logger.info(f"Found {len(artifacts)} artifacts in repository: {repo_name}")
+        return unique_artifacts
 
-            except Exception as e:
-                logger.error(f"Failed to get artifacts from repository {repo_name}: {e}")
+    def _get_repository_artifacts(self, project_id: int, project_name: str, repo_name: str) -> List[MavenArtifact]:
+        """
+        获取单个仓库的制品（失败时记录错误并返回空列表，不影响其他仓库）
+
+        Args:
+            project_id: 项目 ID
+            project_name: 项目名称
+            repo_name: 仓库名称
+
+        Returns:
+            制品列表
+        """
+        logger.info(f"Processing repository: {repo_name}")
+
+        try:
+            artifacts = self.coding_client.get_maven_artifacts(
+                project_id, repo_name, self.config.maven_filter
+            )
+        except Exception as e:
+            logger.error(f"Failed to get artifacts from repository {repo_name}: {e}")
+            return []
+
+        # 记录项目、仓库信息和 Maven 路径，下载时用于解析认证，上传时直接使用路径
+        for artifact in artifacts:
+            artifact.project_name = project_name
+            artifact.project_id = project_id
+            if not artifact.repository:
+                artifact.repository = repo_name
+            artifact.maven_path = self._convert_to_maven_path(artifact)
+        logger.info(f"Found {len(artifacts)} artifacts in repository: {repo_name}")
+        return artifacts
+
+    def _increment(self, key: str) -> None:
+        """
+        线程安全地将统计项加一
 
-        return all_artifacts
+        Args:
+            key: 统计项名称
+        """
+        with self.stats_lock:
+            self.stats[key] += 1
 
-    def _download_and_queue(self, artifact: MavenArtifact, progress_bar: tqdm) -> bool:
+    def _download_and_queue(self, artifact: MavenArtifact) -> bool:
         """
         下载制品并加入上传队列
 
         Args:
             artifact: 制品信息
-            progress_bar: 进度条
 
         Returns:
             下载是否成功
         """
-        if self.stop_event.is_set():
-            return False
-
         task = MigrationTask(artifact=artifact)
 
         try:
-            # 创建临时文件路径
-            temp_file_path = self.temp_dir / artifact.file_path.split('/')[-1]
-            temp_file_path.parent.mkdir(parents=True, exist_ok=True)
-            task.temp_file_path = temp_file_path
-
-            # 下载文件
-            success = self.coding_client.download_artifact(
-                artifact.file_path.split('/')[0],  # project_name from file_path
-                "releases" if "releases" in artifact.file_path else "snapshots",
+            # 下载内容直接交给上传线程，不落地到临时目录；
+            # 小文件留在内存中，大文件超出阈值后才转存到匿名临时文件
+            task.content = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE, dir=self.spool_dir)
+            success = self.coding_client.download_artifact_stream(
+                artifact.project_id,
+                artifact.repository,
                 artifact.file_path,
-                str(temp_file_path),
-                getattr(artifact, 'download_url', None)
+                task.content,
+                artifact.download_url
             )
 
-            if success and temp_file_path.exists():
+            if success:
+                task.size = task.content.tell()
+                task.content.seek(0)
                 task.download_success = True
-                self.stats['downloaded'] += 1
+                self._increment('downloaded')
 
-                # 加入上传队列（阻塞等待队列有空间）
-                self.upload_queue.put(task, timeout=30)
+                # 加入上传队列：队列满时一直阻塞，由上传速度对下载形成背压；
+                # 不设超时，避免上传较慢时已下载成功的制品被误记为下载失败
+                self.upload_queue.put(task, self._memory_size(task))
 
                 logger.debug(f"Downloaded and queued: {artifact.file_path}")
 
             else:
                 task.error_message = "Download failed"
-                self.stats['download_failed'] += 1
+                self._increment('download_failed')
                 self.failed_tasks.append(task)
 
         except Exception as e:
             task.error_message = str(e)
-            self.stats['download_failed'] += 1
+            self._increment('download_failed')
             self.failed_tasks.append(task)
             logger.error(f"Failed to download {artifact.file_path}: {e}")
 
-        # 更新进度条
-        progress_bar.set_postfix({"down": self.stats['downloaded'], "up": self.stats['uploaded']})
-        progress_bar.update(1)
+        if not task.download_success and task.content is not None:
+            task.content.close()
+            task.content = None
 
         return task.download_success
 
+    def _progress_reporter(self, progress_bar: tqdm, stop: threading.Event) -> None:
+        """
+        定时按统计信息刷新进度条（已完成的下载数及上传数）
+
+        Args:
+            progress_bar: 进度条
+            stop: 停止事件（停止前再刷新一次）
+        """
+        while True:
+            stopped = stop.wait(_PROGRESS_INTERVAL)
+            with self.stats_lock:
+                finished = self.stats['downloaded'] + self.stats['download_failed']
+                postfix = {"down": self.stats['downloaded'], "up": self.stats['uploaded']}
+            progress_bar.n = finished
+            progress_bar.set_postfix(postfix, refresh=False)
+            progress_bar.refresh()
+            if stopped:
+                break
+
     def _upload_worker(self) -> None:
         """
         上传工作线程
         """
         logger.info("Upload worker started")
 
-        while not self.stop_event.is_set():
-            try:
-                # 从队列获取任务（超时1秒）
-                task = self.upload_queue.get(timeout=1.0)
+        while True:
+            # 阻塞等待任务，收到结束标记 None 时退出
+            task = self.upload_queue.get()
+            if task is None:
+                self.upload_queue.task_done()
+                break
 
-                try:
-                    if task.download_success and task.temp_file_path:
-                        # 上传文件
-                        maven_path = self._convert_to_maven_path(task.artifact)
-                        result = self.nexus_uploader.upload_file(
-                            task.temp_file_path, maven_path
-                        )
-
-                        if result.get('success'):
-                            task.upload_success = True
-                            self.stats['uploaded'] += 1
-                            logger.debug(f"Uploaded: {task.artifact.file_path}")
-                        else:
-                            task.error_message = result.get('error', 'Upload failed')
-                            self.stats['upload_failed'] += 1
-                            self.failed_tasks.append(task)
-
-                except Exception as e:
-                    task.error_message = str(e)
-                    self.stats['upload_failed'] += 1
-                    self.failed_tasks.append(task)
-                    logger.error(f"Failed to upload {task.artifact.file_path}: {e}")
+            try:
+                if task.download_success and task.content is not None:
+                    # 上传文件
+                    maven_path = self._convert_to_maven_path(task.artifact)
+                    result = self.nexus_uploader.upload_fileobj(
+                        task.content, task.size, maven_path, task.artifact.file_path
+                    )
+
+                    if result.get('success'):
+                        task.upload_success = True
+                        self._increment('uploaded')
+                        logger.debug(f"Uploaded: {task.artifact.file_path}")
+                    else:
+                        task.error_message = result.get('error', 'Upload failed')
+                        self._increment('upload_failed')
+                        self.failed_tasks.append(task)
 
-                finally:
-                    # 清理临时文件
-                    if task.temp_file_path and task.temp_file_path.exists():
-                        try:
-                            task.temp_file_path.unlink()
-                        except Exception as e:
-                            logger.warning(f"Failed to delete temp file {task.temp_file_path}: {e}")
+            except Exception as e:
+                task.error_message = str(e)
+                self._increment('upload_failed')
+                self.failed_tasks.append(task)
+                logger.error(f"Failed to upload {task.artifact.file_path}: {e}")
 
-                    # 标记任务完成
-                    self.upload_queue.task_done()
+            finally:
+                # 释放下载内容（转存的临时文件随之删除）
+                if task.content is not None:
+                    task.content.close()
+                    task.content = None
 
-            except Empty:
-                # 队列为空，继续等待
-                continue
-            except Exception as e:
-                logger.error(f"Upload worker error: {e}")
+                # 标记任务完成
+                self.upload_queue.task_done(self._memory_size(task))
 
         logger.info("Upload worker stopped")
 
+    @staticmethod
+    def _memory_size(task: MigrationTask) -> int:
+        """任务内容占用的内存字节数（超过转存阈值的内容位于临时文件中）"""
+        return task.size if task.size <= _SPOOL_MAX_SIZE else 0
+
     def _convert_to_maven_path(self, artifact: MavenArtifact) -> str:
         """
-        转换为 Maven 路径格式
+        转换为 Maven 路径格式（优先使用发现制品时计算好的路径）
 
         Args:
             artifact: 制品信息
@@ -308,29 +476,7 @@ class PipelineMigrator:
         Returns:
             Maven 路径
         """
-        # 从 file_path 解析 Maven 坐标
-        parts = artifact.file_path.split('/')
-        if len(parts) >= 4:
-            group_id = '.'.join(parts[:-3])
-            artifact_id = parts[-3]
-            version = parts[-2]
-            filename = parts[-1]
-
-            return f"{group_id.replace('.', '/')}/{artifact_id}/{version}/{filename}"
-
-        return artifact.file_path
-
-    def _cleanup_temp_dir(self) -> None:
-        """
-        清理临时目录
-        """
-        try:
-            if self.temp_dir and self.temp_dir.exists():
-                import shutil
-                shutil.rmtree(self.temp_dir)
-                logger.info(f"Cleaned up temporary directory: {self.temp_dir}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temporary directory: {e}")
+        return artifact.maven_path or _file_path_to_maven_path(artifact.file_path)
 
     def _generate_final_stats(self) -> None:
         """
@@ -3,19 +3,60 @@
 """
 
 import os
+import re
 import sys
 import time
+import random
 import logging
 import hashlib
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from functools import wraps
 
+try:
+    import blake3
+except ImportError:  # blake3 为可选依赖，仅用于内部完整性校验
+    blake3 = None
+try:
+    import xxhash
+except ImportError:  # xxhash 为可选依赖，仅用于内部完整性校验
+    xxhash = None
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
-def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, exceptions: tuple = (Exception,)):
+# 计算文件哈希时每次读取的块大小（hashlib.file_digest 不可用时）
+_HASH_CHUNK_SIZE = 1 << 20
+
+# URL 校验正则
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# 文件名中不安全的字符
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# 哈希算法名称到构造函数的映射；md5/sha1 等供 Nexus 校验和使用，
+# blake3/xxhash 速度快得多，只适合迁移过程内部的完整性比对
+_HASH_CONSTRUCTORS = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+}
+if blake3 is not None:
+    _HASH_CONSTRUCTORS['blake3'] = lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
+if xxhash is not None:
+    _HASH_CONSTRUCTORS['xxh64'] = xxhash.xxh64
+    _HASH_CONSTRUCTORS['xxh3_128'] = xxhash.xxh3_128
+
+
+def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, exceptions: tuple = (Exception,),
+          jitter: float = 0.5, max_delay: float = 60.0):
     """
     重试装饰器
 
@@ -24,6 +65,8 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, excep
         delay: 初始延迟时间（秒）
         backoff: 退避倍数
         exceptions: 需要重试的异常类型
+        jitter: 随机抖动比例，实际等待时间在 delay * (1 ± jitter) 之间，避免多个线程同时重试
+        max_delay: 单次等待时间上限（秒）
     """
     def decorator(func):
         @wraps(func)
@@ -40,10 +83,11 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, excep
                         logger.error(f"Function {func.__name__} failed after {max_attempts} attempts: {e}")
                         raise
 
+                    sleep_time = current_delay * (1 + jitter * (2 * random.random() - 1))
                     logger.warning(f"Function {func.__name__} failed (attempt {attempts}/{max_attempts}): {e}")
-                    logger.info(f"Retrying in {current_delay} seconds...")
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                    logger.info(f"Retrying in {sleep_time:.2f} seconds...")
+                    time.sleep(sleep_time)
+                    current_delay = min(current_delay * backoff, max_delay)
 
         return wrapper
     return decorator
@@ -96,7 +140,7 @@ def calculate_file_hash(file_path: Union[str, Path], algorithm: str = 'md5') ->
 
     Args:
         file_path: 文件路径
-        algorithm: 哈希算法 (md5, sha1, sha256)
+        algorithm: 哈希算法 (md5, sha1, sha256, sha512；安装可选依赖后支持 blake3, xxh64, xxh3_128)
 
     Returns:
         哈希值
@@ -106,11 +150,28 @@ def calculate_file_hash(file_path: Union[str, Path], algorithm: str = 'md5') ->
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    hash_func = getattr(hashlib, algorithm.lower())()
-
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hash_func.update(chunk)
+    name = algorithm.lower()
+    constructor = _HASH_CONSTRUCTORS.get(name) or getattr(hashlib, name)
+
+    # blake3 直接映射文件，多线程计算
+    if name == 'blake3':
+        hash_func = constructor()
+        hash_func.update_mmap(str(path))
+        return hash_func.hexdigest()
+
+    with open(path, 'rb', buffering=0) as f:
+        # Python 3.11+ 由 hashlib 在 C 层读取文件并计算，期间释放 GIL
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, constructor).hexdigest()
+
+        hash_func = constructor()
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hash_func.update(view[:size])
 
     return hash_func.hexdigest()
 
@@ -168,9 +229,7 @@ def safe_filename(filename: str) -> str:
         安全的文件名
     """
     # 移除或替换不安全的字符
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, '_')
+    filename = _UNSAFE_FILENAME_RE.sub('_', filename)
 
     # 限制长度
     if len(filename) > 255:
@@ -296,17 +355,7 @@ def is_valid_url(url: str) -> bool:
     Returns:
         URL 是否有效
     """
-    import re
-
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-    return url_pattern.match(url) is not None
+    return _URL_RE.match(url) is not None
 
 
 def get_system_info() -> Dict[str, str]:
@@ -0,0 +1,19 @@
+"""测试共用的夹具"""
+
+import pytest
+
+
+@pytest.fixture
+def config():
+    """最小可用的迁移配置"""
+    pytest.importorskip("pydantic")
+    from coding_migrator.models import MigrationConfig
+
+    return MigrationConfig(
+        coding_token="token",
+        coding_team_id=1,
+        nexus_url="http://nexus.example.com",
+        nexus_username="admin",
+        nexus_password="admin123",
+        nexus_repository="maven-releases",
+    )
@@ -0,0 +1,52 @@
+"""MavenDownloader 下载清单测试"""
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("pydantic")
+pytest.importorskip("tqdm")
+
+from coding_migrator.downloader import MavenDownloader
+
+
+@pytest.fixture
+def downloader(tmp_path, config):
+    # 只测试清单逻辑，不需要 CODING 客户端
+    return MavenDownloader(None, config.model_copy(update={"download_path": str(tmp_path)}))
+
+
+def _write(path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_manifest_skips_recorded_file(downloader, tmp_path):
+    local_path = _write(tmp_path / "repo" / "demo-1.0.jar", b"x" * 10)
+    assert not downloader._is_downloaded(local_path)
+
+    downloader._record_download(local_path)
+    assert downloader._is_downloaded(local_path)
+
+    # 清单落盘后新的下载器同样跳过
+    downloader._save_manifest()
+    reloaded = MavenDownloader(None, downloader.config)
+    assert reloaded._is_downloaded(local_path)
+
+
+def test_manifest_refetches_truncated_file(downloader, tmp_path):
+    local_path = _write(tmp_path / "repo" / "demo-1.0.jar", b"x" * 10)
+    downloader._record_download(local_path)
+
+    local_path.write_bytes(b"x" * 4)
+    assert not downloader._is_downloaded(local_path)
+    assert downloader._manifest_key(local_path) not in downloader._manifest
+
+
+def test_manifest_refetches_deleted_file(downloader, tmp_path):
+    local_path = _write(tmp_path / "repo" / "demo-1.0.jar", b"x" * 10)
+    downloader._record_download(local_path)
+
+    local_path.unlink()
+    assert not downloader._is_downloaded(local_path)
+    assert downloader._manifest_key(local_path) not in downloader._manifest
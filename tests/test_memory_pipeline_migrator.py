@@ -0,0 +1,56 @@
+"""MemoryPipelineMigrator 迁移记录测试"""
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("pydantic")
+pytest.importorskip("tqdm")
+
+from coding_migrator.memory_pipeline_migrator import MemoryPipelineMigrator
+
+_KEY = ("com.example", "demo", "1.0", "jar")
+_DEPENDENCY = {"group_id": "com.example", "artifact_id": "demo", "version": "1.0", "packaging": "jar"}
+
+
+@pytest.fixture
+def make_migrator(tmp_path, monkeypatch, config):
+    # 迁移记录写入当前目录下的 target/；只测试记录逻辑，不需要真实客户端
+    monkeypatch.chdir(tmp_path)
+
+    def make():
+        migrator = MemoryPipelineMigrator(config, coding_client=object(), nexus_uploader=object())
+        migrator.record_file = migrator.records_dir / "migration_records_demo_1.json"
+        return migrator
+
+    return make
+
+
+def test_journal_replayed_after_interruption(make_migrator):
+    migrator = make_migrator()
+    migrator._load_migration_records()
+    migrator._append_migration_record(_KEY, _DEPENDENCY)
+    # 模拟中断：只关闭追加日志，不写快照
+    migrator.record_journal.close()
+    assert not migrator.record_file.exists()
+
+    resumed = make_migrator()
+    resumed._load_migration_records()
+    assert _KEY in resumed.uploaded_keys
+    assert resumed.uploaded_dependencies == [_DEPENDENCY]
+    resumed.record_journal.close()
+
+
+def test_snapshot_merges_journal(make_migrator):
+    migrator = make_migrator()
+    migrator._load_migration_records()
+    migrator.uploaded_keys.add(_KEY)
+    migrator.uploaded_dependencies.append(_DEPENDENCY)
+    migrator._append_migration_record(_KEY, _DEPENDENCY)
+    migrator._save_migration_records()
+    assert not migrator._journal_path().exists()
+
+    reloaded = make_migrator()
+    reloaded._load_migration_records()
+    assert _KEY in reloaded.uploaded_keys
+    assert reloaded.uploaded_dependencies == [_DEPENDENCY]
+    reloaded.record_journal.close()
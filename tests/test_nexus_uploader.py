@@ -0,0 +1,37 @@
+"""NexusUploader 冒烟测试"""
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("pydantic")
+
+from coding_migrator import nexus_uploader
+from coding_migrator.nexus_uploader import NexusUploader
+
+
+def test_init_and_save_metadata_cache(tmp_path, monkeypatch, config):
+    monkeypatch.setattr(nexus_uploader, "_METADATA_CACHE_DIR", tmp_path)
+
+    uploader = NexusUploader(config)
+    assert uploader.upload_buffer_size >= 1
+
+    uploader.repositories_cache = [{"name": "maven-releases"}]
+    uploader._save_repositories_cache()
+    assert uploader._repositories_cache_path.exists()
+
+    # 资源索引没有变化时不写磁盘
+    uploader._save_asset_index()
+    assert not uploader._asset_cache_path.exists()
+
+
+def test_asset_index_saved_only_after_change(tmp_path, monkeypatch, config):
+    monkeypatch.setattr(nexus_uploader, "_METADATA_CACHE_DIR", tmp_path)
+
+    uploader = NexusUploader(config)
+    uploader._asset_index["maven-releases"] = set()
+    uploader._remember_asset("maven-releases", "com/example/demo/1.0/demo-1.0.jar")
+    uploader._save_asset_index()
+    assert uploader._asset_cache_path.exists()
+
+    reloaded = NexusUploader(config)
+    assert reloaded.is_indexed_asset("com/example/demo/1.0/demo-1.0.jar")
@@ -0,0 +1,76 @@
+"""PipelineMigrator 上传队列测试"""
+
+import random
+import threading
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("pydantic")
+pytest.importorskip("tqdm")
+
+from coding_migrator.pipeline_migrator import _UploadQueue
+
+_PRODUCERS = 4
+_CONSUMERS = 3
+_ITEMS_PER_PRODUCER = 500
+_MAX_ITEMS = 8
+_MAX_BYTES = 1000
+
+
+def test_upload_queue_stress():
+    upload_queue = _UploadQueue(_MAX_ITEMS, _MAX_BYTES)
+    received = []
+    received_lock = threading.Lock()
+    violations = []
+
+    def produce(producer_id: int) -> None:
+        rng = random.Random(producer_id)
+        for i in range(_ITEMS_PER_PRODUCER):
+            size = rng.randint(0, _MAX_BYTES)
+            upload_queue.put((producer_id, i, size), size)
+
+    def consume() -> None:
+        while True:
+            item = upload_queue.get()
+            if item is None:
+                upload_queue.task_done()
+                return
+            # 已放入但未完成的任务数和字节数都不能超过上限
+            with upload_queue._not_full:
+                if upload_queue._unfinished > _MAX_ITEMS or upload_queue._bytes > _MAX_BYTES:
+                    violations.append((upload_queue._unfinished, upload_queue._bytes))
+            with received_lock:
+                received.append(item[:2])
+            upload_queue.task_done(item[2])
+
+    consumers = [threading.Thread(target=consume) for _ in range(_CONSUMERS)]
+    producers = [threading.Thread(target=produce, args=(i,)) for i in range(_PRODUCERS)]
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+
+    upload_queue.join()
+    for _ in consumers:
+        upload_queue.put(None)
+    for thread in consumers:
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+
+    assert not violations
+    assert sorted(received) == [(p, i) for p in range(_PRODUCERS) for i in range(_ITEMS_PER_PRODUCER)]
+    upload_queue.join()
+    assert upload_queue._bytes == 0
+    assert upload_queue._unfinished == 0
+    assert upload_queue.qsize() == 0
+
+
+def test_upload_queue_admits_oversized_item_when_empty():
+    upload_queue = _UploadQueue(_MAX_ITEMS, _MAX_BYTES)
+    upload_queue.put("big", _MAX_BYTES * 10)
+    assert upload_queue.get() == "big"
+    upload_queue.task_done(_MAX_BYTES * 10)
+    upload_queue.join()
+    assert upload_queue._bytes == 0